@@ -7,6 +7,7 @@ import CatalogArtist from '@server/models/CatalogArtist';
 import DiscoveredArtist from '@server/models/DiscoveredArtist';
 import DownloadedItem from '@server/models/DownloadedItem';
 import WishlistItem from '@server/models/WishlistItem';
+import MusicBrainzLookup from '@server/models/MusicBrainzLookup';
 
 // Export models for use in services
 export {
@@ -16,6 +17,7 @@ export {
   DiscoveredArtist,
   DownloadedItem,
   WishlistItem,
+  MusicBrainzLookup,
 };
 
 // Export mutex utilities for serializing write operations
@@ -35,6 +37,10 @@ export async function initDb(): Promise<void> {
   try {
     await sequelize.authenticate();
 
+    // WAL lets readers work from a consistent snapshot without waiting on the
+    // writer (and vice versa); the mode is persisted in the database file
+    await sequelize.query('PRAGMA journal_mode = WAL');
+
     // Run schema migrations BEFORE sync to add columns that indexes depend on
     await runSchemaMigrations();
 
@@ -78,26 +78,31 @@ if (!enableConsole && !enableFile) {
   enableConsole = true;
 }
 
+// Timestamp, error stacks and interpolation run once per entry at the logger
+// level; transports only apply their own serialization on top
 const logger = createLogger({
   level:       logLevel,
   format:      format.combine(
     format.timestamp(),
     format.errors({ stack: true }),
-    format.splat(),
-    format.json()
+    format.splat()
   ),
   defaultMeta: { service: 'deepcrate' },
   transports:  [],
 });
 
 if (enableFile && fs.existsSync(logDir)) {
+  const fileFormat = format.json();
+
   logger.add(new transports.File({
     filename: path.join(logDir, 'error.log'),
     level:    'error',
+    format:   fileFormat,
   }));
   logger.add(new transports.File({
     filename: path.join(logDir, 'combined.log'),
     level:    logLevel,
+    format:   fileFormat,
   }));
 }
 
@@ -110,21 +115,13 @@ if (enableConsole) {
     consoleWarnLevels: ['warn'],
     format:            format.combine(
       ...(useColors ? [format.colorize()] : []),
-      format.timestamp(),
-      format.errors({ stack: true }),
-      format.splat(),
-      format.printf((info) => {
-        const level = useColors ? info.level : info.level.toUpperCase();
-        const base = `${ info.timestamp } - ${ level } - ${ info.message }`;
-        const rest = { ...info };
-
-        delete (rest as Record<string, unknown>).timestamp;
-        delete (rest as Record<string, unknown>).level;
-        delete (rest as Record<string, unknown>).message;
-
+      format.printf(({
+        timestamp, level, message, ...rest
+      }) => {
+        const label = useColors ? level : level.toUpperCase();
         const meta = Object.keys(rest).length ? ` ${ JSON.stringify(rest) }` : '';
 
-        return `${ base }${ meta }`;
+        return `${ timestamp } - ${ label } - ${ message }${ meta }`;
       })
     ),
   }));
@@ -36,7 +36,7 @@ function redactSecrets(obj: Record<string, unknown>, paths: string[]): void {
  * Sanitize config for API response by replacing secret values with { configured: boolean }
  */
 export function sanitizeConfigForApi(config: Config): Record<string, unknown> {
-  const sanitized = JSON.parse(JSON.stringify(config)) as Record<string, unknown>;
+  const sanitized = structuredClone(config) as Record<string, unknown>;
 
   redactSecrets(sanitized, SECRET_PATHS);
 
@@ -50,7 +50,7 @@ export function sanitizeSectionForApi(
   section: string,
   data: Record<string, unknown>
 ): Record<string, unknown> {
-  const sanitized = JSON.parse(JSON.stringify(data)) as Record<string, unknown>;
+  const sanitized = structuredClone(data);
   const sectionPrefix = `${ section }.`;
   const relativePaths = SECRET_PATHS
     .filter((p) => p.startsWith(sectionPrefix))
@@ -5,7 +5,7 @@ import {
 } from 'vitest';
 import { z } from 'zod';
 
-import { updateConfig, clearConfigCache } from './settings';
+import { updateConfig, clearConfigCache, getConfig } from './settings';
 
 /**
  * Recreate the ListenBrainz schema to test default behavior.
@@ -141,4 +141,17 @@ listenbrainz:
       expect(finalContent).not.toContain('token:');
     });
   });
+
+  describe('cache refresh', () => {
+    it('serves the updated values without reloading the file', async() => {
+      await updateConfig('listenbrainz', { approval_mode: 'auto' });
+
+      fs.unlinkSync(testConfigPath);
+
+      const config = getConfig();
+
+      expect(config.listenbrainz?.approval_mode).toBe('auto');
+      expect(config.listenbrainz?.username).toBe('testuser');
+    });
+  });
 });
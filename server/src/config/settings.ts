@@ -14,6 +14,7 @@ const configMutex = new Mutex();
  * Settings singleton
  */
 let cachedConfig: Config | null = null;
+let cachedEnvOverrides: Array<[string[], unknown]> | null = null;
 
 /**
  * Load config from YAML file with environment variable support.
@@ -40,13 +41,30 @@ export function loadConfig(): Config {
     rawConfig = yaml.load(fileContent) as Record<string, unknown> || {};
   }
 
+  cachedConfig = buildConfig(rawConfig);
+
+  return cachedConfig;
+}
+
+/**
+ * Build the effective config from the raw file contents:
+ * environment overrides, then defaults, then schema validation.
+ */
+function buildConfig(rawConfig: Record<string, unknown>): Config {
   // Apply environment variable overrides
-  rawConfig = applyEnvOverrides(rawConfig);
+  const overriddenConfig = applyEnvOverrides(rawConfig);
 
   // Deep merge with defaults
-  const mergedConfig = deepMerge(DEFAULT_CONFIG, rawConfig);
+  const mergedConfig = deepMerge(DEFAULT_CONFIG, overriddenConfig);
 
   // Validate and parse config
+  return parseConfig(mergedConfig);
+}
+
+/**
+ * Validate a merged config, throwing a readable error listing every issue
+ */
+function parseConfig(mergedConfig: unknown): Config {
   const result = ConfigSchema.safeParse(mergedConfig);
 
   if (!result.success) {
@@ -55,9 +73,7 @@ export function loadConfig(): Config {
     throw new Error(`Invalid configuration:\n${ errors }`);
   }
 
-  cachedConfig = result.data;
-
-  return cachedConfig;
+  return result.data;
 }
 
 /**
@@ -72,6 +88,7 @@ export function getConfig(): Config {
  */
 export function clearConfigCache(): void {
   cachedConfig = null;
+  cachedEnvOverrides = null;
 }
 
 /**
@@ -94,19 +111,15 @@ export async function updateConfig(section: string, updates: Record<string, unkn
 
     rawConfig[section] = nextSection;
 
-    const mergedConfig = deepMerge(DEFAULT_CONFIG, rawConfig);
-    const result = ConfigSchema.safeParse(mergedConfig);
-
-    if (!result.success) {
-      const errors = result.error.issues.map((issue) => `  ${ issue.path.join('.') }: ${ issue.message }`).join('\n');
-
-      throw new Error(`Invalid configuration:\n${ errors }`);
-    }
+    parseConfig(deepMerge(DEFAULT_CONFIG, rawConfig));
 
     const output = yaml.dump(rawConfig, { noRefs: true, lineWidth: 120 });
 
     await fs.promises.writeFile(configPath, output, 'utf-8');
-    clearConfigCache();
+
+    // Seed the cache from the document we just wrote instead of
+    // re-reading and re-parsing the YAML on the next getConfig()
+    cachedConfig = buildConfig(rawConfig);
   });
 }
 
@@ -137,28 +150,55 @@ function resolveConfigPath(): string {
  * - DEEPCRATE_SLSKD__HOST=http://localhost:5030 -> { slskd: { host: 'http://localhost:5030' } }
  */
 function applyEnvOverrides(config: Record<string, unknown>): Record<string, unknown> {
+  for (const [configPath, value] of getEnvOverrides()) {
+    setNestedValue(config, configPath, value);
+  }
+
+  return config;
+}
+
+/**
+ * DEEPCRATE_* overrides as parsed [path, value] pairs. The environment does not
+ * change while the server runs, so it is scanned once and reused by every
+ * config rebuild; clearConfigCache() resets it.
+ */
+function getEnvOverrides(): Array<[string[], unknown]> {
+  if (cachedEnvOverrides) {
+    return cachedEnvOverrides;
+  }
+
   const prefix = 'DEEPCRATE_';
+  const overrides: Array<[string[], unknown]> = [];
 
   for (const [key, value] of Object.entries(process.env)) {
     if (!key.startsWith(prefix) || value === undefined) {
       continue;
     }
 
-    const configPath = key.slice(prefix.length).toLowerCase().split('__');
-
-    setNestedValue(config, configPath, parseEnvValue(value));
+    overrides.push([key.slice(prefix.length).toLowerCase().split('__'), parseEnvValue(value)]);
   }
 
-  return config;
+  cachedEnvOverrides = overrides;
+
+  return overrides;
 }
 
+/**
+ * Boolean spellings recognised in environment overrides
+ */
+const ENV_BOOLEANS: ReadonlyMap<string, boolean> = new Map([
+  ['true', true],
+  ['false', false],
+]);
+
 /**
  * Parse environment variable value to appropriate type
  */
 function parseEnvValue(value: string): unknown {
   // Boolean
-  if (value.toLowerCase() === 'true') return true;
-  if (value.toLowerCase() === 'false') return false;
+  const boolean = ENV_BOOLEANS.get(value.toLowerCase());
+
+  if (boolean !== undefined) return boolean;
 
   // Number
   const num = Number(value);
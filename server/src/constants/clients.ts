@@ -3,6 +3,10 @@ export const SPOTIFY_AUTH_URL = 'https://accounts.spotify.com/api/token';
 export const SPOTIFY_API_URL = 'https://api.spotify.com/v1';
 export const MB_USER_AGENT = 'deepcrate/1.0 (music-discovery)';
 export const MB_BASE_URL = 'https://musicbrainz.org/ws/2';
+export const MB_RATE_LIMIT_MS = 1000;
+export const MB_BULK_LOOKUP_SIZE = 25;
+export const MB_LOOKUP_CONCURRENCY = 4;
+export const MB_LOOKUP_TTL_MS = 7 * 24 * 60 * 60 * 1000;
 export const LB_BASE_URL = 'https://api.listenbrainz.org/1';
 export const LASTFM_BASE_URL = 'https://ws.audioscrobbler.com/2.0/';
 export const COVER_ART_ARCHIVE_BASE_URL = 'https://coverartarchive.org';
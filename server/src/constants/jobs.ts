@@ -5,3 +5,8 @@ export const JOB_NAMES = {
   LIBRARY_SYNC:     'library-sync',
   LIBRARY_ORGANIZE: 'library-organize',
 };
+
+/**
+ * Delay before retrying a failed scheduled job; doubles per consecutive failure
+ */
+export const JOB_RETRY_BASE_MS = 30000;
@@ -5,12 +5,18 @@
 /** Default search timeout in milliseconds */
 export const SEARCH_TIMEOUT_MS = 15000;
 
-/** Interval between search state polling in milliseconds */
+/** First delay between search state polls in milliseconds (grows on each poll) */
+export const SEARCH_POLL_INITIAL_MS = 200;
+
+/** Longest delay between search state polls in milliseconds */
 export const SEARCH_POLL_INTERVAL_MS = 1000;
 
 /** Maximum time to wait for search completion in milliseconds */
 export const SEARCH_MAX_WAIT_MS = 20000;
 
+/** Number of download task searches run at the same time */
+export const SEARCH_CONCURRENCY = 4;
+
 /** Minimum number of files expected for an album download */
 export const MIN_FILES_ALBUM = 3;
 
@@ -21,10 +27,10 @@ export const MIN_FILES_TRACK = 1;
 export const MB_TO_BYTES = 1024 * 1024;
 
 /** Common music file extensions to filter search results */
-export const MUSIC_EXTENSIONS = ['.mp3', '.flac', '.m4a', '.ogg', '.opus', '.wav', '.aac', '.wma', '.alac', '.aiff'];
+export const MUSIC_EXTENSIONS: ReadonlySet<string> = new Set(['.mp3', '.flac', '.m4a', '.ogg', '.opus', '.wav', '.aac', '.wma', '.alac', '.aiff']);
 
 /** Lossless audio format extensions */
-export const LOSSLESS_FORMATS = ['.flac', '.wav', '.alac', '.aiff'];
+export const LOSSLESS_FORMATS: ReadonlySet<string> = new Set(['.flac', '.wav', '.alac', '.aiff']);
 
 /** Bitrate threshold for high quality (320+ kbps) */
 export const HIGH_QUALITY_BITRATE = 320;
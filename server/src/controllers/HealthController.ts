@@ -6,6 +6,15 @@ import logger from '@server/config/logger';
 
 const version = process.env.APP_VERSION ?? 'dev';
 
+// The payload never changes for the lifetime of the process, so it is
+// serialized once instead of on every probe.
+const HEALTH_RESPONSE: Readonly<HealthResponse> = Object.freeze({
+  status:  'ok',
+  version,
+  service: 'deepcrate',
+});
+const HEALTH_BODY = JSON.stringify(HEALTH_RESPONSE);
+
 /**
  * Health check controller
  */
@@ -15,15 +24,9 @@ class HealthController extends BaseController {
    * GET /health
    */
   check = (req: Request, res: Response): Response => {
-    const response: HealthResponse = {
-      status:  'ok',
-      version,
-      service: 'deepcrate',
-    };
-
-    logger.debug('[health]: Fetched health check', response);
+    logger.debug('[health]: Fetched health check', HEALTH_RESPONSE);
 
-    return res.json(response);
+    return res.type('json').send(HEALTH_BODY);
   };
 }
 
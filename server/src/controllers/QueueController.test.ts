@@ -95,6 +95,38 @@ describe('QueueController', () => {
     });
   });
 
+  describe('ETag', () => {
+    it('sets an ETag on small responses and answers revalidation with 304', async() => {
+      mockService.getPending.mockResolvedValue({ items: [makeMockItem()], total: 1 });
+
+      const first = await request(app)
+        .get('/api/v1/queue/pending')
+        .set('Authorization', AUTH_HEADER);
+
+      expect(first.headers.etag).toMatch(/^W\/"/);
+
+      const second = await request(app)
+        .get('/api/v1/queue/pending')
+        .set('Authorization', AUTH_HEADER)
+        .set('If-None-Match', first.headers.etag);
+
+      expect(second.status).toBe(304);
+    });
+
+    it('skips the ETag on large list responses', async() => {
+      const items = Array.from({ length: 500 }, (_, i) => makeMockItem({ mbid: `mbid-${ i }` }));
+
+      mockService.getPending.mockResolvedValue({ items, total: items.length });
+
+      const response = await request(app)
+        .get('/api/v1/queue/pending')
+        .set('Authorization', AUTH_HEADER);
+
+      expect(response.status).toBe(200);
+      expect(response.headers.etag).toBeUndefined();
+    });
+  });
+
   describe('GET /api/v1/queue/pending', () => {
     it('returns paginated items with defaults', async() => {
       const items = [makeMockItem(), makeMockItem({ mbid: 'ffffffff-0000-1111-2222-333333333333', artist: 'Another Artist' })];
@@ -95,19 +95,20 @@ export async function catalogDiscoveryJob(): Promise<void> {
     // Step 1: Sync library artists from Subsonic server
     logger.info('Syncing library artists from Subsonic server...');
     const libraryArtists = await subsonicClient.getArtists();
-    const libraryArtistNames = new Set<string>();
+    const libraryArtistNames = new Set(Object.keys(libraryArtists));
+    const syncedAt = new Date();
 
-    // Save to database for future reference
-    for (const [nameLower, artist] of Object.entries(libraryArtists)) {
-      libraryArtistNames.add(nameLower);
-
-      await withDbWrite(() => CatalogArtist.upsert({
+    // Save to database for future reference, as a single batched write
+    // instead of one upsert (and one mutex round-trip) per artist
+    await withDbWrite(() => CatalogArtist.bulkCreate(
+      Object.entries(libraryArtists).map(([nameLower, artist]) => ({
         navidromeId:  artist.id,
         name:         artist.name,
         nameLower,
-        lastSyncedAt: new Date(),
-      }));
-    }
+        lastSyncedAt: syncedAt,
+      })),
+      { conflictAttributes: ['nameLower'], updateOnDuplicate: ['navidromeId', 'name', 'lastSyncedAt'] }
+    ));
 
     logger.info(`Synced ${ libraryArtistNames.size } library artists`);
 
@@ -127,7 +128,7 @@ export async function catalogDiscoveryJob(): Promise<void> {
 
       processedCount++;
 
-      // Rate limiting (1 request/second to be safe across providers)
+      // Rate limiting (1 request/second for Last.fm and ListenBrainz, which have no client-side limiter)
       if (processedCount > 1) {
         await sleep(1000);
       }
@@ -213,89 +214,88 @@ export async function catalogDiscoveryJob(): Promise<void> {
     const approvalMode = catalogConfig.mode || 'manual';
     let addedCount = 0;
 
-    for (const artist of candidateArtists) {
-      const avgMatchPercent = normalizeCatalogScoreToPercent(artist.score, artist.sourceCount);
-      const weightedScore = calculateWeightedCatalogScoreToPercent(
-        artist.score,
-        artist.sourceCount,
-        artist.providers.size,
-        similarArtistLimit
-      );
-
-      // Check for cancellation
-      if (isJobCancelled(JOB_NAMES.CATALOGD)) {
-        logger.info('Job cancelled while processing candidate artists');
-        throw new Error('Job cancelled');
-      }
-
-      const providerList = Array.from(artist.providers).join('+');
+    const discoveredNames: string[] = [];
+
+    try {
+      for (const artist of candidateArtists) {
+        const avgMatchPercent = normalizeCatalogScoreToPercent(artist.score, artist.sourceCount);
+        const weightedScore = calculateWeightedCatalogScoreToPercent(
+          artist.score,
+          artist.sourceCount,
+          artist.providers.size,
+          similarArtistLimit
+        );
+
+        // Check for cancellation
+        if (isJobCancelled(JOB_NAMES.CATALOGD)) {
+          logger.info('Job cancelled while processing candidate artists');
+          throw new Error('Job cancelled');
+        }
 
-      logger.info(
-        `  Discovering: ${ artist.name } (avg match: ${ avgMatchPercent?.toFixed(2) ?? 'n/a' }%, ` +
-        `weighted: ${ weightedScore?.toFixed(2) ?? 'n/a' }%, sources: ${ artist.sourceCount }, providers: ${ providerList })`
-      );
+        const providerList = Array.from(artist.providers).join('+');
 
-      // Rate limiting for MusicBrainz (1 request/second)
-      await sleep(1000);
+        logger.info(
+          `  Discovering: ${ artist.name } (avg match: ${ avgMatchPercent?.toFixed(2) ?? 'n/a' }%, ` +
+          `weighted: ${ weightedScore?.toFixed(2) ?? 'n/a' }%, sources: ${ artist.sourceCount }, providers: ${ providerList })`
+        );
 
-      // Fetch albums
-      const albums = await mbClient.searchReleaseGroups(artist.name, 'Album', albumsPerArtist);
+        // Fetch albums (MusicBrainzClient enforces the MusicBrainz rate limit)
+        const albums = await mbClient.searchReleaseGroups(artist.name, 'Album', albumsPerArtist);
 
-      for (const album of albums) {
-        const albumMbid = album.id;
+        // One lookup for every album of this artist already pending or rejected
+        const queuedMbids = await queueService.getMbidsByStatus(albums.map((album) => album.id), ['pending', 'rejected']);
 
-        // Check if already in queue or rejected
-        const isPending = await queueService.isPending(albumMbid);
-        const isRejected = await queueService.isRejected(albumMbid);
+        for (const album of albums) {
+          const albumMbid = album.id;
 
-        if (isPending || isRejected) {
-          continue;
-        }
+          // Check if already in queue or rejected
+          if (queuedMbids.has(albumMbid)) {
+            continue;
+          }
 
-        // Get cover art
-        await sleep(500); // Be nice to Cover Art Archive
-        const coverUrl = coverClient.getCoverUrl(albumMbid);
+          // Get cover art (builds the URL, no request is made)
+          const coverUrl = coverClient.getCoverUrl(albumMbid);
 
-        // Extract year
-        let year: number | undefined;
-        const releaseDate = album['first-release-date'] || '';
+          // Extract year
+          let year: number | undefined;
+          const releaseDate = album['first-release-date'] || '';
 
-        if (releaseDate && releaseDate.length >= 4) {
-          const parsedYear = parseInt(releaseDate.substring(0, 4), 10);
+          if (releaseDate && releaseDate.length >= 4) {
+            const parsedYear = parseInt(releaseDate.substring(0, 4), 10);
 
-          if (!isNaN(parsedYear)) {
-            year = parsedYear;
+            if (!isNaN(parsedYear)) {
+              year = parsedYear;
+            }
           }
-        }
 
-        // Add to queue
-        if (approvalMode === 'manual') {
-          await queueService.addPending({
-            artist:    artist.name,
-            album:     album.title,
-            mbid:      albumMbid,
-            type:      'album',
-            score:     weightedScore,
-            source:    'catalog',
-            similarTo: Array.from(artist.similarTo).sort((a, b) => a.localeCompare(b)),
-            coverUrl:  coverUrl || undefined,
-            year,
-          });
+          // Add to queue
+          if (approvalMode === 'manual') {
+            await queueService.addPending({
+              artist:    artist.name,
+              album:     album.title,
+              mbid:      albumMbid,
+              type:      'album',
+              score:     weightedScore,
+              source:    'catalog',
+              similarTo: Array.from(artist.similarTo).sort((a, b) => a.localeCompare(b)),
+              coverUrl:  coverUrl || undefined,
+              year,
+            });
+
+            logger.info(`    ? ${ artist.name } - ${ album.title } (pending approval)`);
+          } else {
+            // Auto mode: TODO - add directly to wishlist
+            logger.info(`    + ${ artist.name } - ${ album.title }`);
+          }
 
-          logger.info(`    ? ${ artist.name } - ${ album.title } (pending approval)`);
-        } else {
-          // Auto mode: TODO - add directly to wishlist
-          logger.info(`    + ${ artist.name } - ${ album.title }`);
+          addedCount++;
         }
 
-        addedCount++;
+        // Mark artist as discovered (written once the loop ends)
+        discoveredNames.push(artist.nameLower);
       }
-
-      // Mark artist as discovered
-      await withDbWrite(() => DiscoveredArtist.create({
-        nameLower:    artist.nameLower,
-        discoveredAt: new Date(),
-      }));
+    } finally {
+      await markDiscovered(discoveredNames);
     }
 
     logger.info(`Catalog discovery completed: added ${ addedCount } albums from ${ candidateArtists.length } artists`);
@@ -305,6 +305,23 @@ export async function catalogDiscoveryJob(): Promise<void> {
   }
 }
 
+/**
+ * Record discovered artists in a single write. Runs even when the loop is
+ * cancelled or fails, so artists already queued are not rediscovered.
+ */
+async function markDiscovered(namesLower: string[]): Promise<void> {
+  if (namesLower.length === 0) {
+    return;
+  }
+
+  const discoveredAt = new Date();
+
+  await withDbWrite(() => DiscoveredArtist.bulkCreate(
+    namesLower.map((nameLower) => ({ nameLower, discoveredAt })),
+    { ignoreDuplicates: true }
+  ));
+}
+
 /**
  * Fetch similar artists from all providers in parallel with timeout.
  * Exported for testing.
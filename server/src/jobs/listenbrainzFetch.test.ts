@@ -0,0 +1,185 @@
+import type { RecordingSummary } from '@server/types/musicbrainz';
+
+import {
+  describe, it, expect, vi, beforeEach
+} from 'vitest';
+
+vi.mock('@server/config/settings', () => ({
+  getConfig: vi.fn().mockReturnValue({
+    mode:         'track',
+    listenbrainz: {
+      username:      'listener',
+      token:         'token',
+      source_type:   'collaborative',
+      approval_mode: 'manual',
+    },
+  }),
+}));
+
+vi.mock('@server/config/db', () => ({ withDbWrite: vi.fn((operation: () => Promise<unknown>) => operation()) }));
+
+vi.mock('@server/models/ProcessedRecording', () => ({ default: { findAll: vi.fn(), bulkCreate: vi.fn() } }));
+
+const mockIsJobCancelled = vi.hoisted(() => vi.fn());
+
+vi.mock('@server/plugins/jobs', () => ({ isJobCancelled: mockIsJobCancelled }));
+
+const mockLbClient = vi.hoisted(() => ({ fetchRecommendations: vi.fn() }));
+
+vi.mock('@server/services/clients/ListenBrainzClient', () => ({
+  ListenBrainzClient: class { constructor() { return mockLbClient; } },
+}));
+
+const mockMbClient = vi.hoisted(() => ({ summarizeRecordings: vi.fn() }));
+
+vi.mock('@server/services/clients/MusicBrainzClient', async(importOriginal) => {
+  const actual = await importOriginal<typeof import('@server/services/clients/MusicBrainzClient')>();
+
+  return { ...actual, MusicBrainzClient: class { constructor() { return mockMbClient; } } };
+});
+
+const mockCoverClient = vi.hoisted(() => ({ getCoverUrl: vi.fn() }));
+
+vi.mock('@server/services/clients/CoverArtArchiveClient', () => ({
+  CoverArtArchiveClient: class { constructor() { return mockCoverClient; } },
+}));
+
+const mockQueueService = vi.hoisted(() => ({
+  addPendingMany:   vi.fn(),
+  getPendingMbids:  vi.fn(),
+  getMbidsByStatus: vi.fn(),
+}));
+
+vi.mock('@server/services/QueueService', () => ({
+  QueueService: class { constructor() { return mockQueueService; } },
+}));
+
+const mockLookupCache = vi.hoisted(() => ({
+  getMany:      vi.fn(),
+  setMany:      vi.fn(),
+  pruneExpired: vi.fn(),
+}));
+
+vi.mock('@server/services/MusicBrainzLookupCache', () => ({
+  MusicBrainzLookupCache: class { constructor() { return mockLookupCache; } },
+}));
+
+import ProcessedRecording from '@server/models/ProcessedRecording';
+import { listenbrainzFetchJob } from './listenbrainzFetch';
+
+const mockProcessedBulkCreate = vi.mocked(ProcessedRecording.bulkCreate);
+
+function summary(mbid: string): RecordingSummary {
+  return {
+    mbid,
+    artist:  `Artist ${ mbid }`,
+    title:   `Track ${ mbid }`,
+    release: { releaseGroupMbid: `rg-${ mbid }`, title: `Album ${ mbid }` },
+  };
+}
+
+function recommend(...mbids: string[]) {
+  mockLbClient.fetchRecommendations.mockResolvedValue(mbids.map((mbid) => ({ recording_mbid: mbid, score: 0.9 })));
+}
+
+function queuedMbids(): string[] {
+  return mockQueueService.addPendingMany.mock.calls[0][0].map((item: { mbid: string }) => item.mbid);
+}
+
+function processedMbids(): string[] {
+  return (mockProcessedBulkCreate.mock.calls[0][0] as { mbid: string }[]).map((row) => row.mbid);
+}
+
+describe('listenbrainzFetchJob', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    mockIsJobCancelled.mockReturnValue(false);
+    vi.mocked(ProcessedRecording.findAll).mockResolvedValue([]);
+    mockProcessedBulkCreate.mockResolvedValue([]);
+    mockQueueService.addPendingMany.mockResolvedValue(0);
+    mockQueueService.getPendingMbids.mockResolvedValue(new Set());
+    mockLookupCache.getMany.mockResolvedValue(new Map());
+    mockLookupCache.setMany.mockResolvedValue(undefined);
+    mockLookupCache.pruneExpired.mockResolvedValue(0);
+    mockCoverClient.getCoverUrl.mockImplementation((mbid: string) => `cover/${ mbid }`);
+  });
+
+  it('resolves only cache misses and flushes the batch once', async() => {
+    recommend('rec-1', 'rec-2', 'rec-3');
+    mockLookupCache.getMany.mockResolvedValue(new Map([['rec-2', summary('rec-2')]]));
+    mockMbClient.summarizeRecordings.mockResolvedValue(new Map([
+      ['rec-1', summary('rec-1')],
+      ['rec-3', summary('rec-3')],
+    ]));
+
+    await listenbrainzFetchJob();
+
+    expect(mockMbClient.summarizeRecordings).toHaveBeenCalledWith(['rec-1', 'rec-3']);
+    expect(mockLookupCache.setMany).toHaveBeenCalledTimes(1);
+    expect(mockQueueService.addPendingMany).toHaveBeenCalledTimes(1);
+    expect(queuedMbids()).toEqual(['rec-1', 'rec-2', 'rec-3']);
+    expect(mockProcessedBulkCreate).toHaveBeenCalledTimes(1);
+    expect(processedMbids()).toEqual(['rec-1', 'rec-2', 'rec-3']);
+  });
+
+  it('leaves recordings that did not resolve unprocessed', async() => {
+    recommend('rec-1', 'rec-2', 'rec-3');
+    mockMbClient.summarizeRecordings.mockResolvedValue(new Map([
+      ['rec-1', summary('rec-1')],
+      ['rec-2', null],
+      ['rec-3', summary('rec-3')],
+    ]));
+
+    await listenbrainzFetchJob();
+
+    expect(mockQueueService.addPendingMany).toHaveBeenCalledTimes(1);
+    expect(queuedMbids()).toEqual(['rec-1', 'rec-3']);
+    expect(mockProcessedBulkCreate).toHaveBeenCalledTimes(1);
+    expect(processedMbids()).toEqual(['rec-1', 'rec-3']);
+  });
+
+  it('keeps going after one recording throws and flushes the rest once', async() => {
+    recommend('rec-1', 'rec-2', 'rec-3');
+    mockMbClient.summarizeRecordings.mockResolvedValue(new Map([
+      ['rec-1', summary('rec-1')],
+      ['rec-2', summary('rec-2')],
+      ['rec-3', summary('rec-3')],
+    ]));
+    mockCoverClient.getCoverUrl.mockImplementation((mbid: string) => {
+      if (mbid === 'rg-rec-2') {
+        throw new Error('boom');
+      }
+
+      return `cover/${ mbid }`;
+    });
+
+    await listenbrainzFetchJob();
+
+    expect(mockQueueService.addPendingMany).toHaveBeenCalledTimes(1);
+    expect(queuedMbids()).toEqual(['rec-1', 'rec-3']);
+    expect(mockProcessedBulkCreate).toHaveBeenCalledTimes(1);
+    expect(processedMbids()).toEqual(['rec-1', 'rec-3']);
+  });
+
+  it('flushes what was handled once when the job is cancelled mid-batch', async() => {
+    recommend('rec-1', 'rec-2', 'rec-3');
+    mockMbClient.summarizeRecordings.mockResolvedValue(new Map([
+      ['rec-1', summary('rec-1')],
+      ['rec-2', summary('rec-2')],
+      ['rec-3', summary('rec-3')],
+    ]));
+    // Cancelled once the first recording has been handled
+    mockCoverClient.getCoverUrl.mockImplementation((mbid: string) => {
+      mockIsJobCancelled.mockReturnValue(true);
+
+      return `cover/${ mbid }`;
+    });
+
+    await expect(listenbrainzFetchJob()).rejects.toThrow('Job cancelled');
+
+    expect(mockQueueService.addPendingMany).toHaveBeenCalledTimes(1);
+    expect(queuedMbids()).toEqual(['rec-1']);
+    expect(mockProcessedBulkCreate).toHaveBeenCalledTimes(1);
+    expect(processedMbids()).toEqual(['rec-1']);
+  });
+});
@@ -1,14 +1,19 @@
 import type { ListenBrainzRecommendation } from '@server/types/listenbrainz';
 import type { ListenBrainzSettings } from '@server/config/schemas';
+import type { AlbumInfo, RecordingInfo, RecordingSummary } from '@server/types/musicbrainz';
+
+import { Op } from '@sequelize/core';
 
 import logger from '@server/config/logger';
 import { JOB_NAMES } from '@server/constants/jobs';
+import { MB_BULK_LOOKUP_SIZE } from '@server/constants/clients';
 import { getConfig } from '@server/config/settings';
 import { withDbWrite } from '@server/config/db';
 import { ListenBrainzClient } from '@server/services/clients/ListenBrainzClient';
-import { MusicBrainzClient } from '@server/services/clients/MusicBrainzClient';
+import { MusicBrainzClient, toAlbumInfo, toRecordingInfo } from '@server/services/clients/MusicBrainzClient';
 import { CoverArtArchiveClient } from '@server/services/clients/CoverArtArchiveClient';
-import { QueueService } from '@server/services/QueueService';
+import { QueueService, PendingQueueItem } from '@server/services/QueueService';
+import { MusicBrainzLookupCache } from '@server/services/MusicBrainzLookupCache';
 import ProcessedRecording from '@server/models/ProcessedRecording';
 import { isJobCancelled } from '@server/plugins/jobs';
 
@@ -19,9 +24,27 @@ interface ProcessingContext {
   mbClient:     MusicBrainzClient;
   coverClient:  CoverArtArchiveClient;
   queueService: QueueService;
+  lookupCache:  MusicBrainzLookupCache;
   approvalMode: string;
 }
 
+/**
+ * Recommendation that passed the score filter and has not been processed yet
+ */
+interface Candidate {
+  mbid:         string;
+  scorePercent: number | undefined;
+}
+
+/**
+ * Queue items and processed MBIDs collected while handling a batch,
+ * written once when the batch is done
+ */
+interface BatchWrites {
+  pending:   PendingQueueItem[];
+  processed: string[];
+}
+
 /**
  * Result from processing a single recording
  */
@@ -72,6 +95,7 @@ export async function listenbrainzFetchJob(): Promise<void> {
   const mbClient = new MusicBrainzClient();
   const coverClient = new CoverArtArchiveClient();
   const queueService = new QueueService();
+  const lookupCache = new MusicBrainzLookupCache();
 
   // Check for cancellation before starting
   if (isJobCancelled(JOB_NAMES.LB_FETCH)) {
@@ -96,11 +120,18 @@ export async function listenbrainzFetchJob(): Promise<void> {
 
   logger.info(`Got ${ recs.length } track recommendations`);
 
+  const pruned = await lookupCache.pruneExpired();
+
+  if (pruned > 0) {
+    logger.debug(`Pruned ${ pruned } expired MusicBrainz lookup(s)`);
+  }
+
   // Process recordings through shared logic
   const addedCount = await processRecordings(recs, mode, minScorePercent, {
     mbClient,
     coverClient,
     queueService,
+    lookupCache,
     approvalMode,
   });
 
@@ -184,7 +215,10 @@ function extractPlaylistMbid(identifier: string): string | null {
 }
 
 /**
- * Process all recommendations, delegating to mode-specific handlers
+ * Process all recommendations, delegating to mode-specific handlers.
+ * Recordings are resolved against MusicBrainz in batches of
+ * MB_BULK_LOOKUP_SIZE so each batch costs one rate-limited request
+ * instead of one per recording.
  */
 async function processRecordings(
   recs: ListenBrainzRecommendation[],
@@ -192,55 +226,255 @@ async function processRecordings(
   minScorePercent: number,
   ctx: ProcessingContext
 ): Promise<number> {
+  const candidates = await selectCandidates(recs, mode, minScorePercent, ctx);
+
+  logger.info(`${ candidates.length } recommendations left to resolve after filtering`);
+
   let addedCount = 0;
   const seenAlbums = new Set<string>();
 
-  for (const rec of recs) {
+  for (let start = 0; start < candidates.length; start += MB_BULK_LOOKUP_SIZE) {
     if (isJobCancelled(JOB_NAMES.LB_FETCH)) {
       logger.info('Job cancelled during processing');
       throw new Error('Job cancelled');
     }
 
+    const batch = candidates.slice(start, start + MB_BULK_LOOKUP_SIZE);
+
+    addedCount += await processBatch(batch, mode, seenAlbums, ctx);
+  }
+
+  return addedCount;
+}
+
+/**
+ * Filter recommendations before any MusicBrainz request: drop low scores,
+ * repeats and recordings already processed (one query for all of them). In
+ * album mode, recordings whose album is known from an earlier run's lookup
+ * cache are also dropped when that album is already processed or queued.
+ */
+async function selectCandidates(
+  recs: ListenBrainzRecommendation[],
+  mode: string,
+  minScorePercent: number,
+  ctx: ProcessingContext
+): Promise<Candidate[]> {
+  const scored = new Map<string, number | undefined>();
+
+  for (const rec of recs) {
     const mbid = rec.recording_mbid;
     const scorePercent = normalizeToPercent(rec.score);
 
-    if (scorePercent !== undefined && scorePercent < minScorePercent) {
+    if (!mbid || scored.has(mbid) || (scorePercent !== undefined && scorePercent < minScorePercent)) {
       continue;
     }
 
-    try {
-      const alreadyProcessed = await ProcessedRecording.findOne({ where: { mbid, source: 'listenbrainz' } });
+    scored.set(mbid, scorePercent);
+  }
 
-      if (alreadyProcessed) {
-        continue;
-      }
+  const processed = await getProcessedMbids([...scored.keys()]);
+  let candidates: Candidate[] = [];
 
-      // Rate limit: MusicBrainz requests (1 request/second)
-      await sleep(1000);
+  for (const [mbid, scorePercent] of scored) {
+    if (!processed.has(mbid)) {
+      candidates.push({ mbid, scorePercent });
+    }
+  }
+
+  if (mode === 'track' || candidates.length === 0) {
+    return candidates;
+  }
+
+  const cachedSummaries = await ctx.lookupCache.getMany<RecordingSummary>('summary', candidates.map((candidate) => candidate.mbid));
+  const cachedAlbums = toAlbums(cachedSummaries);
+  const skipAlbums = await getSkippedAlbumMbids(cachedAlbums, ctx);
+
+  candidates = candidates.filter((candidate) => {
+    const albumMbid = cachedAlbums.get(candidate.mbid)?.mbid;
+
+    return !albumMbid || !skipAlbums.has(albumMbid);
+  });
+
+  return candidates;
+}
+
+/**
+ * Resolve a batch of candidates with one bulk MusicBrainz lookup (cached
+ * recordings are served from the lookup cache), then hand each resolved
+ * recording to the mode-specific handler
+ */
+async function processBatch(
+  batch: Candidate[],
+  mode: string,
+  seenAlbums: Set<string>,
+  ctx: ProcessingContext
+): Promise<number> {
+  const mbids = batch.map((candidate) => candidate.mbid);
 
-      const result = mode === 'track' ? await processTrackMode(mbid, scorePercent, ctx) : await processAlbumMode(mbid, scorePercent, seenAlbums, ctx);
+  if (mode === 'track') {
+    const summaries = await resolveSummaries(mbids, ctx);
+    const pendingMbids = ctx.approvalMode === 'manual' ? await ctx.queueService.getPendingMbids(mbids) : new Set<string>();
+
+    return processEach(batch, ctx, (candidate, writes) => processTrackMode(
+      candidate.mbid, toTrack(summaries.get(candidate.mbid)), candidate.scorePercent, pendingMbids, writes, ctx
+    ));
+  }
+
+  const albums = toAlbums(await resolveSummaries(mbids, ctx));
+  const skipAlbums = await getSkippedAlbumMbids(albums, ctx);
+
+  return processEach(batch, ctx, (candidate, writes) => processAlbumMode(
+    albums.get(candidate.mbid) ?? null, candidate.scorePercent, seenAlbums, skipAlbums, writes, ctx
+  ));
+}
+
+/**
+ * Albums in a resolved batch that must not be queued again: already processed,
+ * rejected or pending. Built with two set queries for the whole batch so each
+ * recording needs a single membership test.
+ */
+async function getSkippedAlbumMbids(
+  albums: Map<string, AlbumInfo | null>,
+  ctx: ProcessingContext
+): Promise<Set<string>> {
+  const albumMbids = new Set<string>();
+
+  for (const album of albums.values()) {
+    if (album) {
+      albumMbids.add(album.mbid);
+    }
+  }
+
+  const [processed, queued] = await Promise.all([
+    getProcessedMbids([...albumMbids]),
+    ctx.queueService.getMbidsByStatus([...albumMbids], ['pending', 'rejected']),
+  ]);
+
+  for (const mbid of queued) {
+    processed.add(mbid);
+  }
 
-      if (result.added) {
-        addedCount++;
+  return processed;
+}
+
+/**
+ * Serve recording summaries from the lookup cache and resolve only the misses
+ * against MusicBrainz (the client applies the rate limit), so batches that are
+ * fully cached make no requests and never wait. Summaries serve both modes,
+ * so a recording seen in track mode is not fetched again for album mode.
+ */
+async function resolveSummaries(
+  mbids: string[],
+  ctx: ProcessingContext
+): Promise<Map<string, RecordingSummary | null>> {
+  const results: Map<string, RecordingSummary | null> = await ctx.lookupCache.getMany<RecordingSummary>('summary', mbids);
+  const misses = mbids.filter((mbid) => !results.has(mbid));
+
+  if (misses.length === 0) {
+    return results;
+  }
+
+  const fetched = await ctx.mbClient.summarizeRecordings(misses);
+
+  await ctx.lookupCache.setMany('summary', fetched);
+
+  for (const [mbid, summary] of fetched) {
+    results.set(mbid, summary);
+  }
+
+  return results;
+}
+
+/**
+ * Track-mode view of a resolved summary
+ */
+function toTrack(summary: RecordingSummary | null | undefined): RecordingInfo | null {
+  return summary ? toRecordingInfo(summary) : null;
+}
+
+/**
+ * Album-mode view of resolved summaries, keyed by recording MBID
+ */
+function toAlbums(summaries: Map<string, RecordingSummary | null>): Map<string, AlbumInfo | null> {
+  const albums = new Map<string, AlbumInfo | null>();
+
+  for (const [mbid, summary] of summaries) {
+    albums.set(mbid, summary ? toAlbumInfo(summary) : null);
+  }
+
+  return albums;
+}
+
+/**
+ * Run a handler over each candidate in order, returning how many were added
+ */
+async function processEach(
+  batch: Candidate[],
+  ctx: ProcessingContext,
+  handler: (candidate: Candidate, writes: BatchWrites) => Promise<ProcessingResult>
+): Promise<number> {
+  let addedCount = 0;
+  const writes: BatchWrites = { pending: [], processed: [] };
+
+  try {
+    for (const candidate of batch) {
+      if (isJobCancelled(JOB_NAMES.LB_FETCH)) {
+        logger.info('Job cancelled during processing');
+        throw new Error('Job cancelled');
+      }
+
+      try {
+        const result = await handler(candidate, writes);
+
+        if (result.added) {
+          addedCount++;
+        }
+      } catch(error) {
+        logger.error(`Error processing recommendation ${ candidate.mbid }:`, { error });
       }
-    } catch(error) {
-      logger.error(`Error processing recommendation ${ mbid }:`, { error });
     }
+  } finally {
+    await flushWrites(writes, ctx);
   }
 
   return addedCount;
 }
 
+/**
+ * Write a batch's queue items and processed MBIDs in one go. Pending items are
+ * written first so a failed queue write leaves the MBIDs unprocessed and
+ * they are retried on the next run.
+ */
+async function flushWrites(writes: BatchWrites, ctx: ProcessingContext): Promise<void> {
+  await ctx.queueService.addPendingMany(writes.pending);
+
+  if (writes.processed.length === 0) {
+    return;
+  }
+
+  const processedAt = new Date();
+
+  await withDbWrite(() => ProcessedRecording.bulkCreate(
+    writes.processed.map((mbid) => ({
+      mbid,
+      source: 'listenbrainz',
+      processedAt,
+    })),
+    { ignoreDuplicates: true }
+  ));
+}
+
 /**
  * Process a recording in track mode - adds tracks directly to queue
  */
 async function processTrackMode(
   mbid: string,
+  trackInfo: RecordingInfo | null,
   scorePercent: number | undefined,
+  pendingMbids: Set<string>,
+  writes: BatchWrites,
   ctx: ProcessingContext
 ): Promise<ProcessingResult> {
-  const trackInfo = await ctx.mbClient.resolveRecording(mbid);
-
   if (!trackInfo) {
     return { added: false };
   }
@@ -248,13 +482,11 @@ async function processTrackMode(
   const coverUrl = trackInfo.releaseGroupMbid ? ctx.coverClient.getCoverUrl(trackInfo.releaseGroupMbid) : null;
 
   if (ctx.approvalMode === 'manual') {
-    const isPending = await ctx.queueService.isPending(mbid);
-
-    if (isPending) {
+    if (pendingMbids.has(mbid)) {
       return { added: false };
     }
 
-    await ctx.queueService.addPending({
+    writes.pending.push({
       artist:   trackInfo.artist,
       title:    trackInfo.title,
       mbid:     trackInfo.mbid,
@@ -271,11 +503,7 @@ async function processTrackMode(
     logger.info(`  + ${ trackInfo.artist } - ${ trackInfo.title }`);
   }
 
-  await withDbWrite(() => ProcessedRecording.create({
-    mbid,
-    source:      'listenbrainz',
-    processedAt: new Date(),
-  }));
+  writes.processed.push(mbid);
 
   return { added: true };
 }
@@ -284,49 +512,30 @@ async function processTrackMode(
  * Process a recording in album mode - resolves to parent album for de-duplication
  */
 async function processAlbumMode(
-  mbid: string,
+  albumInfo: AlbumInfo | null,
   scorePercent: number | undefined,
   seenAlbums: Set<string>,
+  skipAlbums: Set<string>,
+  writes: BatchWrites,
   ctx: ProcessingContext
 ): Promise<ProcessingResult> {
-  const albumInfo = await ctx.mbClient.resolveRecordingToAlbum(mbid);
-
   if (!albumInfo) {
     return { added: false };
   }
 
   const albumMbid = albumInfo.mbid;
 
-  // Skip if we've already seen this album in this run
-  if (seenAlbums.has(albumMbid)) {
+  // Skip if we've already seen this album in this run, or it was already
+  // processed, rejected or pending before the batch started
+  if (seenAlbums.has(albumMbid) || skipAlbums.has(albumMbid)) {
     return { added: false };
   }
   seenAlbums.add(albumMbid);
 
-  // Check if we've already processed this album
-  const alreadyProcessed = await ProcessedRecording.findOne({ where: { mbid: albumMbid, source: 'listenbrainz' } });
-
-  if (alreadyProcessed) {
-    return { added: false };
-  }
-
-  // Check if rejected or already pending
-  const isRejected = await ctx.queueService.isRejected(albumMbid);
-
-  if (isRejected) {
-    return { added: false };
-  }
-
-  const isPending = await ctx.queueService.isPending(albumMbid);
-
-  if (isPending) {
-    return { added: false };
-  }
-
   const coverUrl = ctx.coverClient.getCoverUrl(albumMbid);
 
   if (ctx.approvalMode === 'manual') {
-    await ctx.queueService.addPending({
+    writes.pending.push({
       artist:      albumInfo.artist,
       album:       albumInfo.title,
       mbid:        albumMbid,
@@ -345,20 +554,27 @@ async function processAlbumMode(
     logger.info(`  + ${ albumInfo.artist } - ${ albumInfo.title }`);
   }
 
-  await withDbWrite(() => ProcessedRecording.create({
-    mbid:        albumMbid,
-    source:      'listenbrainz',
-    processedAt: new Date(),
-  }));
+  writes.processed.push(albumMbid);
 
   return { added: true };
 }
 
 /**
- * Sleep helper for rate limiting
+ * Return which of the given MBIDs have already been processed for
+ * ListenBrainz, with one query for the whole list
  */
-function sleep(ms: number): Promise<void> {
-  return new Promise((resolve) => setTimeout(resolve, ms));
+async function getProcessedMbids(mbids: string[]): Promise<Set<string>> {
+  if (mbids.length === 0) {
+    return new Set();
+  }
+
+  const rows = await ProcessedRecording.findAll({
+    attributes: ['mbid'],
+    where:      { mbid: { [Op.in]: mbids }, source: 'listenbrainz' },
+    raw:        true,
+  });
+
+  return new Set(rows.map((row) => row.mbid));
 }
 
 /**
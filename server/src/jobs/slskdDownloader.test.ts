@@ -0,0 +1,218 @@
+import type { SlskdSearchResponse } from '@server/types/slskd-client';
+
+import {
+  describe, it, expect, vi, beforeEach
+} from 'vitest';
+
+vi.mock('@server/config/settings', () => ({ getConfig: vi.fn().mockReturnValue({ slskd: { host: 'http://slskd', api_key: 'key' } }) }));
+
+vi.mock('@server/config/db', () => ({ withDbWrite: vi.fn((operation: () => Promise<unknown>) => operation()) }));
+
+vi.mock('@server/models/DownloadTask', () => ({ default: { findAll: vi.fn(), update: vi.fn() } }));
+
+vi.mock('@server/models/WishlistItem', () => ({ default: {} }));
+
+const mockIsJobCancelled = vi.hoisted(() => vi.fn());
+
+vi.mock('@server/plugins/jobs', () => ({ isJobCancelled: mockIsJobCancelled }));
+
+const mockDownloadService = vi.hoisted(() => ({
+  updateTaskStatus:              vi.fn(),
+  processExpiredSelections:      vi.fn(),
+  syncTaskStatusesFromTransfers: vi.fn(),
+}));
+
+vi.mock('@server/services/DownloadService', () => ({
+  DownloadService: class { constructor() { return mockDownloadService; } },
+}));
+
+const mockWishlistService = vi.hoisted(() => ({
+  getUnprocessed:    vi.fn(),
+  markProcessedMany: vi.fn(),
+}));
+
+vi.mock('@server/services/WishlistService', () => ({
+  WishlistService: class { constructor() { return mockWishlistService; } },
+}));
+
+vi.mock('@server/services/TrackCountService', () => ({ TrackCountService: class {} }));
+
+const mockSlskdClient = vi.hoisted(() => ({
+  search:             vi.fn(),
+  getSearchState:     vi.fn(),
+  stopSearch:         vi.fn(),
+  getSearchResponses: vi.fn(),
+  deleteSearch:       vi.fn(),
+  getDownloads:       vi.fn(),
+  enqueue:            vi.fn(),
+}));
+
+vi.mock('@server/services/clients/SlskdClient', () => ({
+  SlskdClient: class { constructor() { return mockSlskdClient; } },
+}));
+
+import DownloadTask from '@server/models/DownloadTask';
+import { JobCancelledError } from '@server/utils/errorHandler';
+import { pickBestResponse, slskdDownloaderJob } from './slskdDownloader';
+
+const mockFindAll = vi.mocked(DownloadTask.findAll);
+
+function searchingTask(id: string) {
+  return {
+    id,
+    wishlistKey:   `Artist - Album ${ id }`,
+    artist:        'Artist',
+    album:         `Album ${ id }`,
+    type:          'album',
+    status:        'searching',
+    slskdSearchId: `search-${ id }`,
+  };
+}
+
+describe('slskdDownloaderJob', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    mockIsJobCancelled.mockReturnValue(false);
+    mockWishlistService.getUnprocessed.mockResolvedValue([]);
+    mockDownloadService.processExpiredSelections.mockResolvedValue(0);
+    mockSlskdClient.getDownloads.mockResolvedValue([]);
+    mockDownloadService.updateTaskStatus.mockResolvedValue(undefined);
+  });
+
+  it('stops the run when a task is cancelled while it is searching', async() => {
+    mockFindAll.mockResolvedValue([searchingTask('1')] as never);
+    // The job is cancelled after the task has already started its search
+    mockDownloadService.updateTaskStatus.mockImplementation(async() => {
+      mockIsJobCancelled.mockReturnValue(true);
+    });
+
+    await expect(slskdDownloaderJob()).rejects.toBeInstanceOf(JobCancelledError);
+
+    expect(mockSlskdClient.getSearchState).not.toHaveBeenCalled();
+    expect(mockDownloadService.processExpiredSelections).not.toHaveBeenCalled();
+  });
+
+  it('counts other task errors as failures and finishes the run', async() => {
+    mockFindAll.mockResolvedValue([searchingTask('1'), searchingTask('2')] as never);
+    mockDownloadService.updateTaskStatus.mockRejectedValueOnce(new Error('boom'));
+    mockSlskdClient.getSearchState.mockResolvedValue({ state: 'Cancelled' });
+
+    await slskdDownloaderJob();
+
+    expect(mockSlskdClient.getSearchState).toHaveBeenCalledTimes(1);
+    expect(mockDownloadService.processExpiredSelections).toHaveBeenCalledTimes(1);
+  });
+
+  describe('when enough responses arrive before the search finishes', () => {
+    const files = Array.from({ length: 10 }, (_, i) => ({ filename: `uploader\\Artist\\Album\\${ i + 1 }.flac`, size: 20 * 1024 * 1024 }));
+
+    beforeEach(() => {
+      mockFindAll.mockResolvedValue([searchingTask('1')] as never);
+      mockSlskdClient.getSearchState
+        .mockResolvedValueOnce({ state: 'InProgress', responseCount: 80 })
+        .mockResolvedValueOnce({ state: 'InProgress', responseCount: 80 })
+        .mockResolvedValue({ state: 'Cancelled' });
+      mockSlskdClient.stopSearch.mockResolvedValue(true);
+    });
+
+    it('stops the search and fetches responses only once it has finished', async() => {
+      mockSlskdClient.getSearchResponses.mockResolvedValue([{ username: 'uploader', files, hasFreeUploadSlot: true }]);
+      mockSlskdClient.enqueue.mockImplementation(async(_username: string, queued: { filename: string }[]) => ({
+        enqueued: queued.map((file, i) => ({ id: `id-${ i }`, filename: file.filename })),
+        failed:   [],
+      }));
+
+      await slskdDownloaderJob();
+
+      expect(mockSlskdClient.stopSearch).toHaveBeenCalledTimes(1);
+      expect(mockSlskdClient.stopSearch).toHaveBeenCalledWith('search-1');
+      expect(mockSlskdClient.getSearchState).toHaveBeenCalledTimes(3);
+
+      const [lastStateCall] = mockSlskdClient.getSearchState.mock.invocationCallOrder.slice(-1);
+
+      expect(mockSlskdClient.getSearchResponses.mock.invocationCallOrder[0]).toBeGreaterThan(lastStateCall);
+      expect(mockDownloadService.updateTaskStatus).toHaveBeenCalledWith('1', 'queued', expect.objectContaining({ fileCount: 10 }));
+    });
+
+    it('defers the task instead of failing when the stopped search has no saved responses yet', async() => {
+      mockSlskdClient.getSearchResponses.mockResolvedValue([]);
+
+      await slskdDownloaderJob();
+
+      expect(mockDownloadService.updateTaskStatus).toHaveBeenLastCalledWith('1', 'deferred', { slskdSearchId: 'search-1', errorMessage: undefined });
+      expect(mockSlskdClient.deleteSearch).not.toHaveBeenCalled();
+    });
+  });
+});
+
+describe('pickBestResponse', () => {
+  const MB = 1024 * 1024;
+
+  function response(username: string, fileCount: number, options: Partial<SlskdSearchResponse> & { size?: number } = {}): SlskdSearchResponse {
+    const { size = 10 * MB, ...rest } = options;
+
+    return {
+      username,
+      files:             Array.from({ length: fileCount }, (_, i) => ({ filename: `${ username }/Album/${ i + 1 }.flac`, size })),
+      hasFreeUploadSlot: true,
+      uploadSpeed:       1000,
+      ...rest,
+    };
+  }
+
+  function pick(responses: SlskdSearchResponse[], expectedTrackCount?: number): string | undefined {
+    return pickBestResponse(responses, 50, 1 * MB, 500 * MB, undefined, expectedTrackCount)?.username;
+  }
+
+  it('keeps the earlier response when scores tie', () => {
+    expect(pick([response('first', 10), response('second', 10)])).toBe('first');
+  });
+
+  it('breaks ties on total size, then upload speed', () => {
+    expect(pick([response('small', 10), response('large', 10, { size: 20 * MB })])).toBe('large');
+    expect(pick([response('slow', 10), response('fast', 10, { uploadSpeed: 5000 })])).toBe('fast');
+  });
+
+  it('prefers the file count closest to the expected track count', () => {
+    expect(pick([response('over', 14), response('exact', 12), response('under', 11)], 12)).toBe('exact');
+    expect(pick([response('under', 11), response('over', 14)], 12)).toBe('over');
+  });
+
+  it('prefers a free upload slot over a larger response', () => {
+    expect(pick([response('busy', 20, { hasFreeUploadSlot: false }), response('free', 5)])).toBe('free');
+  });
+
+  it('still picks the best response when none has a free slot', () => {
+    const responses = [
+      response('few', 5, { hasFreeUploadSlot: false }),
+      response('many', 12, { hasFreeUploadSlot: false }),
+    ];
+
+    expect(pick(responses)).toBe('many');
+  });
+
+  it('falls back to a busy uploader when every free one is filtered out', () => {
+    const responses = [
+      response('tiny', 10, { size: 100 }),
+      response('busy', 10, { hasFreeUploadSlot: false }),
+    ];
+
+    expect(pick(responses)).toBe('busy');
+  });
+
+  it('returns null for no responses or when every file is filtered out', () => {
+    const notMusic: SlskdSearchResponse = {
+      username: 'docs',
+      files:    [{ filename: 'docs/Album/cover.jpg', size: 2 * MB }, { filename: 'docs/Album/info.nfo', size: 2 * MB }],
+    };
+
+    expect(pickBestResponse([], 50, 1 * MB, 500 * MB)).toBeNull();
+    expect(pickBestResponse([notMusic, response('tiny', 10, { size: 100 }), response('empty', 0)], 50, 1 * MB, 500 * MB)).toBeNull();
+  });
+
+  it('only evaluates the first maxToEvaluate responses', () => {
+    const responses = [response('first', 5), response('second', 12)];
+
+    expect(pickBestResponse(responses, 1, 1 * MB, 500 * MB)?.username).toBe('first');
+  });
+});
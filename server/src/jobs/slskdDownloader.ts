@@ -8,7 +8,6 @@ import type {
 import type { SlskdFile, SlskdSearchResponse } from '@server/types/slskd-client';
 import type { QueryContext } from '@server/types/search-query';
 
-import path from 'path';
 import { Op } from '@sequelize/core';
 
 import logger from '@server/config/logger';
@@ -22,8 +21,12 @@ import { WishlistService } from '@server/services/WishlistService';
 import { SearchQueryBuilder } from '@server/services/SearchQueryBuilder';
 import { TrackCountService } from '@server/services/TrackCountService';
 import { buildQualityPreferences } from '@server/services/downloads/qualityPrefsBuilder';
+import { isMusicFile } from '@server/services/downloads/musicFileFilter';
+import { EnqueueBatcher } from '@server/services/downloads/enqueueBatcher';
 import { SlskdClient } from '@server/services/clients/SlskdClient';
 import { isJobCancelled } from '@server/plugins/jobs';
+import { mapWithConcurrency } from '@server/utils/concurrency';
+import { JobCancelledError } from '@server/utils/errorHandler';
 import {
   extractQualityInfo,
   calculateAverageQualityScore,
@@ -34,14 +37,15 @@ import {
 import { JOB_NAMES } from '@server/constants/jobs';
 import {
   SEARCH_TIMEOUT_MS,
+  SEARCH_POLL_INITIAL_MS,
   SEARCH_POLL_INTERVAL_MS,
   SEARCH_MAX_WAIT_MS,
   MIN_FILES_ALBUM,
   MIN_FILES_TRACK,
   MB_TO_BYTES,
-  MUSIC_EXTENSIONS,
   QUALITY_SCORES,
   MAX_STORED_SELECTION_RESULTS,
+  SEARCH_CONCURRENCY,
 } from '@server/constants/slskd';
 
 /**
@@ -103,8 +107,10 @@ export async function slskdDownloaderJob(): Promise<void> {
   logger.info('Starting slskd downloader job');
 
   const slskdClient = new SlskdClient(slskdConfig.host, slskdConfig.api_key, slskdConfig.url_base);
+  const enqueueBatcher = new EnqueueBatcher(slskdClient);
   const downloadService = new DownloadService();
   const wishlistService = new WishlistService();
+  const trackCountService = new TrackCountService();
   const searchConfig = buildSearchConfig(
     slskdConfig.search,
     slskdConfig.selection,
@@ -115,7 +121,7 @@ export async function slskdDownloaderJob(): Promise<void> {
   try {
     if (isJobCancelled(JOB_NAMES.SLSKD)) {
       logger.info('Job cancelled before processing wishlist');
-      throw new Error('Job cancelled');
+      throw new JobCancelledError();
     }
 
     // 1) Create download tasks for new wishlist items.
@@ -125,10 +131,14 @@ export async function slskdDownloaderJob(): Promise<void> {
     if (unprocessedWishlistItems.length === 0) {
       logger.debug('No unprocessed wishlist items');
     } else {
+      // Items whose task now exists; marked processed in one update instead of one per item
+      const processedIds: string[] = [];
+
       for (const wishlistItem of unprocessedWishlistItems) {
         if (isJobCancelled(JOB_NAMES.SLSKD)) {
+          await wishlistService.markProcessedMany(processedIds);
           logger.info('Job cancelled during wishlist task creation');
-          throw new Error('Job cancelled');
+          throw new JobCancelledError();
         }
 
         const wishlistKey = buildWishlistKey(wishlistItem.artist, wishlistItem.album);
@@ -147,7 +157,6 @@ export async function slskdDownloaderJob(): Promise<void> {
           // Resolve expected track count if not yet set (album tasks only)
           if (task.expectedTrackCount == null && task.type === 'album') {
             try {
-              const trackCountService = new TrackCountService();
               const count = await trackCountService.resolveExpectedTrackCount({
                 mbid:   task.mbid ?? undefined,
                 artist: task.artist,
@@ -162,7 +171,7 @@ export async function slskdDownloaderJob(): Promise<void> {
             }
           }
 
-          await wishlistService.markProcessed(wishlistItem.id);
+          processedIds.push(wishlistItem.id);
         } catch(error) {
           const errorMessage = error instanceof Error ? error.message : String(error);
           const errorStack = error instanceof Error ? error.stack : undefined;
@@ -170,6 +179,8 @@ export async function slskdDownloaderJob(): Promise<void> {
           logger.error(`Failed to create download task for wishlist entry ${ wishlistKey }: ${ errorMessage }`, { stack: errorStack });
         }
       }
+
+      await wishlistService.markProcessedMany(processedIds);
     }
 
     // 2) Process any pending/deferred search tasks, regardless of WishlistItem.processedAt.
@@ -180,22 +191,29 @@ export async function slskdDownloaderJob(): Promise<void> {
     let failedCount = 0;
     let pendingSelectionCount = 0;
 
-    for (const task of tasksToProcess) {
-      if (isJobCancelled(JOB_NAMES.SLSKD)) {
-        logger.info('Job cancelled during processing');
-        throw new Error('Job cancelled');
+    let cancelled = false;
+
+    // Searches spend nearly all their time waiting on slskd, so run up to
+    // SEARCH_CONCURRENCY of them at once instead of strictly one after another
+    await mapWithConcurrency(tasksToProcess, SEARCH_CONCURRENCY, async(task) => {
+      if (cancelled || isJobCancelled(JOB_NAMES.SLSKD)) {
+        cancelled = true;
+
+        return;
       }
 
       try {
         if (shouldSkipTask(task)) {
           skippedCount++;
-          continue;
+
+          return;
         }
 
         const processed = await processDownloadTask({
           task,
           wishlistKey: task.wishlistKey,
           slskdClient,
+          enqueueBatcher,
           downloadService,
           searchConfig,
         });
@@ -208,12 +226,24 @@ export async function slskdDownloaderJob(): Promise<void> {
           pendingSelectionCount++;
         }
       } catch(error) {
+        // A task that noticed the cancellation stops the whole run, not just itself
+        if (error instanceof JobCancelledError) {
+          cancelled = true;
+
+          return;
+        }
+
         failedCount++;
         const errorMessage = error instanceof Error ? error.message : String(error);
         const errorStack = error instanceof Error ? error.stack : undefined;
 
         logger.error(`Failed to process download task ${ task.wishlistKey }: ${ errorMessage }`, { stack: errorStack });
       }
+    });
+
+    if (cancelled || isJobCancelled(JOB_NAMES.SLSKD)) {
+      logger.info('Job cancelled during processing');
+      throw new JobCancelledError();
     }
 
     // Process expired selections
@@ -294,11 +324,12 @@ async function processDownloadTask(params: {
   task:            DownloadTask;
   wishlistKey:     string;
   slskdClient:     SlskdClient;
+  enqueueBatcher:  EnqueueBatcher;
   downloadService: DownloadService;
   searchConfig:    SearchConfig;
 }): Promise<'queued' | 'failed' | 'skipped' | 'deferred' | 'pending_selection'> {
   const {
-    task, wishlistKey, slskdClient, downloadService, searchConfig
+    task, wishlistKey, slskdClient, enqueueBatcher, downloadService, searchConfig
   } = params;
 
   // Build query context from the task (wishlist item may have been processed/removed).
@@ -341,7 +372,8 @@ async function processDownloadTask(params: {
     logger.debug(`Selected ${ selection.files.length }/${ response.files.length } files for ${ wishlistKey } from ${ response.username }`);
   }
 
-  const enqueueResult = await slskdClient.enqueue(response.username, selection.files);
+  // Concurrent searches that picked the same uploader share one enqueue request
+  const enqueueResult = await enqueueBatcher.enqueue(response.username, selection.files);
 
   if (!enqueueResult) {
     await downloadService.updateTaskStatus(task.id, 'failed', {
@@ -437,7 +469,7 @@ async function executeSearchWithRetry(params: {
   // Retry with fallback queries
   for (let attempt = 0; attempt < maxRetryAttempts - 1; attempt++) {
     if (isJobCancelled(JOB_NAMES.SLSKD)) {
-      throw new Error('Job cancelled');
+      throw new JobCancelledError();
     }
 
     const fallbackQuery = queryBuilder.buildFallbackQuery(queryContext, attempt, simplifyOnRetry);
@@ -511,7 +543,10 @@ async function attemptSearch(params: {
     errorMessage:  undefined,
   });
 
-  const searchState = await waitForSearchCompletion(slskdClient, searchId, maxWaitMs);
+  // Only the first responses are ever used (evaluated in auto mode, stored in manual mode),
+  // so stop the search as soon as that many have arrived instead of running out its timeout
+  const responseLimit = selection.mode === 'manual' ? Math.min(maxResponsesToEval, MAX_STORED_SELECTION_RESULTS) : maxResponsesToEval;
+  const searchState = await waitForSearchCompletion(slskdClient, searchId, maxWaitMs, responseLimit);
 
   logger.debug(`slskd search ${ searchId } for ${ wishlistKey } returned state ${ searchState }`);
 
@@ -525,7 +560,7 @@ async function attemptSearch(params: {
     return { status: 'deferred' };
   }
 
-  if (searchState !== 'Completed') {
+  if (searchState !== 'Completed' && searchState !== 'Stopped') {
     await downloadService.updateTaskStatus(task.id, 'failed', {
       slskdSearchId: searchId,
       errorMessage:  `Search ${ searchState.toLowerCase() }`,
@@ -538,6 +573,18 @@ async function attemptSearch(params: {
 
   const responses = await slskdClient.getSearchResponses(searchId);
 
+  if (responses.length === 0 && searchState === 'Stopped') {
+    // The search had enough responses when it was stopped, so they are not
+    // saved yet rather than missing; keep the search and read them next run
+    logger.info(`Responses for stopped search ${ wishlistKey } not available yet, will retry later`);
+    await downloadService.updateTaskStatus(task.id, 'deferred', {
+      slskdSearchId: searchId,
+      errorMessage:  undefined,
+    });
+
+    return { status: 'deferred' };
+  }
+
   if (responses.length === 0) {
     await slskdClient.deleteSearch(searchId);
 
@@ -555,7 +602,7 @@ async function attemptSearch(params: {
     }
 
     // Store the search results in the database (limited to reduce memory usage)
-    const storedResultsLimit = Math.min(maxResponsesToEval, MAX_STORED_SELECTION_RESULTS);
+    const storedResultsLimit = responseLimit;
 
     await withDbWrite(() => DownloadTask.update(
       {
@@ -632,19 +679,12 @@ function buildWishlistKey(artist: string, title: string): string {
   return `${ artist } - ${ title }`;
 }
 
-function normalizeSlskdPath(value: string): string {
-  const normalized = value.replace(/\\/g, '/').replace(/\/+$/, '');
-
-  return normalized === '.' ? '' : normalized;
-}
-
-function isMusicFile(filename: string): boolean {
-  const ext = path.extname(filename).toLowerCase();
-
-  return MUSIC_EXTENSIONS.includes(ext);
-}
-
-function pickBestResponse(
+/**
+ * Pick the response to download from: free upload slot first, then quality,
+ * completeness against the expected track count, total size and upload speed.
+ * Responses with no usable music files are never picked.
+ */
+export function pickBestResponse(
   responses: SlskdSearchResponse[],
   maxToEvaluate: number,
   minFileSizeBytes: number,
@@ -655,70 +695,62 @@ function pickBestResponse(
   // Limit responses to evaluate for performance
   const toEvaluate = responses.slice(0, maxToEvaluate);
 
-  const scored = toEvaluate
-    .map((response) => {
-      // Count only music files within size constraints for scoring
-      let musicFiles = response.files.filter((f) => {
-        if (!isMusicFile(f.filename)) {
-          return false;
-        }
-
-        const size = f.size || 0;
+  // Invariant across every response and comparison below
+  const activePrefs = qualityPreferences?.enabled ? qualityPreferences : undefined;
+  const expectedCount = expectedTrackCount && expectedTrackCount > 0 ? expectedTrackCount : 0;
 
-        // Filter by size constraints
-        if (minFileSizeBytes > 0 && size < minFileSizeBytes) {
-          return false;
-        }
+  const scoreResponse = (response: SlskdSearchResponse) => {
+    // Count only music files within size constraints (and passing the quality
+    // rejection filter, if enabled) in a single pass, summing their size as we go
+    const musicFiles: SlskdFile[] = [];
+    let totalSize = 0;
 
-        if (maxFileSizeBytes > 0 && size > maxFileSizeBytes) {
-          return false;
-        }
+    for (const f of response.files) {
+      if (!isMusicFile(f.filename)) {
+        continue;
+      }
 
-        return true;
-      });
+      const size = f.size || 0;
 
-      // Apply quality rejection filter if enabled
-      if (qualityPreferences?.enabled && qualityPreferences.rejectLowQuality) {
-        musicFiles = musicFiles.filter((f) => {
-          const qualityInfo = extractQualityInfo(f);
+      if ((minFileSizeBytes > 0 && size < minFileSizeBytes) || (maxFileSizeBytes > 0 && size > maxFileSizeBytes)) {
+        continue;
+      }
 
-          return !shouldRejectFile(qualityInfo, qualityPreferences);
-        });
+      if (activePrefs?.rejectLowQuality && shouldRejectFile(extractQualityInfo(f), activePrefs)) {
+        continue;
       }
 
-      // Calculate quality score
-      const qualityScore = qualityPreferences?.enabled ? calculateAverageQualityScore(musicFiles, qualityPreferences) : QUALITY_SCORES.unknown;
+      musicFiles.push(f);
+      totalSize += size;
+    }
+
+    // Calculate quality score
+    const qualityScore = activePrefs ? calculateAverageQualityScore(musicFiles, activePrefs) : QUALITY_SCORES.unknown;
 
-      // 3-level exactness: 2 = exact match, 1 = overcomplete, 0 = incomplete
-      let exactnessScore = 0;
+    // 3-level exactness: 2 = exact match, 1 = overcomplete, 0 = incomplete
+    let exactnessScore = 0;
 
-      if (expectedTrackCount && expectedTrackCount > 0) {
-        if (musicFiles.length === expectedTrackCount) {
-          exactnessScore = 2;
-        } else if (musicFiles.length > expectedTrackCount) {
-          exactnessScore = 1;
-        }
+    if (expectedCount) {
+      if (musicFiles.length === expectedCount) {
+        exactnessScore = 2;
+      } else if (musicFiles.length > expectedCount) {
+        exactnessScore = 1;
       }
+    }
 
-      return {
-        response,
-        musicFiles,
-        musicFileCount: musicFiles.length,
-        qualityScore,
-        exactnessScore,
-        totalSize:      musicFiles.reduce((sum, file) => sum + (file.size || 0), 0),
-        uploadSpeed:    response.uploadSpeed || 0,
-        hasSlot:        response.hasFreeUploadSlot ? 1 : 0,
-      };
-    })
-    .filter(scored => scored.musicFileCount > 0);
-
-  if (scored.length === 0) {
-    return null;
-  }
+    return {
+      response,
+      musicFileCount: musicFiles.length,
+      qualityScore,
+      exactnessScore,
+      totalSize,
+      uploadSpeed:    response.uploadSpeed || 0,
+      hasSlot:        response.hasFreeUploadSlot ? 1 : 0,
+    };
+  };
 
-  // Sort: hasSlot → qualityScore → exactnessScore → closeness-to-expected → totalSize → uploadSpeed
-  scored.sort((a, b) => {
+  // Order: hasSlot → qualityScore → exactnessScore → closeness-to-expected → totalSize → uploadSpeed
+  const compare = (a: ReturnType<typeof scoreResponse>, b: ReturnType<typeof scoreResponse>): number => {
     if (b.hasSlot !== a.hasSlot) {
       return b.hasSlot - a.hasSlot;
     }
@@ -732,9 +764,9 @@ function pickBestResponse(
     }
 
     // Prefer file count closest to expected (if known), otherwise prefer more
-    if (expectedTrackCount && expectedTrackCount > 0) {
-      const aDiff = Math.abs(a.musicFileCount - expectedTrackCount);
-      const bDiff = Math.abs(b.musicFileCount - expectedTrackCount);
+    if (expectedCount) {
+      const aDiff = Math.abs(a.musicFileCount - expectedCount);
+      const bDiff = Math.abs(b.musicFileCount - expectedCount);
 
       if (aDiff !== bDiff) {
         return aDiff - bDiff;
@@ -750,9 +782,31 @@ function pickBestResponse(
     }
 
     return b.uploadSpeed - a.uploadSpeed;
-  });
+  };
+
+  // hasSlot is the primary key, so evaluate responses with a free slot first: once one
+  // of them qualifies, responses without a slot can never win and are not scored at all
+  const ordered = [
+    ...toEvaluate.filter(response => response.hasFreeUploadSlot),
+    ...toEvaluate.filter(response => !response.hasFreeUploadSlot),
+  ];
+
+  let best: ReturnType<typeof scoreResponse> | null = null;
+
+  for (const response of ordered) {
+    if (best?.hasSlot && !response.hasFreeUploadSlot) {
+      break;
+    }
+
+    const candidate = scoreResponse(response);
+
+    // Strictly better only, so ties keep the earlier response like the stable sort did
+    if (candidate.musicFileCount > 0 && (!best || compare(candidate, best) < 0)) {
+      best = candidate;
+    }
+  }
 
-  return scored[0].response;
+  return best?.response ?? null;
 }
 
 function selectDownloadFiles(
@@ -765,38 +819,29 @@ function selectDownloadFiles(
 
   const directoryMap = new Map<string, { files: Map<string, SlskdFile>; totalSize: number }>();
 
-  // Filter to music files within size constraints
-  const musicFiles = response.files.filter((f) => {
-    if (!f.filename || !isMusicFile(f.filename)) {
-      return false;
+  // Filter to music files within size constraints and group them by directory in one pass
+  for (const file of response.files) {
+    if (!file.filename || !isMusicFile(file.filename)) {
+      continue;
     }
 
-    const size = f.size || 0;
+    const size = file.size || 0;
 
-    if (minFileSizeBytes > 0 && size < minFileSizeBytes) {
-      return false;
+    if ((minFileSizeBytes > 0 && size < minFileSizeBytes) || (maxFileSizeBytes > 0 && size > maxFileSizeBytes)) {
+      continue;
     }
 
-    if (maxFileSizeBytes > 0 && size > maxFileSizeBytes) {
-      return false;
-    }
+    const directory = slskdPathDirname(file.filename);
+    let group = directoryMap.get(directory);
 
-    return true;
-  });
-
-  for (const file of musicFiles) {
-    const normalizedFilename = normalizeSlskdPath(file.filename);
-    const directory = path.posix.dirname(normalizedFilename);
-
-    if (!directoryMap.has(directory)) {
-      directoryMap.set(directory, { files: new Map<string, SlskdFile>(), totalSize: 0 });
+    if (!group) {
+      group = { files: new Map<string, SlskdFile>(), totalSize: 0 };
+      directoryMap.set(directory, group);
     }
 
-    const group = directoryMap.get(directory)!;
-
     if (!group.files.has(file.filename)) {
       group.files.set(file.filename, file);
-      group.totalSize += file.size || 0;
+      group.totalSize += size;
     }
   }
 
@@ -872,17 +917,29 @@ function hasAlbumFolderStructure(directory: string): boolean {
   return false;
 }
 
+/**
+ * Poll a search until slskd finishes it. Once enoughResponses have arrived the
+ * search is stopped through the API rather than left to run out its timeout;
+ * slskd only saves responses when a search finishes, so polling continues
+ * until it has, and the result is 'Stopped' instead of 'Completed'.
+ */
 async function waitForSearchCompletion(
   slskdClient: SlskdClient,
   searchId: string,
   maxWaitMs: number = SEARCH_MAX_WAIT_MS,
-): Promise<'Completed' | 'Cancelled' | 'TimedOut' | 'Unknown'> {
-  const startTime = Date.now();
-
-  while (Date.now() - startTime < maxWaitMs) {
+  enoughResponses?: number,
+): Promise<'Completed' | 'Stopped' | 'Cancelled' | 'TimedOut' | 'Unknown'> {
+  // Poll quickly at first so fast searches are picked up as soon as they
+  // finish, backing off towards SEARCH_POLL_INTERVAL_MS for slow ones
+  const deadline = performance.now() + maxWaitMs;
+  let delay = SEARCH_POLL_INITIAL_MS;
+  let stopRequested = false;
+  let stopped = false;
+
+  while (performance.now() < deadline) {
     if (isJobCancelled(JOB_NAMES.SLSKD)) {
       logger.info('Job cancelled while waiting for search results');
-      throw new Error('Job cancelled');
+      throw new JobCancelledError();
     }
 
     const state = await slskdClient.getSearchState(searchId);
@@ -891,11 +948,28 @@ async function waitForSearchCompletion(
       return 'Unknown';
     }
 
+    // A search we stopped reports itself as cancelled once it has finished
+    if (stopped && (state.state === 'Completed' || state.state === 'Cancelled')) {
+      return 'Stopped';
+    }
+
     if (state.state === 'Completed' || state.state === 'Cancelled') {
       return state.state;
     }
 
-    await sleep(SEARCH_POLL_INTERVAL_MS);
+    if (!stopRequested && enoughResponses && state.responseCount !== undefined && state.responseCount >= enoughResponses) {
+      logger.debug(`slskd search ${ searchId } has ${ state.responseCount } responses, stopping it`);
+      stopRequested = true;
+      // If the stop request fails, keep waiting for the search to finish on its own
+      stopped = await slskdClient.stopSearch(searchId);
+
+      if (stopped) {
+        delay = SEARCH_POLL_INITIAL_MS;
+      }
+    }
+
+    await sleep(Math.min(delay, Math.max(deadline - performance.now(), 0)));
+    delay = Math.min(delay * 1.5, SEARCH_POLL_INTERVAL_MS);
   }
 
   return 'TimedOut';
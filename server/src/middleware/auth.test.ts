@@ -0,0 +1,104 @@
+import {
+  describe, it, expect, vi, beforeEach, afterEach,
+} from 'vitest';
+import express from 'express';
+import request from 'supertest';
+
+vi.mock('@server/config/settings', async(importOriginal) => {
+  const actual = await importOriginal<typeof import('@server/config/settings')>();
+
+  return {
+    ...actual,
+    getConfig: vi.fn().mockReturnValue({ ui: { auth: { enabled: false } } }),
+  };
+});
+
+import { authMiddleware } from '@server/middleware/auth';
+import { getConfig } from '@server/config/settings';
+import { AUTH_HEADER, AUTH_CONFIG } from '@server/tests/helpers/auth';
+
+const mockGetConfig = vi.mocked(getConfig);
+
+const app = express();
+
+app.use('/api', authMiddleware);
+app.get('/api/v1/ping', (_req, res) => {
+  res.json({ ok: true });
+});
+
+describe('authMiddleware', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    mockGetConfig.mockReturnValue(AUTH_CONFIG as any);
+  });
+
+  afterEach(() => {
+    vi.resetAllMocks();
+  });
+
+  it('passes through when auth is disabled', async() => {
+    mockGetConfig.mockReturnValue({ ui: { auth: { enabled: false } } } as any);
+
+    const response = await request(app).get('/api/v1/ping');
+
+    expect(response.status).toBe(200);
+    expect(response.body).toEqual({ ok: true });
+  });
+
+  it('passes through with valid Basic credentials', async() => {
+    const response = await request(app).get('/api/v1/ping').set('Authorization', AUTH_HEADER);
+
+    expect(response.status).toBe(200);
+  });
+
+  it('returns 401 with a JSON body and challenge header without credentials', async() => {
+    const response = await request(app).get('/api/v1/ping');
+
+    expect(response.status).toBe(401);
+    expect(response.headers['content-type']).toMatch(/application\/json/);
+    expect(response.headers['www-authenticate']).toBe('Basic');
+    expect(response.body).toEqual({
+      error:   true,
+      code:    'unauthorized',
+      message: 'Authentication required',
+      details: {},
+    });
+  });
+
+  it('rejects wrong Basic credentials', async() => {
+    const header = `Basic ${ Buffer.from('testuser:wrong').toString('base64') }`;
+    const response = await request(app).get('/api/v1/ping').set('Authorization', header);
+
+    expect(response.status).toBe(401);
+  });
+
+  it('accepts an API key via Bearer token or X-API-Key header', async() => {
+    mockGetConfig.mockReturnValue({
+      ui: {
+        auth: {
+          enabled: true, type: 'api_key', api_key: 'secret-key',
+        },
+      },
+    } as any);
+
+    const bearer = await request(app).get('/api/v1/ping').set('Authorization', 'Bearer secret-key');
+    const header = await request(app).get('/api/v1/ping').set('X-API-Key', 'secret-key');
+    const wrong = await request(app).get('/api/v1/ping').set('X-API-Key', 'nope');
+
+    expect(bearer.status).toBe(200);
+    expect(header.status).toBe(200);
+    expect(wrong.status).toBe(401);
+    expect(wrong.headers['www-authenticate']).toBe('Bearer');
+  });
+
+  it('requires the Remote-User header for proxy auth', async() => {
+    mockGetConfig.mockReturnValue({ ui: { auth: { enabled: true, type: 'proxy' } } } as any);
+
+    const withUser = await request(app).get('/api/v1/ping').set('Remote-User', 'alice');
+    const withoutUser = await request(app).get('/api/v1/ping');
+
+    expect(withUser.status).toBe(200);
+    expect(withoutUser.status).toBe(401);
+    expect(withoutUser.headers['www-authenticate']).toBeUndefined();
+  });
+});
@@ -1,175 +1,197 @@
-import type { Request, Response, NextFunction } from 'express';
-import type { AuthSettings } from '@server/config/schemas';
+import type { IncomingMessage, OutgoingHttpHeaders, ServerResponse } from 'http';
+import type { NextFunction } from 'express';
+import type { AuthSettings, Config } from '@server/config/schemas';
 
 import crypto from 'crypto';
-import logger from '@server/config/logger';
 import { getConfig } from '@server/config/settings';
 
-// const EXCLUDED_PATHS = new Set(['/health', '/docs', '/openapi.json', '/redoc']);
+/**
+ * 401 response body, serialized once since it never changes
+ */
+const UNAUTHORIZED_BODY = Buffer.from(JSON.stringify({
+  error:   true,
+  code:    'unauthorized',
+  message: 'Authentication required',
+  details: {},
+}));
+
+/**
+ * Build the 401 response headers, optionally with a WWW-Authenticate challenge
+ */
+function buildUnauthorizedHeaders(scheme?: string): Readonly<OutgoingHttpHeaders> {
+  const headers: OutgoingHttpHeaders = {
+    'Content-Type':   'application/json; charset=utf-8',
+    'Content-Length': UNAUTHORIZED_BODY.length,
+  };
+
+  if (scheme) {
+    headers['WWW-Authenticate'] = scheme;
+  }
+
+  return Object.freeze(headers);
+}
+
+// The challenge only varies by auth type, so every variant is built up front
+const UNAUTHORIZED_HEADERS = {
+  basic:  buildUnauthorizedHeaders('Basic'),
+  bearer: buildUnauthorizedHeaders('Bearer'),
+  none:   buildUnauthorizedHeaders(),
+};
+
+const BASIC_PREFIX = 'Basic ';
+const BEARER_PREFIX = 'Bearer ';
 
 /**
- * Auth middleware for protecting API routes
+ * Auth middleware for protecting API routes.
+ * Only touches the underlying Node request/response so that the hot path
+ * (and the reject path) never goes through Express' response helpers.
  */
-export function authMiddleware(req: Request, res: Response, next: NextFunction): void {
-  const config = getConfig();
-  const authSettings = config.ui?.auth;
+export function authMiddleware(req: IncomingMessage, res: ServerResponse, next: NextFunction): void {
+  const authState = getAuthState(getConfig());
 
   // If auth is disabled, allow all requests
-  if (!authSettings?.enabled) {
+  if (!authState) {
     next();
 
     return;
   }
 
-  // Validate based on auth type
-  let isValid = false;
+  const { validate, unauthorizedHeaders } = authState;
 
-  switch (authSettings.type) {
-    case 'basic':
-      isValid = validateBasicAuth(req, authSettings);
-      if (!isValid) {
-        sendUnauthorized(res, 'Basic');
+  if (!validate(req)) {
+    if (!res.headersSent) {
+      res.writeHead(401, unauthorizedHeaders).end(UNAUTHORIZED_BODY);
+    }
 
-        return;
-      }
-      break;
+    return;
+  }
 
-    case 'api_key':
-      isValid = validateApiKeyAuth(req, authSettings);
-      if (!isValid) {
-        sendUnauthorized(res, 'Bearer');
+  next();
+}
 
-        return;
-      }
-      break;
+/**
+ * Validator selected (and prepared) once per auth configuration
+ */
+type AuthValidator = (req: IncomingMessage) => boolean;
 
-    case 'proxy':
-      isValid = validateProxyAuth(req);
-      if (!isValid) {
-        sendUnauthorized(res);
+interface AuthState {
+  validate:            AuthValidator;
+  unauthorizedHeaders: Readonly<OutgoingHttpHeaders>;
+}
 
-        return;
-      }
-      break;
+// Auth can be toggled from the settings UI, so the middleware stays mounted
+// and resolves its state per config object instead. Config reloads replace
+// that object, so identity is enough to know when to rebuild.
+let cachedConfig: Config | null = null;
+let cachedState: AuthState | null = null;
 
-    default:
-      // Unknown auth type, deny access
-      sendUnauthorized(res);
+/**
+ * Get the prepared auth state for the given config, or null when auth is disabled
+ */
+function getAuthState(config: Config): AuthState | null {
+  if (config !== cachedConfig) {
+    const authSettings = config.ui?.auth;
 
-      return;
+    cachedState = authSettings?.enabled ? createAuthState(authSettings) : null;
+    cachedConfig = config;
   }
 
-  next();
+  return cachedState;
 }
 
 /**
- * Validate Basic authentication
+ * Pick the validator and challenge scheme for the configured auth type
  */
-function validateBasicAuth(req: Request, authSettings: AuthSettings): boolean {
-  const authHeader = req.headers.authorization || '';
+function createAuthState(authSettings: AuthSettings): AuthState {
+  switch (authSettings.type) {
+    case 'basic':
+      return { validate: createBasicAuthValidator(authSettings), unauthorizedHeaders: UNAUTHORIZED_HEADERS.basic };
 
-  if (!authHeader.startsWith('Basic ')) {
-    return false;
-  }
+    case 'api_key':
+      return { validate: createApiKeyAuthValidator(authSettings), unauthorizedHeaders: UNAUTHORIZED_HEADERS.bearer };
 
-  try {
-    const encoded = authHeader.slice(6);
-    const decoded = Buffer.from(encoded, 'base64').toString('utf-8');
-    const colonIndex = decoded.indexOf(':');
+    case 'proxy':
+      return { validate: validateProxyAuth, unauthorizedHeaders: UNAUTHORIZED_HEADERS.none };
 
-    if (colonIndex === -1) {
-      return false;
-    }
+    default:
+      // Unknown auth type, deny access
+      return { validate: () => false, unauthorizedHeaders: UNAUTHORIZED_HEADERS.none };
+  }
+}
 
-    const username = decoded.slice(0, colonIndex);
-    const password = decoded.slice(colonIndex + 1);
+/**
+ * Create a Basic authentication validator with the expected credentials pre-encoded
+ */
+function createBasicAuthValidator(authSettings: AuthSettings): AuthValidator {
+  // Basic credentials are "user:pass" and a user-id may not contain ':', so
+  // the decoded header can be compared as a whole in one constant-time pass
+  const expectedCredentials = Buffer.from(`${ authSettings.username || '' }:${ authSettings.password || '' }`, 'utf-8');
 
-    const expectedUsername = authSettings.username || '';
-    const expectedPassword = authSettings.password || '';
+  return ({ headers }) => {
+    const authHeader = headers.authorization;
 
-    const usernameValid = timingSafeEqual(username, expectedUsername);
-    const passwordValid = timingSafeEqual(password, expectedPassword);
+    if (!authHeader?.startsWith(BASIC_PREFIX)) {
+      return false;
+    }
 
-    return usernameValid && passwordValid;
-  } catch(error) {
-    logger.error('[auth] Error validating Basic auth:', error);
+    // Node's base64 decoder is lenient (it stops at the first invalid
+    // character instead of throwing), so no exception handling is needed;
+    // malformed input simply fails the comparison below.
+    const decoded = Buffer.from(authHeader.slice(BASIC_PREFIX.length), 'base64');
 
-    return false;
-  }
+    return timingSafeEqual(decoded, expectedCredentials);
+  };
 }
 
 /**
- * Validate API key authentication via Bearer token or X-API-Key header
+ * Create an API key validator (Bearer token or X-API-Key header) with the expected key pre-encoded
  */
-function validateApiKeyAuth(req: Request, authSettings: AuthSettings): boolean {
-  const expectedKey = authSettings.api_key || '';
+function createApiKeyAuthValidator(authSettings: AuthSettings): AuthValidator {
+  const expectedKey = Buffer.from(authSettings.api_key || '', 'utf-8');
 
-  // Check Bearer token
-  const authHeader = req.headers.authorization || '';
+  return ({ headers }) => {
+    // Check Bearer token. The prefix is ASCII, so its byte length equals its
+    // string length and the token can be taken as a view of the encoded header.
+    const authHeader = headers.authorization;
 
-  if (authHeader.startsWith('Bearer ')) {
-    const token = authHeader.slice(7);
+    if (authHeader?.startsWith(BEARER_PREFIX)) {
+      const token = Buffer.from(authHeader, 'utf-8').subarray(BEARER_PREFIX.length);
 
-    if (timingSafeEqual(token, expectedKey)) {
-      return true;
+      if (timingSafeEqual(token, expectedKey)) {
+        return true;
+      }
     }
-  }
 
-  // Check X-API-Key header
-  const apiKeyHeader = req.headers['x-api-key'] as string;
+    // Check X-API-Key header
+    const apiKeyHeader = headers['x-api-key'] as string | undefined;
 
-  if (apiKeyHeader && timingSafeEqual(apiKeyHeader, expectedKey)) {
-    return true;
-  }
+    if (apiKeyHeader && timingSafeEqual(Buffer.from(apiKeyHeader, 'utf-8'), expectedKey)) {
+      return true;
+    }
 
-  return false;
+    return false;
+  };
 }
 
 /**
  * Validate proxy authentication via Remote-User header
  */
-function validateProxyAuth(req: Request): boolean {
-  const remoteUser = req.headers['remote-user'] as string;
+function validateProxyAuth({ headers }: IncomingMessage): boolean {
+  const remoteUser = headers['remote-user'] as string | undefined;
 
   return Boolean(remoteUser);
 }
 
 /**
- * Timing-safe string comparison to prevent timing attacks
+ * Timing-safe buffer comparison to prevent timing attacks
  */
-function timingSafeEqual(a: string, b: string): boolean {
+function timingSafeEqual(a: Buffer, b: Buffer): boolean {
   if (a.length !== b.length) {
     // Still do a comparison to prevent timing leaks
-    const bufA = Buffer.from(a, 'utf-8');
-    const bufB = Buffer.from('x'.repeat(a.length), 'utf-8');
-
-    crypto.timingSafeEqual(bufA, bufB);
+    crypto.timingSafeEqual(a, a);
 
     return false;
   }
 
-  const bufA = Buffer.from(a, 'utf-8');
-  const bufB = Buffer.from(b, 'utf-8');
-
-  return crypto.timingSafeEqual(bufA, bufB);
-}
-
-/**
- * Send 401 Unauthorized response
- */
-function sendUnauthorized(res: Response, scheme?: string): void {
-  if (res.headersSent) {
-    return;
-  }
-
-  if (scheme) {
-    res.setHeader('WWW-Authenticate', scheme);
-  }
-
-  res.status(401).json({
-    error:   true,
-    code:    'unauthorized',
-    message: 'Authentication required',
-    details: {},
-  });
+  return crypto.timingSafeEqual(a, b);
 }
@@ -68,7 +68,10 @@ CatalogArtist.init(
     tableName:   'catalog_artists',
     underscored: true,
     indexes:     [
-      { fields: ['name_lower'] },
+      // Catalog sync upserts on name_lower (see UNIQUE_INDEX_MIGRATIONS for existing databases)
+      {
+        name: 'catalog_artists_name_lower_unique', unique: true, fields: ['name_lower']
+      },
       { fields: ['navidrome_id'] },
     ],
   },
@@ -0,0 +1,69 @@
+import type { PartialBy } from '@sequelize/utils';
+
+import { DataTypes, Model } from '@sequelize/core';
+import { sequelize } from '@server/config/db/sequelize';
+
+export type MusicBrainzLookupKind = 'summary';
+
+/**
+ * MusicBrainzLookup attributes.
+ * Persists resolved MusicBrainz recordings so repeat runs can skip the
+ * rate-limited API for MBIDs that were seen (and filtered) before.
+ */
+export interface MusicBrainzLookupAttributes {
+  id:         number;
+  mbid:       string;                 // Recording MBID that was resolved
+  kind:       MusicBrainzLookupKind;  // Payload format
+  payload:    string;                 // JSON-encoded RecordingSummary
+  createdAt?: Date;
+  updatedAt?: Date;
+}
+
+export type MusicBrainzLookupCreationAttributes = PartialBy<MusicBrainzLookupAttributes, 'id'>;
+
+/**
+ * Sequelize model for cached MusicBrainz lookups.
+ */
+class MusicBrainzLookup extends Model<MusicBrainzLookupAttributes, MusicBrainzLookupCreationAttributes> implements MusicBrainzLookupAttributes {
+  declare id:         number;
+  declare mbid:       string;
+  declare kind:       MusicBrainzLookupKind;
+  declare payload:    string;
+  declare createdAt?: Date;
+  declare updatedAt?: Date;
+}
+
+MusicBrainzLookup.init(
+  {
+    id: {
+      type:          DataTypes.INTEGER,
+      primaryKey:    true,
+      autoIncrement: true,
+    },
+    mbid: {
+      type:      DataTypes.STRING(255),
+      allowNull: false,
+      comment:   'MusicBrainz recording ID',
+    },
+    kind: {
+      type:      DataTypes.STRING(20),
+      allowNull: false,
+      comment:   'Payload kind (recording summary)',
+    },
+    payload: {
+      type:      DataTypes.TEXT,
+      allowNull: false,
+      comment:   'JSON-encoded resolver result',
+    },
+  },
+  {
+    sequelize,
+    tableName:   'musicbrainz_lookups',
+    underscored: true,
+    indexes:     [
+      { fields: ['mbid', 'kind'], unique: true },
+    ],
+  },
+);
+
+export default MusicBrainzLookup;
@@ -164,6 +164,10 @@ QueueItem.init(
       { fields: ['added_at'] },
       { fields: ['in_library'] },
       { fields: ['status', 'in_library'] },
+      // Pending listing sorts: let SQLite walk the index in order instead of
+      // sorting every pending row per request
+      { fields: ['status', 'added_at'] },
+      { fields: ['status', 'score'] },
       // Note: mbid already has unique constraint at column level (line 92)
     ],
   },
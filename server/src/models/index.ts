@@ -17,6 +17,13 @@ export type {
   ProcessedRecordingCreationAttributes,
 } from './ProcessedRecording';
 
+export { default as MusicBrainzLookup } from './MusicBrainzLookup';
+export type {
+  MusicBrainzLookupAttributes,
+  MusicBrainzLookupCreationAttributes,
+  MusicBrainzLookupKind,
+} from './MusicBrainzLookup';
+
 export { default as CatalogArtist } from './CatalogArtist';
 export type {
   CatalogArtistAttributes,
@@ -2,6 +2,7 @@ import express from 'express';
 import cors from 'cors';
 import path from 'path';
 import fs from 'fs';
+import { createHash } from 'crypto';
 
 import logger from '@server/config/logger';
 import { authMiddleware } from '@server/middleware/auth';
@@ -19,6 +20,29 @@ import AuthController from '@server/controllers/AuthController';
 
 const app = express();
 
+// Largest response body that still gets an ETag
+const ETAG_MAX_BODY_BYTES = 64 * 1024;
+
+/**
+ * Weak ETag in the same format as Express's default, but only for bodies up to
+ * ETAG_MAX_BODY_BYTES. Small responses keep 304 revalidation; large list
+ * payloads (which change on almost every poll) skip hashing the whole body.
+ * Static assets keep their own ETags via express.static.
+ */
+function boundedWeakEtag(body: string | Buffer, encoding?: BufferEncoding): string | undefined {
+  const buffer = Buffer.isBuffer(body) ? body : Buffer.from(body, encoding);
+
+  if (buffer.length > ETAG_MAX_BODY_BYTES) {
+    return undefined;
+  }
+
+  const hash = createHash('sha1').update(buffer).digest('base64').substring(0, 27);
+
+  return `W/"${ buffer.length.toString(16) }-${ hash }"`;
+}
+
+app.set('etag', boundedWeakEtag);
+
 // CORS middleware for development
 app.use(
   cors({
@@ -32,7 +56,8 @@ app.use(
 // JSON body parser
 app.use(express.json());
 
-// Public routes (no auth required)
+// Public routes (no auth required). These are mounted ahead of the auth
+// middleware, so it never has to consult an exclusion list per request.
 app.use('/api/v1/health', healthRoutes);
 app.get('/api/v1/auth/info', AuthController.getInfo);
 
@@ -53,12 +78,18 @@ app.use('/api/v1/settings', settingsRoutes);
 // Serve static files in production
 const staticPath = path.join(process.cwd(), 'static');
 
+// Request paths the SPA fallback leaves to the API/health handlers
+const NON_SPA_PATH = /^\/(?:api|health)/;
+
+// When a reverse proxy serves the UI bundle itself, keep Node to the API only
+const staticServedByProxy = process.env.STATIC_SERVED_BY_PROXY === 'true';
+
 try {
-  if (fs.existsSync(staticPath)) {
+  if (!staticServedByProxy && fs.existsSync(staticPath)) {
     app.use(express.static(staticPath));
     // Fallback to index.html for SPA routing
     app.use((req, res, next) => {
-      if (!req.path.startsWith('/api') && !req.path.startsWith('/health')) {
+      if (!NON_SPA_PATH.test(req.path)) {
         res.sendFile(path.join(staticPath, 'index.html'));
       } else {
         next();
@@ -0,0 +1,125 @@
+import {
+  describe, it, expect, vi, beforeEach, afterEach
+} from 'vitest';
+
+import { JOB_NAMES, JOB_RETRY_BASE_MS } from '@server/constants/jobs';
+
+vi.mock('@server/config/jobs', () => ({
+  JOB_INTERVALS: {
+    listenbrainz:    { cron: '0 * * * *' },
+    catalog:         { cron: 'manual' },
+    slskd:           { cron: 'manual' },
+    librarySync:     { cron: 'manual' },
+    libraryOrganize: { cron: 'manual' },
+  },
+  RUN_ON_STARTUP: false,
+}));
+
+vi.mock('@server/config/settings', () => ({ getConfig: vi.fn().mockReturnValue({}) }));
+
+vi.mock('node-cron', () => ({
+  validate: vi.fn().mockReturnValue(true),
+  schedule: vi.fn(() => ({ stop: vi.fn() })),
+}));
+
+const mockListenbrainzFetch = vi.hoisted(() => vi.fn());
+
+vi.mock('@server/jobs/listenbrainzFetch', () => ({ listenbrainzFetchJob: mockListenbrainzFetch }));
+vi.mock('@server/jobs/catalogDiscovery', () => ({ catalogDiscoveryJob: vi.fn() }));
+vi.mock('@server/jobs/slskdDownloader', () => ({ slskdDownloaderJob: vi.fn() }));
+vi.mock('@server/jobs/librarySync', () => ({ librarySyncJob: vi.fn() }));
+vi.mock('@server/jobs/libraryOrganize', () => ({ libraryOrganizeJob: vi.fn() }));
+
+vi.mock('@server/plugins/io/namespaces', () => ({
+  jobsNs: {
+    emitJobStarted:   vi.fn(),
+    emitJobCompleted: vi.fn(),
+    emitJobFailed:    vi.fn(),
+    emitJobCancelled: vi.fn(),
+  },
+}));
+
+type JobsModule = typeof import('./jobs');
+
+describe('scheduled job retries', () => {
+  let jobsModule: JobsModule;
+
+  /**
+   * Run the job once by hand and let its handler settle
+   */
+  async function runOnce(): Promise<void> {
+    jobsModule.triggerJob(JOB_NAMES.LB_FETCH);
+    await vi.advanceTimersByTimeAsync(0);
+  }
+
+  beforeEach(async() => {
+    vi.useFakeTimers();
+    // Top of the hour, so the next cron tick is a full hour away
+    vi.setSystemTime(new Date(2026, 0, 1, 0, 0, 0));
+    vi.clearAllMocks();
+    // Fresh module state (failure counts, timers) for every test
+    vi.resetModules();
+    jobsModule = await import('./jobs');
+    jobsModule.startJobs();
+  });
+
+  afterEach(() => {
+    jobsModule.stopJobs();
+    vi.useRealTimers();
+  });
+
+  it('doubles the retry delay after each consecutive failure', async() => {
+    mockListenbrainzFetch.mockRejectedValue(new Error('boom'));
+
+    await runOnce();
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(1);
+
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS - 1);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(1);
+
+    await vi.advanceTimersByTimeAsync(1);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(2);
+
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS * 2 - 1);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(2);
+
+    await vi.advanceTimersByTimeAsync(1);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(3);
+
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS * 4);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(4);
+  });
+
+  it('does not retry when the retry would land after the next cron tick', async() => {
+    vi.setSystemTime(new Date(2026, 0, 1, 0, 59, 50));
+    mockListenbrainzFetch.mockRejectedValue(new Error('boom'));
+
+    await runOnce();
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS * 4);
+
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('resets the backoff after a successful run', async() => {
+    mockListenbrainzFetch
+      .mockRejectedValueOnce(new Error('boom'))
+      .mockRejectedValueOnce(new Error('boom'))
+      .mockResolvedValueOnce(undefined)
+      .mockRejectedValue(new Error('boom'));
+
+    // Fail, fail again on the first retry, then succeed on the second
+    await runOnce();
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS);
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS * 2);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(3);
+
+    // No retry is pending after the success
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS * 4);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(3);
+
+    // The next failure starts again from the base delay
+    await runOnce();
+    await vi.advanceTimersByTimeAsync(JOB_RETRY_BASE_MS);
+    expect(mockListenbrainzFetch).toHaveBeenCalledTimes(5);
+  });
+});
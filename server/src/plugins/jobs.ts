@@ -2,7 +2,7 @@ import * as cron from 'node-cron';
 import { CronExpressionParser } from 'cron-parser';
 
 import logger from '@server/config/logger';
-import { JOB_NAMES } from '@server/constants/jobs';
+import { JOB_NAMES, JOB_RETRY_BASE_MS } from '@server/constants/jobs';
 import { JOB_INTERVALS, RUN_ON_STARTUP } from '@server/config/jobs';
 import { getConfig } from '@server/config/settings';
 import { listenbrainzFetchJob } from '@server/jobs/listenbrainzFetch';
@@ -16,55 +16,62 @@ import { jobsNs } from '@server/plugins/io/namespaces';
  * Job definitions with name, cron schedule, and handler
  */
 interface JobDefinition {
-  name:    string;
-  cron:    string;
-  handler: () => Promise<void>;
-  task?:   ReturnType<typeof cron.schedule>;
-  running: boolean;
-  lastRun: Date | null;
-  aborted: boolean;
+  name:     string;
+  cron:     string;
+  handler:  () => Promise<void>;
+  task?:    ReturnType<typeof cron.schedule>;
+  running:  boolean;
+  lastRun:  Date | null;
+  aborted:  boolean;
+  failures: number;
+  retry?:   ReturnType<typeof setTimeout>;
 }
 
 const jobs: JobDefinition[] = [
   {
-    name:    JOB_NAMES.LB_FETCH,
-    cron:    JOB_INTERVALS.listenbrainz.cron,
-    handler: listenbrainzFetchJob,
-    running: false,
-    lastRun: null,
-    aborted: false,
+    name:     JOB_NAMES.LB_FETCH,
+    cron:     JOB_INTERVALS.listenbrainz.cron,
+    handler:  listenbrainzFetchJob,
+    running:  false,
+    lastRun:  null,
+    aborted:  false,
+    failures: 0,
   },
   {
-    name:    JOB_NAMES.CATALOGD,
-    cron:    JOB_INTERVALS.catalog.cron,
-    handler: catalogDiscoveryJob,
-    running: false,
-    lastRun: null,
-    aborted: false,
+    name:     JOB_NAMES.CATALOGD,
+    cron:     JOB_INTERVALS.catalog.cron,
+    handler:  catalogDiscoveryJob,
+    running:  false,
+    lastRun:  null,
+    aborted:  false,
+    failures: 0,
   },
   {
-    name:    JOB_NAMES.SLSKD,
-    cron:    JOB_INTERVALS.slskd.cron,
-    handler: slskdDownloaderJob,
-    running: false,
-    lastRun: null,
-    aborted: false,
+    name:     JOB_NAMES.SLSKD,
+    cron:     JOB_INTERVALS.slskd.cron,
+    handler:  slskdDownloaderJob,
+    running:  false,
+    lastRun:  null,
+    aborted:  false,
+    failures: 0,
   },
   {
-    name:    JOB_NAMES.LIBRARY_SYNC,
-    cron:    JOB_INTERVALS.librarySync.cron,
-    handler: librarySyncJob,
-    running: false,
-    lastRun: null,
-    aborted: false,
+    name:     JOB_NAMES.LIBRARY_SYNC,
+    cron:     JOB_INTERVALS.librarySync.cron,
+    handler:  librarySyncJob,
+    running:  false,
+    lastRun:  null,
+    aborted:  false,
+    failures: 0,
   },
   {
-    name:    JOB_NAMES.LIBRARY_ORGANIZE,
-    cron:    JOB_INTERVALS.libraryOrganize.cron,
-    handler: libraryOrganizeJob,
-    running: false,
-    lastRun: null,
-    aborted: false,
+    name:     JOB_NAMES.LIBRARY_ORGANIZE,
+    cron:     JOB_INTERVALS.libraryOrganize.cron,
+    handler:  libraryOrganizeJob,
+    running:  false,
+    lastRun:  null,
+    aborted:  false,
+    failures: 0,
   },
 ];
 
@@ -84,7 +91,7 @@ function wrapJobHandler(job: JobDefinition): () => Promise<void> {
     job.aborted = false;
     job.lastRun = new Date();
     logger.debug(`Job ${ job.name } running state set to true`);
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     // Emit job started event
     jobsNs.emitJobStarted({
@@ -95,7 +102,9 @@ function wrapJobHandler(job: JobDefinition): () => Promise<void> {
     try {
       logger.info(`Starting job: ${ job.name }`);
       await job.handler();
-      const duration = Date.now() - startTime;
+      const duration = Math.round(performance.now() - startTime);
+
+      job.failures = 0;
 
       if (job.aborted) {
         logger.info(`Job ${ job.name } was cancelled after ${ duration }ms`);
@@ -108,7 +117,7 @@ function wrapJobHandler(job: JobDefinition): () => Promise<void> {
         });
       }
     } catch(error) {
-      const duration = Date.now() - startTime;
+      const duration = Math.round(performance.now() - startTime);
 
       if (job.aborted) {
         logger.info(`Job ${ job.name } cancelled:`, { error });
@@ -120,6 +129,9 @@ function wrapJobHandler(job: JobDefinition): () => Promise<void> {
           error: error instanceof Error ? error.message : String(error),
           duration,
         });
+
+        job.failures++;
+        scheduleRetry(job);
       }
     } finally {
       job.running = false;
@@ -129,6 +141,39 @@ function wrapJobHandler(job: JobDefinition): () => Promise<void> {
   };
 }
 
+/**
+ * After a scheduled run fails, retry with exponential backoff
+ * (JOB_RETRY_BASE_MS, doubling per consecutive failure) instead of waiting a
+ * full interval, but only while the retry would land before the next cron tick
+ */
+function scheduleRetry(job: JobDefinition): void {
+  if (!job.task || job.retry) {
+    return;
+  }
+
+  const delay = JOB_RETRY_BASE_MS * 2 ** (job.failures - 1);
+
+  try {
+    const nextRun = CronExpressionParser.parse(job.cron).next().getTime();
+
+    if (Date.now() + delay >= nextRun) {
+      return;
+    }
+  } catch {
+    return;
+  }
+
+  logger.info(`Retrying job ${ job.name } in ${ Math.round(delay / 1000) }s (consecutive failures: ${ job.failures })`);
+
+  job.retry = setTimeout(() => {
+    job.retry = undefined;
+    wrapJobHandler(job)().catch((error) => {
+      logger.error(`Retry of ${ job.name } failed:`, { error });
+    });
+  }, delay);
+  job.retry.unref();
+}
+
 /**
  * Start all background jobs
  */
@@ -184,6 +229,11 @@ export function stopJobs(): void {
   logger.info('Stopping background jobs');
 
   for (const job of jobs) {
+    if (job.retry) {
+      clearTimeout(job.retry);
+      job.retry = undefined;
+    }
+
     if (job.task) {
       job.task.stop();
       logger.info(`Stopped job: ${ job.name }`);
@@ -286,10 +336,10 @@ export async function cancelJob(name: string, timeout = 30000): Promise<boolean
 
   // Wait for the job to actually stop
   const pollInterval = 100;
-  const startTime = Date.now();
+  const deadline = performance.now() + timeout;
 
   while (job.running) {
-    if (Date.now() - startTime > timeout) {
+    if (performance.now() > deadline) {
       logger.warn(`Timeout waiting for job ${ name } to stop`);
 
       return true; // Still return true - cancellation was requested
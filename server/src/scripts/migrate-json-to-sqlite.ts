@@ -76,13 +76,18 @@ export async function migrateJsonToSqlite(): Promise<void> {
 
       logger.info(`Migrating ${ mbids.length } items from processed.json...`);
 
-      for (const mbid of mbids) {
-        await ProcessedRecording.create({
+      // One INSERT OR IGNORE for the whole set: legacy lists can hold
+      // thousands of MBIDs (and repeats, which would violate the unique index)
+      const processedAt = new Date();
+
+      await ProcessedRecording.bulkCreate(
+        mbids.map((mbid: string) => ({
           mbid,
-          source:      'listenbrainz', // Assume listenbrainz for legacy data
-          processedAt: new Date(),
-        });
-      }
+          source: 'listenbrainz', // Assume listenbrainz for legacy data
+          processedAt,
+        })),
+        { ignoreDuplicates: true }
+      );
 
       // Backup original file
       fs.renameSync(processedPath, `${ processedPath }.bak`);
@@ -104,11 +109,17 @@ export async function migrateJsonToSqlite(): Promise<void> {
       logger.info(`Migrating ${ artistList.length } items from catalog_artists.json...`);
 
       for (const artist of artistList) {
-        await CatalogArtist.create({
-          navidromeId:  artist.navidrome_id || artist.id,
-          name:         artist.name,
-          nameLower:    artist.name.toLowerCase(),
-          lastSyncedAt: artist.last_synced_at ? new Date(artist.last_synced_at) : new Date(),
+        const nameLower = artist.name.toLowerCase();
+
+        // name_lower is unique, so names differing only in case are stored once
+        await CatalogArtist.findOrCreate({
+          where:    { nameLower },
+          defaults: {
+            navidromeId:  artist.navidrome_id || artist.id,
+            name:         artist.name,
+            nameLower,
+            lastSyncedAt: artist.last_synced_at ? new Date(artist.last_synced_at) : new Date(),
+          },
         });
       }
 
@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+
+import { parseWishlistLine } from './migrate-wishlist-to-db';
+
+describe('parseWishlistLine', () => {
+  // Expected results match the regex parser this replaced (/^"(.+) - (.+)"$/)
+  const cases: [string, ReturnType<typeof parseWishlistLine>][] = [
+    ['"Artist - Title"', { artist: 'Artist', album: 'Title', type: 'track' }],
+    ['a:"Artist - Album"', { artist: 'Artist', album: 'Album', type: 'album' }],
+    ['  a:"X - Y"  ', { artist: 'X', album: 'Y', type: 'album' }],
+    ['"A - B - C"', { artist: 'A - B', album: 'C', type: 'track' }],
+    ['"A - B - "', { artist: 'A', album: 'B - ', type: 'track' }],
+    ['"a - - b"', { artist: 'a -', album: 'b', type: 'track' }],
+    ['"A  -  B"', { artist: 'A ', album: ' B', type: 'track' }],
+    ['a:"A - \\"B\\""', { artist: 'A', album: '"B"', type: 'album' }],
+    ['a:"\\"A\\" - B"', { artist: '"A"', album: 'B', type: 'album' }],
+    ['', null],
+    ['   ', null],
+    ['a:""', null],
+    ['"A-B"', null],
+    ['" - B"', null],
+    ['"A - "', null],
+    ['" - "', null],
+    ['Artist - Title', null],
+    ['"Artist - Title', null],
+    ['Artist - Title"', null],
+    ['a:Artist - Album', null],
+    ['b:"Artist - Album"', null],
+  ];
+
+  for (const [line, expected] of cases) {
+    it(`parses ${ JSON.stringify(line) }`, () => {
+      expect(parseWishlistLine(line)).toEqual(expected);
+    });
+  }
+});
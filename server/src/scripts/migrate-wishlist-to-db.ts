@@ -12,7 +12,7 @@ import WishlistItem from '@server/models/WishlistItem';
  * Parse a wishlist.txt line into structured data.
  * Format: a:"Artist - Album" for albums, "Artist - Title" for tracks
  */
-function parseWishlistLine(line: string): { artist: string; album: string; type: 'album' | 'track' } | null {
+export function parseWishlistLine(line: string): { artist: string; album: string; type: 'album' | 'track' } | null {
   const trimmed = line.trim();
 
   if (!trimmed) {
@@ -20,20 +20,27 @@ function parseWishlistLine(line: string): { artist: string; album: string; type:
   }
 
   const isAlbum = trimmed.startsWith('a:');
-  const content = isAlbum ? trimmed.slice(2) : trimmed;
+  const start = isAlbum ? 2 : 0;
+  const end = trimmed.length - 1;
 
-  // Parse format: "Artist - Title"
-  const match = content.match(/^"(.+) - (.+)"$/);
+  // Parse format: "Artist - Title", splitting on the last separator
+  if (end <= start || trimmed[start] !== '"' || trimmed[end] !== '"') {
+    return null;
+  }
+
+  // Both sides must be non-empty, so the separator can start no later than end - 4
+  const separator = trimmed.lastIndexOf(' - ', end - 4);
 
-  if (!match) {
+  if (separator < start + 2) {
     return null;
   }
 
-  const [, artist, album] = match;
+  const artist = trimmed.slice(start + 1, separator);
+  const album = trimmed.slice(separator + 3, end);
 
   return {
-    artist: artist.replace(/\\"/g, '"'),
-    album:  album.replace(/\\"/g, '"'),
+    artist: artist.includes('\\"') ? artist.replace(/\\"/g, '"') : artist,
+    album:  album.includes('\\"') ? album.replace(/\\"/g, '"') : album,
     type:   isAlbum ? 'album' : 'track',
   };
 }
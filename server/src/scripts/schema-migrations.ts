@@ -6,9 +6,10 @@ import { sequelize } from '@server/config/db/sequelize';
 /**
  * Schema migrations for existing databases.
  *
- * These migrations add new columns to existing tables. They must run BEFORE
- * sequelize.sync() because sync() may try to create indexes on columns that
- * don't exist yet.
+ * These migrations add new columns to existing tables and turn plain indexes
+ * into unique ones. They must run BEFORE sequelize.sync() because sync() may
+ * try to create indexes on columns that don't exist yet, or unique indexes
+ * over duplicate rows.
  *
  * Each migration is idempotent - safe to run multiple times.
  */
@@ -156,6 +157,27 @@ const COLUMN_MIGRATIONS: ColumnMigration[] = [
   },
 ];
 
+interface UniqueIndexMigration {
+  table:     string;
+  column:    string;
+  index:     string;
+  replaces?: string; // Plain index on the same column, dropped once the unique one exists
+}
+
+/**
+ * Unique indexes to add to existing tables. Duplicate rows are removed first,
+ * keeping the newest row (highest id) for each value.
+ */
+const UNIQUE_INDEX_MIGRATIONS: UniqueIndexMigration[] = [
+  // Catalog sync upserts on name_lower; earlier syncs inserted a new row per artist every run
+  {
+    table:    'catalog_artists',
+    column:   'name_lower',
+    index:    'catalog_artists_name_lower_unique',
+    replaces: 'catalog_artists_name_lower',
+  },
+];
+
 /**
  * Check if a table exists in the database.
  */
@@ -185,6 +207,22 @@ async function columnExists(tableName: string, columnName: string): Promise<bool
   }
 }
 
+/**
+ * Check if an index exists in the database.
+ */
+async function indexExists(indexName: string): Promise<boolean> {
+  try {
+    const [results] = await sequelize.query(
+      `SELECT name FROM sqlite_master WHERE type='index' AND name=?`,
+      { replacements: [indexName] },
+    );
+
+    return (results as { name: string }[]).length > 0;
+  } catch {
+    return false;
+  }
+}
+
 /**
  * Apply all pending schema migrations.
  *
@@ -223,6 +261,40 @@ export async function runSchemaMigrations(): Promise<number> {
     }
   }
 
+  for (const migration of UNIQUE_INDEX_MIGRATIONS) {
+    const {
+      table, column, index, replaces
+    } = migration;
+
+    // Skip if table doesn't exist (sync() will create it with the index)
+    if (!(await tableExists(table))) {
+      logger.debug(`[migrations] Table ${ table } does not exist, skipping ${ index } migration`);
+      continue;
+    }
+
+    // Skip if the unique index already exists
+    if (await indexExists(index)) {
+      logger.debug(`[migrations] Index ${ index } already exists`);
+      continue;
+    }
+
+    // Remove duplicates, then swap the plain index for the unique one
+    try {
+      await sequelize.query(`DELETE FROM ${ table } WHERE id NOT IN (SELECT MAX(id) FROM ${ table } GROUP BY ${ column })`);
+
+      if (replaces) {
+        await sequelize.query(`DROP INDEX IF EXISTS ${ replaces }`);
+      }
+
+      await sequelize.query(`CREATE UNIQUE INDEX ${ index } ON ${ table } (${ column })`);
+      logger.info(`[migrations] Added unique index ${ index } on ${ table }.${ column }`);
+      appliedCount++;
+    } catch(error) {
+      logger.error(`[migrations] Failed to add unique index ${ index }`, { error: (error as Error)?.message ?? String(error) });
+      throw error;
+    }
+  }
+
   if (appliedCount > 0) {
     logger.info(`[migrations] Applied ${ appliedCount } schema migration(s)`);
   } else {
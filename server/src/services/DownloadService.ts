@@ -1,8 +1,6 @@
 import type { ActiveDownload, DownloadStats, ScoredSearchResponse } from '@server/types/downloads';
 import type { SlskdUserTransfers } from '@server/types/slskd-client';
 
-import path from 'path';
-
 import { Op } from '@sequelize/core';
 import logger from '@server/config/logger';
 import { getConfig } from '@server/config/settings';
@@ -23,7 +21,7 @@ import { scoreSearchResponses } from '@server/services/downloads/searchResultSco
 import DownloadTask, { DownloadTaskType, DownloadTaskStatus } from '@server/models/DownloadTask';
 import WishlistItem from '@server/models/WishlistItem';
 import { downloadsNs } from '@server/plugins/io/namespaces';
-import { normalizeSlskdPath } from '@server/utils/slskdPaths';
+import { normalizeSlskdPath, slskdPathDirname } from '@server/utils/slskdPaths';
 import { getDominantQualityInfo } from '@server/utils/audioQuality';
 import { JOB_INTERVALS } from '@server/config/jobs';
 import { JOB_NAMES } from '@server/constants/jobs';
@@ -754,7 +752,7 @@ export class DownloadService {
       return { success: false, error: 'No valid files to download' };
     }
 
-    const selectedDirectory = directory || path.posix.dirname(filesToEnqueue[0].filename.replace(/\\/g, '/'));
+    const selectedDirectory = directory || slskdPathDirname(filesToEnqueue[0].filename);
 
     const enqueueResult = await this.slskdClient.enqueue(username, filesToEnqueue);
 
@@ -0,0 +1,110 @@
+import { Op } from '@sequelize/core';
+import { LRUCache } from 'lru-cache';
+
+import MusicBrainzLookup, { MusicBrainzLookupKind } from '@server/models/MusicBrainzLookup';
+import { withDbWrite } from '@server/config/db';
+import logger from '@server/config/logger';
+import { MB_LOOKUP_TTL_MS } from '@server/constants/clients';
+
+// In-process layer in front of the table, shared by every job run
+const memory = new LRUCache<string, object>({ max: 5000, ttl: MB_LOOKUP_TTL_MS });
+
+function cacheKey(kind: MusicBrainzLookupKind, mbid: string): string {
+  return `${ kind }:${ mbid }`;
+}
+
+/**
+ * MusicBrainzLookupCache stores resolved MusicBrainz recordings by MBID.
+ * Lookups check an in-memory LRU first, then the musicbrainz_lookups table,
+ * so recently resolved MBIDs do not hit the rate-limited API again.
+ * Only successful resolutions are stored; misses are retried next run.
+ * Entries expire after MB_LOOKUP_TTL_MS so recordings that gained a release
+ * (or were edited) on MusicBrainz are picked up again.
+ */
+export class MusicBrainzLookupCache {
+  /**
+   * Return the cached results for the given MBIDs (misses are absent)
+   */
+  async getMany<T extends object>(kind: MusicBrainzLookupKind, mbids: string[]): Promise<Map<string, T>> {
+    const found = new Map<string, T>();
+    const misses: string[] = [];
+
+    for (const mbid of mbids) {
+      const hit = memory.get(cacheKey(kind, mbid));
+
+      if (hit) {
+        found.set(mbid, hit as T);
+      } else {
+        misses.push(mbid);
+      }
+    }
+
+    if (misses.length === 0) {
+      return found;
+    }
+
+    const now = Date.now();
+    const rows = await MusicBrainzLookup.findAll({
+      attributes: ['mbid', 'payload', 'updatedAt'],
+      where:      {
+        kind,
+        mbid:      { [Op.in]: misses },
+        updatedAt: { [Op.gt]: new Date(now - MB_LOOKUP_TTL_MS) },
+      },
+      raw: true,
+    });
+
+    for (const row of rows) {
+      try {
+        const value = JSON.parse(row.payload) as T;
+
+        // Keep the memory copy only for what is left of the row's lifetime
+        const ttl = new Date(row.updatedAt!).getTime() + MB_LOOKUP_TTL_MS - now;
+
+        memory.set(cacheKey(kind, row.mbid), value, { ttl });
+        found.set(row.mbid, value);
+      } catch(error) {
+        logger.warn(`Ignoring unreadable MusicBrainz cache entry for ${ row.mbid }`, { error });
+      }
+    }
+
+    return found;
+  }
+
+  /**
+   * Store freshly resolved results, skipping MBIDs that did not resolve
+   */
+  async setMany<T extends object>(kind: MusicBrainzLookupKind, results: Map<string, T | null>): Promise<void> {
+    const rows: { mbid: string; kind: MusicBrainzLookupKind; payload: string }[] = [];
+
+    for (const [mbid, value] of results) {
+      if (value) {
+        memory.set(cacheKey(kind, mbid), value);
+        rows.push({
+          mbid, kind, payload: JSON.stringify(value)
+        });
+      }
+    }
+
+    if (rows.length === 0) {
+      return;
+    }
+
+    await withDbWrite(() => MusicBrainzLookup.bulkCreate(rows, {
+      conflictAttributes: ['mbid', 'kind'],
+      updateOnDuplicate:  ['payload', 'updatedAt'],
+    }));
+  }
+
+  /**
+   * Delete entries older than MB_LOOKUP_TTL_MS so the table only holds
+   * lookups that can still be served. Returns the number of rows removed.
+   */
+  async pruneExpired(): Promise<number> {
+    const cutoff = new Date(Date.now() - MB_LOOKUP_TTL_MS);
+
+    return withDbWrite(() => MusicBrainzLookup.destroy({ where: { updatedAt: { [Op.lt]: cutoff } } }));
+  }
+}
+
+export default MusicBrainzLookupCache;
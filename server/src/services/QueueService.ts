@@ -1,6 +1,8 @@
-import { Op } from '@sequelize/core';
+import { Op, sql } from '@sequelize/core';
 
-import QueueItem, { QueueItemSource } from '@server/models/QueueItem';
+import QueueItem, {
+  QueueItemCreationAttributes, QueueItemSource, QueueItemStatus,
+} from '@server/models/QueueItem';
 import WishlistService from '@server/services/WishlistService';
 import LibraryService from '@server/services/LibraryService';
 import { getConfig } from '@server/config/settings';
@@ -8,6 +10,75 @@ import { withDbWrite } from '@server/config/db';
 import logger from '@server/config/logger';
 import { queueNs } from '@server/plugins/io/namespaces';
 
+/**
+ * Columns returned by the pending queue listing. Bookkeeping columns
+ * (id, status, timestamps) are never exposed, so they are not selected.
+ */
+const PENDING_ITEM_ATTRIBUTES = [
+  'artist',
+  'album',
+  'title',
+  'mbid',
+  'type',
+  'addedAt',
+  'score',
+  'source',
+  'similarTo',
+  'sourceTrack',
+  'coverUrl',
+  'year',
+  'inLibrary',
+] as const;
+
+/**
+ * Allowed sort keys mapped to model attributes, and sort directions mapped
+ * to SQL keywords, so each request is a lookup rather than string munging
+ */
+const SORT_ATTRIBUTES = {
+  added_at: 'addedAt',
+  score:    'score',
+  artist:   'artist',
+  year:     'year',
+} as const;
+
+const SORT_DIRECTIONS = {
+  asc:  'ASC',
+  desc: 'DESC',
+} as const;
+
+/**
+ * Columns needed to move approved items to the wishlist and notify clients
+ */
+const APPROVE_ITEM_ATTRIBUTES = [
+  'id',
+  'artist',
+  'album',
+  'title',
+  'type',
+  'year',
+  'mbid',
+  'source',
+  'coverUrl',
+] as const;
+
+/**
+ * New recommendation to add to the pending queue
+ */
+export interface PendingQueueItem {
+  artist:       string;
+  album?:       string;
+  title?:       string;
+  mbid:         string;
+  type:         'album' | 'track';
+  score?:       number;
+  source:       QueueItemSource;
+  similarTo?:   string[];
+  sourceTrack?: string;
+  coverUrl?:    string;
+  year?:        number;
+  inLibrary?:   boolean;
+}
+
 /**
  * QueueService manages the pending approval queue.
  * Provides operations for listing, approving, and rejecting recommendations.
@@ -53,13 +124,11 @@ export class QueueService {
       where.inLibrary = { [Op.or]: [{ [Op.eq]: false }, { [Op.eq]: null }] };
     }
 
-    // Map sort field to column name
-    const sortField = sort === 'added_at' ? 'addedAt' : sort;
-
     // Query database
     const { rows, count } = await QueueItem.findAndCountAll({
+      attributes: [...PENDING_ITEM_ATTRIBUTES],
       where,
-      order: [[sortField, order.toUpperCase()]],
+      order:      [[SORT_ATTRIBUTES[sort], SORT_DIRECTIONS[order]]],
       limit,
       offset,
     });
@@ -78,20 +147,56 @@ export class QueueService {
       return 0;
     }
 
-    // Find items to approve
+    // Find items to approve (duplicate MBIDs in the request collapse here
+    // so the IN list scales with distinct items, not with request size)
     const items = await QueueItem.findAll({
-      where: {
-        mbid:   { [Op.in]: mbids },
+      attributes: [...APPROVE_ITEM_ATTRIBUTES],
+      where:      {
+        mbid:   { [Op.in]: Array.from(new Set(mbids)) },
         status: 'pending',
       },
     });
 
+    return this.approveItems(items);
+  }
+
+  /**
+   * Approve all pending items
+   */
+  async approveAll(): Promise<number> {
+    const pendingItems = await QueueItem.findAll({
+      attributes: [...APPROVE_ITEM_ATTRIBUTES],
+      where:      { status: 'pending' },
+    });
+
+    return this.approveItems(pendingItems);
+  }
+
+  /**
+   * Approve already-loaded pending items and move them to the wishlist
+   */
+  private async approveItems(items: QueueItem[]): Promise<number> {
     if (!items.length) {
       return 0;
     }
 
-    // Update status to approved (wrapped in mutex)
+    // Build wishlist items
+    const wishlistItems = items.map(item => ({
+      artist:   item.artist,
+      album:    item.album,
+      title:    item.title,
+      type:     item.type,
+      year:     item.year,
+      mbid:     item.mbid,
+      source:   item.source,
+      coverUrl: item.coverUrl,
+    }));
+
+    // Add to the wishlist and mark approved in one write, wishlist first: if
+    // the insert fails the items are still pending, and a retry is harmless
+    // because processApprovedInWrite skips entries that already exist
     await withDbWrite(async() => {
+      await this.wishlistService.processApprovedInWrite(wishlistItems);
       await QueueItem.update(
         {
           status:      'approved',
@@ -99,28 +204,13 @@ export class QueueService {
         },
         {
           where: {
-            mbid:   { [Op.in]: mbids },
+            id:     { [Op.in]: items.map(item => item.id) },
             status: 'pending',
           },
         }
       );
     });
 
-    // Build wishlist items
-    const wishlistItems = items.map(item => ({
-      artist:   item.artist,
-      album:    item.album,
-      title:    item.title,
-      type:     item.type,
-      year:     item.year,
-      mbid:     item.mbid,
-      source:   item.source,
-      coverUrl: item.coverUrl,
-    }));
-
-    // Add to wishlist (processApproved manages its own mutex per item)
-    await this.wishlistService.processApproved(wishlistItems);
-
     logger.info(`Approved ${ items.length } items`);
 
     // Emit socket events for each approved item
@@ -141,21 +231,6 @@ export class QueueService {
     return items.length;
   }
 
-  /**
-   * Approve all pending items
-   */
-  async approveAll(): Promise<number> {
-    const pendingItems = await QueueItem.findAll({ where: { status: 'pending' } });
-
-    if (!pendingItems.length) {
-      return 0;
-    }
-
-    const mbids = pendingItems.map(item => item.mbid);
-
-    return this.approve(mbids);
-  }
-
   /**
    * Reject items by MBID
    */
@@ -164,6 +239,7 @@ export class QueueService {
       return 0;
     }
 
+    const uniqueMbids = Array.from(new Set(mbids));
     const processedAt = new Date();
 
     const affectedCount = await withDbWrite(async() => {
@@ -174,7 +250,7 @@ export class QueueService {
         },
         {
           where: {
-            mbid:   { [Op.in]: mbids },
+            mbid:   { [Op.in]: uniqueMbids },
             status: 'pending',
           },
         }
@@ -186,7 +262,7 @@ export class QueueService {
     logger.info(`Rejected ${ affectedCount } items`);
 
     // Emit socket events for each rejected item
-    for (const mbid of mbids) {
+    for (const mbid of uniqueMbids) {
       queueNs.emitQueueItemUpdated({
         mbid,
         status: 'rejected',
@@ -210,38 +286,141 @@ export class QueueService {
     rejected:  number;
     inLibrary: number;
   }> {
-    const [pending, approved, rejected, inLibrary] = await Promise.all([
-      QueueItem.count({ where: { status: 'pending' } }),
-      QueueItem.count({ where: { status: 'approved' } }),
-      QueueItem.count({ where: { status: 'rejected' } }),
-      QueueItem.count({ where: { status: 'pending', inLibrary: true } }),
-    ]);
+    // Single grouped scan instead of one COUNT query per status. This runs
+    // after every approve/reject/add, so it is worth keeping to one query.
+    const rows = await QueueItem.findAll({
+      attributes: [
+        'status',
+        [sql.fn('COUNT', sql.col('id')), 'count'],
+        [sql.fn('SUM', sql.col('in_library')), 'inLibraryCount'],
+      ],
+      group: ['status'],
+      raw:   true,
+    }) as unknown as Array<{ status: QueueItemStatus; count: number | string; inLibraryCount: number | string | null }>;
+
+    const byStatus = new Map(rows.map(row => [row.status, row]));
+    const pending = byStatus.get('pending');
 
     return {
-      pending,
-      approved,
-      rejected,
-      inLibrary,
+      pending:   Number(pending?.count ?? 0),
+      approved:  Number(byStatus.get('approved')?.count ?? 0),
+      rejected:  Number(byStatus.get('rejected')?.count ?? 0),
+      inLibrary: Number(pending?.inLibraryCount ?? 0),
     };
   }
 
   /**
    * Add a new item to the pending queue
    */
-  async addPending(item: {
-    artist:       string;
-    album?:       string;
-    title?:       string;
-    mbid:         string;
-    type:         'album' | 'track';
-    score?:       number;
-    source:       QueueItemSource;
-    similarTo?:   string[];
-    sourceTrack?: string;
-    coverUrl?:    string;
-    year?:        number;
-    inLibrary?:   boolean;
-  }): Promise<QueueItem> {
+  async addPending(item: PendingQueueItem): Promise<QueueItem> {
+    const row = await this.toQueueRow(item, new Date());
+    const queueItem = await withDbWrite(() => QueueItem.create(row));
+
+    if (row.status === 'rejected') {
+      logger.info(`Auto-rejected duplicate: ${ item.artist } - ${ item.album || item.title }`);
+
+      return queueItem;
+    }
+
+    logger.info(`Added to pending queue: ${ item.artist } - ${ item.album || item.title }${ row.inLibrary ? ' (in library)' : '' }`);
+
+    queueNs.emitQueueItemAdded({ item: queueItem });
+
+    const stats = await this.getStats();
+
+    queueNs.emitQueueStatsUpdated(stats);
+
+    return queueItem;
+  }
+
+  /**
+   * Add several items to the pending queue with one write and one stats
+   * broadcast. Items whose MBID is already queued (in any status) are skipped.
+   * Returns the number of items written.
+   */
+  async addPendingMany(items: PendingQueueItem[]): Promise<number> {
+    if (items.length === 0) {
+      return 0;
+    }
+
+    // Drop already-queued MBIDs up front so they skip the library lookup below
+    const queued = await this.findQueuedMbids(items.map((item) => item.mbid));
+    const seen = new Set(queued);
+    const addedAt = new Date();
+    const rows: QueueItemCreationAttributes[] = [];
+
+    for (const item of items) {
+      if (seen.has(item.mbid)) {
+        continue;
+      }
+
+      seen.add(item.mbid);
+      rows.push(await this.toQueueRow(item, addedAt));
+    }
+
+    if (rows.length === 0) {
+      return 0;
+    }
+
+    // Check again under the write lock: another writer may have queued some of
+    // these MBIDs while the rows were being built
+    const written = await withDbWrite(async() => {
+      const taken = new Set(await this.findQueuedMbids(rows.map((row) => row.mbid)));
+      const fresh = rows.filter((row) => !taken.has(row.mbid));
+
+      if (fresh.length > 0) {
+        await QueueItem.bulkCreate(fresh, { ignoreDuplicates: true });
+      }
+
+      return fresh;
+    });
+
+    if (written.length === 0) {
+      return 0;
+    }
+
+    // Re-read the rows this call wrote so clients receive them with their ids
+    const added = await QueueItem.findAll({
+      where: {
+        mbid: { [Op.in]: written.map((row) => row.mbid) },
+        addedAt,
+      },
+    });
+
+    for (const queueItem of added) {
+      if (queueItem.status === 'rejected') {
+        logger.info(`Auto-rejected duplicate: ${ queueItem.artist } - ${ queueItem.album || queueItem.title }`);
+      } else {
+        logger.info(`Added to pending queue: ${ queueItem.artist } - ${ queueItem.album || queueItem.title }${ queueItem.inLibrary ? ' (in library)' : '' }`);
+        queueNs.emitQueueItemAdded({ item: queueItem });
+      }
+    }
+
+    const stats = await this.getStats();
+
+    queueNs.emitQueueStatsUpdated(stats);
+
+    return added.length;
+  }
+
+  /**
+   * MBIDs from the given list that already have a queue row
+   */
+  private async findQueuedMbids(mbids: string[]): Promise<string[]> {
+    const existing = await QueueItem.findAll({
+      attributes: ['mbid'],
+      where:      { mbid: { [Op.in]: mbids } },
+      raw:        true,
+    });
+
+    return existing.map((row) => row.mbid);
+  }
+
+  /**
+   * Build the row for a new queue item, applying the library duplicate check
+   * (and auto-reject) when enabled
+   */
+  private async toQueueRow(item: PendingQueueItem, addedAt: Date): Promise<QueueItemCreationAttributes> {
     const config = getConfig();
     const libraryDuplicateEnabled = config.library_duplicate?.enabled ?? false;
     const autoReject = config.library_duplicate?.auto_reject ?? false;
@@ -255,35 +434,49 @@ export class QueueService {
 
     // Auto-reject if configured and item is in library
     if (autoReject && inLibrary) {
-      const queueItem = await withDbWrite(() => QueueItem.create({
+      return {
         ...item,
         inLibrary,
         status:      'rejected',
-        addedAt:     new Date(),
-        processedAt: new Date(),
-      }));
-
-      logger.info(`Auto-rejected duplicate: ${ item.artist } - ${ item.album || item.title }`);
-
-      return queueItem;
+        addedAt,
+        processedAt: addedAt,
+      };
     }
 
-    const queueItem = await withDbWrite(() => QueueItem.create({
+    return {
       ...item,
       inLibrary: inLibrary ?? false,
       status:    'pending',
-      addedAt:   new Date(),
-    }));
-
-    logger.info(`Added to pending queue: ${ item.artist } - ${ item.album || item.title }${ inLibrary ? ' (in library)' : '' }`);
+      addedAt,
+    };
+  }
 
-    queueNs.emitQueueItemAdded({ item: queueItem });
+  /**
+   * Return which of the given MBIDs are already in the pending queue,
+   * with one query instead of an isPending() call per MBID
+   */
+  async getPendingMbids(mbids: string[]): Promise<Set<string>> {
+    return this.getMbidsByStatus(mbids, ['pending']);
+  }
 
-    const stats = await this.getStats();
+  /**
+   * Return which of the given MBIDs are queued with one of the given statuses
+   */
+  async getMbidsByStatus(mbids: string[], statuses: QueueItemStatus[]): Promise<Set<string>> {
+    if (mbids.length === 0) {
+      return new Set();
+    }
 
-    queueNs.emitQueueStatsUpdated(stats);
+    const rows = await QueueItem.findAll({
+      attributes: ['mbid'],
+      where:      {
+        mbid:   { [Op.in]: mbids },
+        status: { [Op.in]: statuses },
+      },
+      raw:        true,
+    });
 
-    return queueItem;
+    return new Set(rows.map((row) => row.mbid));
   }
 
   /**
@@ -291,10 +484,12 @@ export class QueueService {
    */
   async isRejected(mbid: string): Promise<boolean> {
     const item = await QueueItem.findOne({
-      where: {
+      attributes: ['id'],
+      where:      {
         mbid,
         status: 'rejected',
       },
+      raw:        true,
     });
 
     return item !== null;
@@ -305,10 +500,12 @@ export class QueueService {
    */
   async isPending(mbid: string): Promise<boolean> {
     const item = await QueueItem.findOne({
-      where: {
+      attributes: ['id'],
+      where:      {
         mbid,
         status: 'pending',
       },
+      raw:        true,
     });
 
     return item !== null;
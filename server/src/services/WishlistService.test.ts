@@ -0,0 +1,76 @@
+import type { ProcessApprovedItem } from '@server/types/wishlist';
+
+import {
+  describe, it, expect, vi, beforeEach
+} from 'vitest';
+import { Op } from '@sequelize/core';
+
+vi.mock('@server/config/db', () => ({ withDbWrite: vi.fn((operation: () => Promise<unknown>) => operation()) }));
+
+vi.mock('@server/models/WishlistItem', () => ({
+  default: {
+    findAll:    vi.fn(),
+    bulkCreate: vi.fn(),
+  },
+}));
+
+vi.mock('@server/models/DownloadTask', () => ({ default: {} }));
+
+import WishlistItem from '@server/models/WishlistItem';
+import { WishlistService } from './WishlistService';
+
+const mockFindAll = vi.mocked(WishlistItem.findAll);
+const mockBulkCreate = vi.mocked(WishlistItem.bulkCreate);
+
+type Term = { artist: string; album: string; type: string };
+
+function approvedItems(count: number): ProcessApprovedItem[] {
+  return Array.from({ length: count }, (_, i) => ({
+    artist: `Artist ${ i }`,
+    album:  `Album ${ i }`,
+    type:   'album',
+    source: 'listenbrainz',
+  }));
+}
+
+describe('WishlistService.processApprovedInWrite', () => {
+  const service = new WishlistService();
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    // Every third approved item is already on the wishlist
+    mockFindAll.mockImplementation((async(options: { where: { [Op.or]: Term[] } }) => options.where[Op.or]
+      .filter((term) => Number(term.artist.split(' ')[1]) % 3 === 0)) as never);
+    mockBulkCreate.mockResolvedValue([] as never);
+  });
+
+  it('approves more than 1000 items using bounded OR lookups', async() => {
+    const added = await service.processApprovedInWrite(approvedItems(1200));
+
+    const lookups = mockFindAll.mock.calls.map(([options]) => (options as { where: { [Op.or]: Term[] } }).where[Op.or]);
+
+    expect(lookups).toHaveLength(3);
+    expect(lookups.every((terms) => terms.length <= 500)).toBe(true);
+    expect(lookups.flat()).toHaveLength(1200);
+
+    const inserted = mockBulkCreate.mock.calls.flatMap(([rows]) => rows as Term[]);
+
+    expect(mockBulkCreate.mock.calls.every(([rows]) => (rows as Term[]).length <= 500)).toBe(true);
+    expect(inserted).toHaveLength(800);
+    expect(added).toBe(800);
+  });
+
+  it('skips duplicates within the batch and items without a title', async() => {
+    const items = [
+      { artist: 'Artist 1', album: 'Album 1' },
+      { artist: 'Artist 1', album: 'Album 1' },
+      { artist: 'Artist 2' },
+    ] as ProcessApprovedItem[];
+
+    const added = await service.processApprovedInWrite(items);
+
+    expect(added).toBe(1);
+    expect(mockBulkCreate).toHaveBeenCalledTimes(1);
+    expect(mockBulkCreate.mock.calls[0][0]).toHaveLength(1);
+  });
+});
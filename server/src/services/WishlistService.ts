@@ -9,12 +9,31 @@ import type {
   ImportResultItem,
 } from '@server/types/wishlist';
 
-import { Op } from '@sequelize/core';
+import { Op, UniqueConstraintError } from '@sequelize/core';
 import logger from '@server/config/logger';
 import { withDbWrite } from '@server/config/db';
 import WishlistItem, { WishlistItemSource, WishlistItemType } from '@server/models/WishlistItem';
 import DownloadTask from '@server/models/DownloadTask';
 
+// Max (artist, album, type) terms per OR lookup and rows per insert; SQLite
+// rejects expression trees deeper than 1000, so stay well below that
+const WISHLIST_BATCH_SIZE = 500;
+
+interface NewWishlistRow {
+  artist:    string;
+  album:     string;
+  type:      WishlistItemType;
+  year?:     number;
+  mbid?:     string;
+  source:    WishlistItemSource;
+  coverUrl?: string;
+  addedAt:   Date;
+}
+
+function wishlistRowKey(row: { artist: string; album: string; type: string }): string {
+  return `${ row.artist }:::${ row.album }:::${ row.type }`;
+}
+
 /**
  * WishlistService manages wishlist items in the database.
  * Replaces the file-based wishlist.txt approach.
@@ -89,6 +108,24 @@ export class WishlistService {
     logger.debug(`Marked wishlist item ${ id } as processed`);
   }
 
+  /**
+   * Mark several wishlist items as processed in one update
+   */
+  async markProcessedMany(ids: string[]): Promise<number> {
+    if (!ids.length) {
+      return 0;
+    }
+
+    const [affected] = await withDbWrite(() => WishlistItem.update(
+      { processedAt: new Date() },
+      { where: { id: { [Op.in]: ids } } }
+    ));
+
+    logger.debug(`Marked ${ affected } wishlist items as processed`);
+
+    return affected;
+  }
+
   /**
    * Append a single entry to the wishlist.
    * Returns the created or existing WishlistItem.
@@ -98,17 +135,10 @@ export class WishlistService {
       artist, album, type, year, mbid, source, coverUrl
     } = options;
 
-    return withDbWrite(async() => {
-      // Check inside mutex to prevent race between read and write
-      const existing = await this.findByArtistAlbum(artist, album, type);
-
-      if (existing) {
-        logger.debug(`Wishlist item already exists: ${ artist } - ${ album }`);
-
-        return existing;
-      }
-
-      const wishlistItem = await WishlistItem.create({
+    // The (artist, album, type) unique index already rejects duplicates atomically,
+    // so insert directly and only read the existing row when the insert conflicts
+    try {
+      const wishlistItem = await withDbWrite(() => WishlistItem.create({
         artist,
         album,
         type,
@@ -117,24 +147,54 @@ export class WishlistService {
         source:  source ?? 'manual',
         coverUrl,
         addedAt: new Date(),
-      });
+      }));
 
       logger.info(`Added to wishlist: ${ artist } - ${ album }`);
 
       return wishlistItem;
-    });
+    } catch(error) {
+      if (!(error instanceof UniqueConstraintError)) {
+        throw error;
+      }
+
+      const existing = await this.findByArtistAlbum(artist, album, type);
+
+      if (!existing) {
+        throw error;
+      }
+
+      logger.debug(`Wishlist item already exists: ${ artist } - ${ album }`);
+
+      return existing;
+    }
   }
 
   /**
-   * Process approved queue items and add them to wishlist.
-   * Returns the number of items added.
+   * Add approved queue items to the wishlist and return the number added.
+   * Callers must hold the write mutex (withDbWrite is not re-entrant), so the
+   * wishlist insert happens in the same write as their own queue updates.
    */
-  async processApproved(items: ProcessApprovedItem[]): Promise<number> {
-    if (!items.length) {
+  async processApprovedInWrite(items: ProcessApprovedItem[]): Promise<number> {
+    const rows = this.buildApprovedRows(items);
+
+    if (!rows.length) {
       return 0;
     }
 
-    let count = 0;
+    const created = await this.insertNew(rows);
+
+    this.logAdded(created);
+
+    return created.length;
+  }
+
+  /**
+   * Validate and format approved items into wishlist rows.
+   * Every item approved in one call shares one timestamp.
+   */
+  private buildApprovedRows(items: ProcessApprovedItem[]): NewWishlistRow[] {
+    const addedAt = new Date();
+    const rows: NewWishlistRow[] = [];
 
     for (const item of items) {
       const artist = item.artist;
@@ -159,39 +219,84 @@ export class WishlistService {
         continue;
       }
 
-      const type: WishlistItemType = isAlbum ? 'album' : 'track';
+      rows.push({
+        artist,
+        album,
+        type:     isAlbum ? 'album' : 'track',
+        year:     item.year,
+        mbid:     item.mbid,
+        source:   (item.source as WishlistItemSource) ?? 'manual',
+        coverUrl: item.coverUrl,
+        addedAt,
+      });
+    }
 
-      // Check and create inside mutex to prevent race between read and write
-      const added = await withDbWrite(async() => {
-        const existing = await this.findByArtistAlbum(artist, album, type);
+    return rows;
+  }
 
-        if (existing) {
-          logger.debug(`Wishlist item already exists: ${ artist } - ${ album }`);
+  /**
+   * Insert the rows that are not already on the wishlist (or repeated within
+   * the batch). Must run inside withDbWrite.
+   */
+  private async insertNew(rows: NewWishlistRow[]): Promise<NewWishlistRow[]> {
+    const existingKeys = await this.findExistingKeys(rows);
+    const newRows = rows.filter((row) => {
+      const key = wishlistRowKey(row);
 
-          return false;
-        }
+      if (existingKeys.has(key)) {
+        logger.debug(`Wishlist item already exists: ${ row.artist } - ${ row.album }`);
+
+        return false;
+      }
+
+      // Avoid duplicates within the batch itself
+      existingKeys.add(key);
+
+      return true;
+    });
+
+    for (let start = 0; start < newRows.length; start += WISHLIST_BATCH_SIZE) {
+      await WishlistItem.bulkCreate(newRows.slice(start, start + WISHLIST_BATCH_SIZE));
+    }
+
+    return newRows;
+  }
 
-        await WishlistItem.create({
-          artist,
-          album,
-          type,
-          year:     item.year,
-          mbid:     item.mbid,
-          source:   (item.source as WishlistItemSource) ?? 'manual',
-          coverUrl: item.coverUrl,
-          addedAt:  new Date(),
-        });
-
-        return true;
+  /**
+   * Keys of the given (artist, album, type) combinations that already exist.
+   * The OR lookup is chunked because SQLite caps expression depth at 1000.
+   */
+  private async findExistingKeys(rows: Array<{ artist: string; album: string; type: WishlistItemType }>): Promise<Set<string>> {
+    const keys = new Set<string>();
+
+    for (let start = 0; start < rows.length; start += WISHLIST_BATCH_SIZE) {
+      const existing = await WishlistItem.findAll({
+        where: {
+          [Op.or]: rows.slice(start, start + WISHLIST_BATCH_SIZE).map((row) => ({
+            artist: row.artist,
+            album:  row.album,
+            type:   row.type,
+          })),
+        },
+        attributes: ['artist', 'album', 'type'],
       });
 
-      if (added) {
-        count++;
-        logger.info(`Added to wishlist: ${ artist } - ${ album }`);
+      for (const item of existing) {
+        keys.add(wishlistRowKey(item));
       }
     }
 
-    return count;
+    return keys;
+  }
+
+  private logAdded(created: NewWishlistRow[]): void {
+    if (created.length > 0) {
+      logger.info(`Added ${ created.length } items to wishlist`);
+
+      for (const item of created) {
+        logger.debug(`Added to wishlist: ${ item.artist } - ${ item.album }`);
+      }
+    }
   }
 
   /**
@@ -496,22 +601,8 @@ export class WishlistService {
     }));
 
     return withDbWrite(async() => {
-      // Find all existing items matching any of the imports in a single query
-      const existing = await WishlistItem.findAll({
-        where: {
-          [Op.or]: normalized.map((n) => ({
-            artist: n.artist,
-            album:  n.album,
-            type:   n.type,
-          })),
-        },
-        attributes: ['artist', 'album', 'type'],
-      });
-
-      // Build set of existing keys for O(1) lookup
-      const existingKeys = new Set(
-        existing.map((e) => `${ e.artist }:::${ e.album }:::${ e.type }`)
-      );
+      // Set of existing keys for O(1) lookup (chunked lookups, see findExistingKeys)
+      const existingKeys = await this.findExistingKeys(normalized);
 
       // Separate new items from duplicates
       const results: ImportResultItem[] = [];
@@ -528,7 +619,7 @@ export class WishlistService {
       const now = new Date();
 
       for (const item of normalized) {
-        const key = `${ item.artist }:::${ item.album }:::${ item.type }`;
+        const key = wishlistRowKey(item);
 
         if (existingKeys.has(key)) {
           results.push({
@@ -6,10 +6,20 @@ import type {
   ListenBrainzSimilarArtist,
 } from '@server/types/listenbrainz';
 
+import https from 'https';
 import axios from 'axios';
 import logger from '@server/config/logger';
 import { LB_BASE_URL } from '@server/constants/clients';
 
+/**
+ * Shared HTTP client for ListenBrainz (API and Labs) calls, so a fetch run
+ * reuses pooled keep-alive connections instead of per-call defaults.
+ */
+const lbHttp = axios.create({
+  timeout:    30000,
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 4 }),
+});
+
 /**
  * ListenBrainzClient provides access to ListenBrainz recommendation API.
  * https://api.listenbrainz.org/
@@ -26,10 +36,9 @@ export class ListenBrainzClient {
     const url = `${ LB_BASE_URL }/cf/recommendation/user/${ username }/recording`;
 
     try {
-      const response = await axios.get(url, {
+      const response = await lbHttp.get(url, {
         headers: { Authorization: `Token ${ token }` },
         params:  { count },
-        timeout: 30000,
       });
 
       if (response.status === 204) {
@@ -64,10 +73,7 @@ export class ListenBrainzClient {
     const url = `${ LB_BASE_URL }/user/${ username }/playlists/createdfor`;
 
     try {
-      const response = await axios.get<ListenBrainzPlaylistsCreatedForResponse>(url, {
-        params:  { count },
-        timeout: 30000,
-      });
+      const response = await lbHttp.get<ListenBrainzPlaylistsCreatedForResponse>(url, { params: { count } });
 
       return response.data.playlists.map((p) => p.playlist);
     } catch(error) {
@@ -89,7 +95,7 @@ export class ListenBrainzClient {
     const url = `${ LB_BASE_URL }/playlist/${ playlistMbid }`;
 
     try {
-      const response = await axios.get<ListenBrainzPlaylistResponse>(url, { timeout: 30000 });
+      const response = await lbHttp.get<ListenBrainzPlaylistResponse>(url);
 
       return response.data;
     } catch(error) {
@@ -126,10 +132,7 @@ export class ListenBrainzClient {
     const url = 'https://labs.api.listenbrainz.org/similar-artists/json';
 
     try {
-      const response = await axios.post(url, [{ artist_mbid: artistMbid }], {
-        headers: { 'Content-Type': 'application/json' },
-        timeout: 30000,
-      });
+      const response = await lbHttp.post(url, [{ artist_mbid: artistMbid }], { headers: { 'Content-Type': 'application/json' } });
 
       // Response is an array where each element corresponds to an input artist
       const data = response.data;
@@ -1,7 +1,7 @@
 import { describe, it, expect, afterEach } from 'vitest';
 import nock from 'nock';
 
-import { MusicBrainzClient } from './MusicBrainzClient';
+import { MusicBrainzClient, toAlbumInfo } from './MusicBrainzClient';
 
 describe('MusicBrainzClient', () => {
   const client = new MusicBrainzClient();
@@ -143,6 +143,124 @@ describe('MusicBrainzClient', () => {
     });
   });
 
+  describe('summarizeRecordings', () => {
+    it('resolves several recordings with a single search request', async() => {
+      nock('https://musicbrainz.org')
+        .get('/ws/2/recording')
+        .query({ query: 'rid:(rec-1 OR rec-2)', limit: '2', fmt: 'json' })
+        .reply(200, {
+          recordings: [
+            {
+              'id':            'rec-2',
+              'title':         'Second Track',
+              'artist-credit': [{ artist: { name: 'Artist Two' } }],
+              'releases':      [],
+            },
+            {
+              'id':            'rec-1',
+              'title':         'First Track',
+              'artist-credit': [{ artist: { name: 'Artist One' } }],
+              'releases':      [
+                {
+                  'id':            'release-1',
+                  'date':          '2001-05-01',
+                  'release-group': {
+                    'id':           'rg-1',
+                    'title':        'First Album',
+                    'primary-type': 'Album',
+                  },
+                },
+              ],
+            },
+          ],
+        });
+
+      const result = await client.summarizeRecordings(['rec-1', 'rec-2']);
+
+      expect(result.get('rec-1')).toEqual({
+        mbid:    'rec-1',
+        artist:  'Artist One',
+        title:   'First Track',
+        release: {
+          releaseGroupMbid: 'rg-1',
+          title:            'First Album',
+          year:             2001,
+        },
+      });
+      expect(result.get('rec-2')).toEqual({
+        mbid:   'rec-2',
+        artist: 'Artist Two',
+        title:  'Second Track',
+      });
+      expect(nock.isDone()).toBe(true);
+    });
+
+    it('looks up recordings missing from the search result one by one', async() => {
+      nock('https://musicbrainz.org')
+        .get('/ws/2/recording')
+        .query({ query: 'rid:(rec-1 OR rec-2)', limit: '2', fmt: 'json' })
+        .reply(200, {
+          recordings: [
+            {
+              'id':            'rec-1',
+              'title':         'First Track',
+              'artist-credit': [{ artist: { name: 'Artist One' } }],
+            },
+          ],
+        })
+        .get('/ws/2/recording/rec-2')
+        .query({ inc: 'artists+releases+release-groups', fmt: 'json' })
+        .reply(404);
+
+      const result = await client.summarizeRecordings(['rec-1', 'rec-2']);
+
+      expect(result.get('rec-1')?.title).toBe('First Track');
+      expect(result.has('rec-2')).toBe(true);
+      expect(result.get('rec-2')).toBeNull();
+      expect(nock.isDone()).toBe(true);
+    });
+
+    it('picks the same album and year as a single lookup', async() => {
+      const recording = { 'title': 'Track', 'artist-credit': [{ artist: { name: 'Artist' } }] };
+      const original = { 'id': 'rg-original', 'title': 'Original Album', 'primary-type': 'Album' };
+      const compilation = { 'id': 'rg-best-of', 'title': 'Best Of', 'primary-type': 'Album', 'secondary-types': ['Compilation'] };
+
+      // Lookups carry first-release-date; search results only carry release dates, in another order
+      nock('https://musicbrainz.org')
+        .get('/ws/2/recording/rec-1')
+        .query({ inc: 'artists+releases+release-groups', fmt: 'json' })
+        .reply(200, {
+          ...recording,
+          id:       'rec-1',
+          releases: [
+            { 'id': 'best-of', 'date': '2010-01-01', 'release-group': { ...compilation, 'first-release-date': '2010-01-01' } },
+            { 'id': 'reissue', 'date': '2005-06-01', 'release-group': { ...original, 'first-release-date': '1999-03-01' } },
+            { 'id': 'first-press', 'date': '1999-03-01', 'release-group': { ...original, 'first-release-date': '1999-03-01' } },
+          ],
+        })
+        .get('/ws/2/recording')
+        .query({ query: 'rid:(rec-1)', limit: '1', fmt: 'json' })
+        .reply(200, {
+          recordings: [{
+            ...recording,
+            id:       'rec-1',
+            releases: [
+              { 'id': 'reissue', 'date': '2005-06-01', 'release-group': original },
+              { 'id': 'best-of', 'date': '2010-01-01', 'release-group': compilation },
+              { 'id': 'first-press', 'date': '1999-03-01', 'release-group': original },
+            ],
+          }],
+        });
+
+      const lookedUp = await client.resolveRecordingToAlbum('rec-1');
+      const batched = await client.summarizeRecordings(['rec-1']);
+
+      expect(lookedUp).toMatchObject({ mbid: 'rg-original', year: 1999 });
+      expect(toAlbumInfo(batched.get('rec-1')!)).toEqual(lookedUp);
+      expect(nock.isDone()).toBe(true);
+    });
+  });
+
   describe('getExpectedTrackCount', () => {
     it('returns track count from a single release', async() => {
       const mbid = 'rg-single';
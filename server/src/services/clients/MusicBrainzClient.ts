@@ -2,14 +2,56 @@ import type { AlbumSearchResult, ArtistSearchResult, RecordingSearchResult } fro
 import type {
   AlbumInfo,
   RecordingInfo,
+  RecordingSummary,
   ReleaseGroup,
   ReleaseGroupTrack,
   SearchResults,
 } from '@server/types/musicbrainz';
 
+import https from 'https';
 import axios from 'axios';
 import logger from '@server/config/logger';
-import { MB_BASE_URL, MB_USER_AGENT } from '@server/constants/clients';
+import { mapWithConcurrency } from '@server/utils/concurrency';
+import {
+  MB_BASE_URL, MB_BULK_LOOKUP_SIZE, MB_LOOKUP_CONCURRENCY, MB_RATE_LIMIT_MS, MB_USER_AGENT,
+} from '@server/constants/clients';
+
+/**
+ * Shared HTTP client for every MusicBrainz call: one pooled keep-alive agent
+ * (MusicBrainz allows ~1 req/s, so a handful of sockets is plenty) and the
+ * required User-Agent and timeout configured once instead of per request.
+ */
+const mbHttp = axios.create({
+  headers:    { 'User-Agent': MB_USER_AGENT },
+  timeout:    15000,
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 4 }),
+});
+
+/**
+ * Start time of the next MusicBrainz request. Slots are handed out
+ * MB_RATE_LIMIT_MS apart from request start to request start, shared by
+ * every client instance, so concurrent lookups stay within the limit.
+ * MusicBrainz limits per client IP, so interactive searches share these
+ * slots with background jobs and can wait behind them. Callers should not
+ * add their own delays on top.
+ */
+let nextRequestAt = 0;
+
+function waitForRequestSlot(): Promise<void> {
+  const now = Date.now();
+  const slot = Math.max(now, nextRequestAt);
+
+  nextRequestAt = slot + MB_RATE_LIMIT_MS;
+
+  return sleep(slot - now);
+}
+
+// Every request made through mbHttp waits for its slot, whichever method sends it
+mbHttp.interceptors.request.use(async(config) => {
+  await waitForRequestSlot();
+
+  return config;
+});
 
 /**
  * MusicBrainzClient provides access to MusicBrainz metadata API.
@@ -21,172 +63,115 @@ export class MusicBrainzClient {
    * Resolve a recording MBID to artist + title + release-group MBID
    */
   async resolveRecording(mbid: string): Promise<RecordingInfo | null> {
-    const url = `${ MB_BASE_URL }/recording/${ mbid }`;
-
-    try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
-          inc: 'artists+releases+release-groups',
-          fmt: 'json',
-        },
-        timeout: 15000,
-      });
+    const summary = await this.fetchRecordingSummary(mbid);
 
-      const data = response.data;
+    return summary ? toRecordingInfo(summary) : null;
+  }
 
-      // Extract artists
-      const artists: string[] = [];
+  /**
+   * Resolve a recording MBID to its parent album (release-group)
+   */
+  async resolveRecordingToAlbum(mbid: string): Promise<AlbumInfo | null> {
+    const summary = await this.fetchRecordingSummary(mbid);
 
-      for (const credit of data['artist-credit'] || []) {
-        if (credit.artist) {
-          artists.push(credit.artist.name);
-        }
-      }
+    return summary ? toAlbumInfo(summary) : null;
+  }
 
-      const artist = artists.join(' & ');
-      const title = data.title;
+  /**
+   * Resolve many recording MBIDs to compact summaries that serve both track
+   * and album mode (see toRecordingInfo() / toAlbumInfo()). This is the shape
+   * callers should cache.
+   *
+   * Requests are batched: one search request per MB_BULK_LOOKUP_SIZE MBIDs
+   * (`rid:(a OR b ...)`). Any recording the search index does not return is
+   * resolved with a single lookup instead. Up to MB_LOOKUP_CONCURRENCY
+   * requests are in flight at once; the mbHttp rate limiter still starts them
+   * at most one per MB_RATE_LIMIT_MS, so waiting on one response does not
+   * delay the next request.
+   */
+  async summarizeRecordings(mbids: string[]): Promise<Map<string, RecordingSummary | null>> {
+    const results = new Map<string, RecordingSummary | null>();
+    const chunks: string[][] = [];
 
-      // Extract release-group MBID for cover art
-      let releaseGroupMbid: string | undefined;
-      const releases = data.releases || [];
+    for (let start = 0; start < mbids.length; start += MB_BULK_LOOKUP_SIZE) {
+      chunks.push(mbids.slice(start, start + MB_BULK_LOOKUP_SIZE));
+    }
 
-      if (releases.length > 0) {
-        // Prefer official albums over singles/EPs/compilations
-        let bestRelease = null;
+    await mapWithConcurrency(chunks, MB_LOOKUP_CONCURRENCY, async(chunk) => {
+      const recordings = await this.searchRecordingsById(chunk);
 
-        for (const release of releases) {
-          const rg = release['release-group'] || {};
-          const primaryType = rg['primary-type'] || '';
+      for (const mbid of chunk) {
+        const data = recordings.get(mbid);
 
-          if (primaryType === 'Album') {
-            bestRelease = release;
-            break;
-          }
+        if (data) {
+          results.set(mbid, summarizeRecording(mbid, data));
         }
+      }
+    });
 
-        // Fall back to first release if no album found
-        if (!bestRelease) {
-          bestRelease = releases[0];
-        }
+    const misses = mbids.filter((mbid) => !results.has(mbid));
 
-        const rg = bestRelease['release-group'] || {};
+    await mapWithConcurrency(misses, MB_LOOKUP_CONCURRENCY, async(mbid) => {
+      results.set(mbid, await this.fetchRecordingSummary(mbid));
+    });
 
-        releaseGroupMbid = rg.id;
-      }
+    return results;
+  }
 
-      if (artist && title) {
-        return {
-          artist,
-          title,
-          mbid,
-          releaseGroupMbid,
-        };
+  /**
+   * Fetch raw recordings by MBID through the search API, keyed by MBID.
+   * Search results carry artist credits and releases with their release-groups,
+   * which is everything the resolvers read.
+   */
+  private async searchRecordingsById(mbids: string[]): Promise<Map<string, any>> {
+    const url = `${ MB_BASE_URL }/recording`;
+    const recordings = new Map<string, any>();
+
+    try {
+      const response = await mbHttp.get(url, {
+        params: {
+          query: `rid:(${ mbids.join(' OR ') })`,
+          limit: mbids.length,
+          fmt:   'json',
+        },
+      });
+
+      for (const recording of response.data.recordings || []) {
+        if (recording.id) {
+          recordings.set(recording.id, recording);
+        }
       }
     } catch(error) {
       if (axios.isAxiosError(error)) {
-        logger.error(`Failed to resolve recording ${ mbid }: ${ error.message }`);
+        logger.error(`Failed to look up ${ mbids.length } recordings: ${ error.message }`);
       } else {
-        logger.error(`Failed to resolve recording ${ mbid }: ${ String(error) }`);
+        logger.error(`Failed to look up ${ mbids.length } recordings: ${ String(error) }`);
       }
     }
 
-    return null;
+    return recordings;
   }
 
   /**
-   * Resolve a recording MBID to its parent album (release-group)
+   * Look up a single recording and reduce it to its summary
    */
-  async resolveRecordingToAlbum(mbid: string): Promise<AlbumInfo | null> {
+  private async fetchRecordingSummary(mbid: string): Promise<RecordingSummary | null> {
     const url = `${ MB_BASE_URL }/recording/${ mbid }`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           inc: 'artists+releases+release-groups',
           fmt: 'json',
         },
-        timeout: 15000,
       });
 
-      const data = response.data;
-
-      // Extract artists
-      const artists: string[] = [];
-
-      for (const credit of data['artist-credit'] || []) {
-        if (credit.artist) {
-          artists.push(credit.artist.name);
-        }
-      }
-
-      const artist = artists.join(' & ');
-
-      if (!artist) {
-        return null;
-      }
-
-      const trackTitle = data.title || '';
-
-      // Get releases
-      const releases = data.releases || [];
-
-      if (!releases.length) {
-        logger.debug(`Recording ${ mbid } has no releases`);
-
-        return null;
-      }
-
-      // Prefer official albums over singles/EPs/compilations
-      let albumRelease = null;
-
-      for (const release of releases) {
-        const rg = release['release-group'] || {};
-        const primaryType = rg['primary-type'] || '';
-
-        if (primaryType === 'Album') {
-          albumRelease = release;
-          break;
-        }
-      }
-
-      // Fall back to first release if no album found
-      if (!albumRelease) {
-        albumRelease = releases[0];
-      }
-
-      const rg = albumRelease['release-group'] || {};
-      const rgMbid = rg.id;
-      const albumTitle = rg.title || albumRelease.title;
-
-      // Extract year from first-release-date
-      let year: number | undefined;
-      const releaseDate = rg['first-release-date'] || albumRelease.date || '';
-
-      if (releaseDate && releaseDate.length >= 4) {
-        const parsedYear = parseInt(releaseDate.substring(0, 4), 10);
-
-        if (!isNaN(parsedYear)) {
-          year = parsedYear;
-        }
-      }
-
-      if (rgMbid && albumTitle) {
-        return {
-          artist,
-          title:         albumTitle,
-          mbid:          rgMbid,
-          recordingMbid: mbid,
-          trackTitle,
-          year,
-        };
-      }
+      return summarizeRecording(mbid, response.data);
     } catch(error) {
       if (axios.isAxiosError(error)) {
-        logger.error(`Failed to resolve recording ${ mbid } to album: ${ error.message }`);
+        logger.error(`Failed to resolve recording ${ mbid }: ${ error.message }`);
       } else {
-        logger.error(`Failed to resolve recording ${ mbid } to album: ${ String(error) }`);
+        logger.error(`Failed to resolve recording ${ mbid }: ${ String(error) }`);
       }
     }
 
@@ -204,14 +189,12 @@ export class MusicBrainzClient {
     const url = `${ MB_BASE_URL }/release-group`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           query:  `artist:"${ artist }" AND type:${ type }`,
           limit,
           fmt:    'json',
         },
-        timeout: 15000,
       });
 
       return response.data['release-groups'] || [];
@@ -236,14 +219,12 @@ export class MusicBrainzClient {
     const url = `${ MB_BASE_URL }/release-group`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           query,
           limit,
           fmt: 'json',
         },
-        timeout: 15000,
       });
 
       const releaseGroups = response.data['release-groups'] || [];
@@ -286,14 +267,12 @@ export class MusicBrainzClient {
     const url = `${ MB_BASE_URL }/recording`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           query,
           limit,
           fmt: 'json',
         },
-        timeout: 15000,
       });
 
       const recordings = response.data.recordings || [];
@@ -342,14 +321,12 @@ export class MusicBrainzClient {
     const url = `${ MB_BASE_URL }/artist`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           query,
           limit,
           fmt: 'json',
         },
-        timeout: 15000,
       });
 
       const artists = response.data.artists || [];
@@ -391,15 +368,13 @@ export class MusicBrainzClient {
     const url = `${ MB_BASE_URL }/release`;
 
     try {
-      const response = await axios.get(url, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const response = await mbHttp.get(url, {
+        params: {
           'release-group': mbid,
           status:          'official',
           limit:           5,
           fmt:             'json',
         },
-        timeout: 15000,
       });
 
       const releases = response.data.releases || [];
@@ -450,14 +425,12 @@ export class MusicBrainzClient {
     const releasesUrl = `${ MB_BASE_URL }/release`;
 
     try {
-      const releasesResponse = await axios.get(releasesUrl, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const releasesResponse = await mbHttp.get(releasesUrl, {
+        params: {
           'release-group': mbid,
           limit:           1,
           fmt:             'json',
         },
-        timeout: 15000,
       });
 
       const releases = releasesResponse.data.releases || [];
@@ -473,13 +446,11 @@ export class MusicBrainzClient {
 
       // Now get the full release with recordings
       const releaseUrl = `${ MB_BASE_URL }/release/${ releaseId }`;
-      const releaseResponse = await axios.get(releaseUrl, {
-        headers: { 'User-Agent': MB_USER_AGENT },
-        params:  {
+      const releaseResponse = await mbHttp.get(releaseUrl, {
+        params: {
           inc: 'recordings',
           fmt: 'json',
         },
-        timeout: 15000,
       });
 
       const media = releaseResponse.data.media || [];
@@ -507,4 +478,132 @@ export class MusicBrainzClient {
   }
 }
 
+/**
+ * Reduce a raw MusicBrainz recording (lookup or search result, often tens of
+ * kB of releases) to the few fields both resolvers read. The release is
+ * picked once: official albums are preferred over singles/EPs/compilations,
+ * falling back to every release, and the earliest dated one wins.
+ *
+ * Lookup and search results list releases in no guaranteed order, and only
+ * lookups include the release-group's first-release-date, so neither the
+ * pick nor the year may depend on list order or that field alone. Without
+ * first-release-date, the year is the earliest date among the recording's
+ * releases in the picked release-group. That equals first-release-date
+ * unless the group's first release does not contain this recording.
+ */
+function summarizeRecording(mbid: string, data: any): RecordingSummary {
+  const summary: RecordingSummary = {
+    mbid,
+    artist: formatArtistCredit(data['artist-credit']),
+    title:  data.title || '',
+  };
+  const releases = data.releases || [];
+
+  if (releases.length === 0) {
+    return summary;
+  }
+
+  const albums = releases.filter((candidate: any) => candidate['release-group']?.['primary-type'] === 'Album');
+  const release = earliestRelease(albums.length > 0 ? albums : releases);
+  const rg = release['release-group'] || {};
+  const groupReleases = rg.id ? releases.filter((candidate: any) => candidate['release-group']?.id === rg.id) : [release];
+
+  // Extract year from first-release-date
+  let year: number | undefined;
+  const releaseDate = rg['first-release-date'] || earliestRelease(groupReleases).date || '';
+
+  if (releaseDate && releaseDate.length >= 4) {
+    const parsedYear = parseInt(releaseDate.substring(0, 4), 10);
+
+    if (!isNaN(parsedYear)) {
+      year = parsedYear;
+    }
+  }
+
+  summary.release = {
+    releaseGroupMbid: rg.id,
+    title:            rg.title || release.title,
+    year,
+  };
+
+  return summary;
+}
+
+/**
+ * Earliest dated release, keeping list order among undated or equal dates.
+ * Dates are ISO prefixes (YYYY, YYYY-MM, YYYY-MM-DD), so they sort as strings.
+ */
+function earliestRelease(releases: any[]): any {
+  return releases.reduce((best, candidate) => {
+    if (candidate.date && (!best.date || candidate.date < best.date)) {
+      return candidate;
+    }
+
+    return best;
+  });
+}
+
+/**
+ * Track-mode view of a recording summary
+ */
+export function toRecordingInfo(summary: RecordingSummary): RecordingInfo | null {
+  if (!summary.artist || !summary.title) {
+    return null;
+  }
+
+  return {
+    artist:           summary.artist,
+    title:            summary.title,
+    mbid:             summary.mbid,
+    releaseGroupMbid: summary.release?.releaseGroupMbid,
+  };
+}
+
+/**
+ * Album-mode view of a recording summary: its parent release-group
+ */
+export function toAlbumInfo(summary: RecordingSummary): AlbumInfo | null {
+  if (!summary.artist) {
+    return null;
+  }
+
+  if (!summary.release) {
+    logger.debug(`Recording ${ summary.mbid } has no releases`);
+
+    return null;
+  }
+
+  const { releaseGroupMbid, title, year } = summary.release;
+
+  if (!releaseGroupMbid || !title) {
+    return null;
+  }
+
+  return {
+    artist:        summary.artist,
+    title,
+    mbid:          releaseGroupMbid,
+    recordingMbid: summary.mbid,
+    trackTitle:    summary.title,
+    year,
+  };
+}
+
+/**
+ * Join the names in a MusicBrainz artist-credit list with ' & '
+ */
+function formatArtistCredit(credits: any[] | undefined): string {
+  return (credits || [])
+    .filter((credit) => credit.artist)
+    .map((credit) => credit.artist.name)
+    .join(' & ');
+}
+
+/**
+ * Sleep helper for rate limiting
+ */
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
 export default MusicBrainzClient;
@@ -6,10 +6,21 @@ import type {
   SlskdEnqueueResult,
 } from '@server/types/slskd-client';
 
+import http from 'http';
+import https from 'https';
 import axios, { AxiosInstance, AxiosError } from 'axios';
 
 import logger from '@server/config/logger';
 
+/**
+ * Keep-alive agents shared by every SlskdClient, so the several calls each
+ * search makes (start, poll, fetch responses, enqueue) reuse pooled
+ * connections instead of opening a new one per request. slskd is commonly
+ * reached over plain http on the LAN, so both protocols are covered.
+ */
+const httpAgent = new http.Agent({ keepAlive: true, maxSockets: 8 });
+const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 8 });
+
 /**
  * Custom error class for slskd API errors that should be surfaced to callers.
  * Auth errors (401/403) are non-retryable and indicate configuration issues.
@@ -52,6 +63,8 @@ export class SlskdClient {
       baseURL: `${ trimmedHost }${ normalizedBase }`,
       headers: { 'X-API-Key': apiKey },
       timeout: 30000,
+      httpAgent,
+      httpsAgent,
     });
   }
 
@@ -156,17 +169,19 @@ export class SlskdClient {
         if (data && typeof data === 'object') {
           const stateValue = (data as { state?: unknown; searchState?: unknown }).state
             ?? (data as { searchState?: unknown }).searchState;
+          const responseCount = (data as { responseCount?: unknown }).responseCount;
+          const counts = typeof responseCount === 'number' ? { responseCount } : {};
 
           const normalized = normalizeState(stateValue);
 
           if (normalized) {
-            return { state: normalized };
+            return { state: normalized, ...counts };
           }
 
           const isComplete = (data as { isComplete?: unknown }).isComplete;
 
           if (isComplete === true) {
-            return { state: 'Completed' };
+            return { state: 'Completed', ...counts };
           }
         }
 
@@ -212,6 +227,27 @@ export class SlskdClient {
     }
   }
 
+  /**
+   * Stop a running search. slskd finishes it and saves the responses
+   * received so far, so they can be fetched once the state is no longer
+   * InProgress. Returns false if the request failed.
+   */
+  async stopSearch(searchId: string): Promise<boolean> {
+    try {
+      await this.client.put(`/api/v0/searches/${ encodeURIComponent(searchId) }`);
+
+      return true;
+    } catch(error) {
+      if (axios.isAxiosError(error)) {
+        logger.warn(`Failed to stop search ${ searchId }: ${ error.message }`);
+      } else {
+        logger.warn(`Failed to stop search ${ searchId }: ${ String(error) }`);
+      }
+
+      return false;
+    }
+  }
+
   /**
    * Delete a search
    */
@@ -0,0 +1,56 @@
+import type { SlskdEnqueueResult, SlskdTransferFile } from '@server/types/slskd-client';
+import type { SlskdClient } from '@server/services/clients/SlskdClient';
+
+import { describe, it, expect, vi } from 'vitest';
+
+import { EnqueueBatcher } from './enqueueBatcher';
+
+function transfer(filename: string): SlskdTransferFile {
+  return { id: `id-${ filename }`, filename } as SlskdTransferFile;
+}
+
+function enqueuedAll(files: { filename: string }[]): SlskdEnqueueResult {
+  return { enqueued: files.map(file => transfer(file.filename)), failed: [] };
+}
+
+describe('EnqueueBatcher', () => {
+  it('combines calls for a user that arrive while a request is in flight', async() => {
+    let releaseFirst: () => void = () => {};
+    const enqueue = vi.fn()
+      .mockImplementationOnce((_username: string, files: { filename: string }[]) => new Promise((resolve) => {
+        releaseFirst = () => resolve(enqueuedAll(files));
+      }))
+      .mockImplementation(async(_username: string, files: { filename: string }[]) => enqueuedAll(files));
+    const batcher = new EnqueueBatcher({ enqueue } as unknown as SlskdClient);
+
+    const first = batcher.enqueue('user', [{ filename: 'a/1.flac' }]);
+    const second = batcher.enqueue('user', [{ filename: 'b/1.flac' }]);
+    const third = batcher.enqueue('user', [{ filename: 'c/1.flac' }, { filename: 'c/2.flac' }]);
+
+    releaseFirst();
+
+    const [firstResult, secondResult, thirdResult] = await Promise.all([first, second, third]);
+
+    expect(enqueue).toHaveBeenCalledTimes(2);
+    expect(enqueue.mock.calls[1][1]).toHaveLength(3);
+    expect(firstResult?.enqueued.map(file => file.filename)).toEqual(['a/1.flac']);
+    expect(secondResult?.enqueued.map(file => file.filename)).toEqual(['b/1.flac']);
+    expect(thirdResult?.enqueued.map(file => file.filename)).toEqual(['c/1.flac', 'c/2.flac']);
+  });
+
+  it('sends different users independently and shares failures within a batch', async() => {
+    const enqueue = vi.fn()
+      .mockResolvedValueOnce(enqueuedAll([{ filename: 'x.mp3' }]))
+      .mockResolvedValueOnce(null);
+    const batcher = new EnqueueBatcher({ enqueue } as unknown as SlskdClient);
+
+    const [ok, failed] = await Promise.all([
+      batcher.enqueue('one', [{ filename: 'x.mp3' }]),
+      batcher.enqueue('two', [{ filename: 'y.mp3' }]),
+    ]);
+
+    expect(enqueue).toHaveBeenCalledTimes(2);
+    expect(ok?.enqueued).toHaveLength(1);
+    expect(failed).toBeNull();
+  });
+});
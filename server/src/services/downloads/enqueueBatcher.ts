@@ -0,0 +1,84 @@
+import type { SlskdEnqueueResult, SlskdFile } from '@server/types/slskd-client';
+import type { SlskdClient } from '@server/services/clients/SlskdClient';
+
+interface PendingEnqueue {
+  files:   SlskdFile[];
+  resolve: (result: SlskdEnqueueResult | null) => void;
+  reject:  (error: unknown) => void;
+}
+
+/**
+ * Narrow a combined enqueue result to the files one caller asked for.
+ */
+function resultFor(result: SlskdEnqueueResult, files: SlskdFile[]): SlskdEnqueueResult {
+  const filenames = new Set(files.map(file => file.filename));
+
+  return {
+    enqueued: result.enqueued.filter(file => filenames.has(file.filename)),
+    failed:   result.failed.filter(file => filenames.has(file.filename)),
+  };
+}
+
+/**
+ * EnqueueBatcher coalesces slskd enqueue calls for the same user.
+ * The first call for a user is sent immediately; calls that arrive while it is
+ * in flight are combined into a single follow-up request, so several albums
+ * from one uploader cost one POST per round trip instead of one each.
+ * Each caller still receives only the enqueued/failed entries for its own files.
+ */
+export class EnqueueBatcher {
+  private readonly slskdClient: SlskdClient;
+  private readonly waiting = new Map<string, PendingEnqueue[]>();
+  private readonly inFlight = new Set<string>();
+
+  constructor(slskdClient: SlskdClient) {
+    this.slskdClient = slskdClient;
+  }
+
+  /**
+   * Enqueue files for download from a user, sharing the request with any
+   * other files queued for the same user in the meantime
+   */
+  enqueue(username: string, files: SlskdFile[]): Promise<SlskdEnqueueResult | null> {
+    return new Promise((resolve, reject) => {
+      const queue = this.waiting.get(username);
+
+      if (queue) {
+        queue.push({ files, resolve, reject });
+      } else {
+        this.waiting.set(username, [{ files, resolve, reject }]);
+      }
+
+      if (!this.inFlight.has(username)) {
+        void this.flush(username);
+      }
+    });
+  }
+
+  private async flush(username: string): Promise<void> {
+    const batch = this.waiting.get(username);
+
+    if (!batch) {
+      return;
+    }
+
+    this.waiting.delete(username);
+    this.inFlight.add(username);
+
+    try {
+      const result = await this.slskdClient.enqueue(username, batch.flatMap(pending => pending.files));
+
+      for (const pending of batch) {
+        pending.resolve(result && (batch.length === 1 ? result : resultFor(result, pending.files)));
+      }
+    } catch(error) {
+      for (const pending of batch) {
+        pending.reject(error);
+      }
+    } finally {
+      this.inFlight.delete(username);
+      // Send whatever arrived for this user while the request was in flight
+      void this.flush(username);
+    }
+  }
+}
@@ -1,21 +1,26 @@
 import type { SlskdFile } from '@server/types/slskd-client';
 
-import path from 'path';
-
 import { MUSIC_EXTENSIONS, MB_TO_BYTES } from '@server/constants/slskd';
+import { slskdPathDirname } from '@server/utils/slskdPaths';
 
 export interface FileSizeConstraints {
   minFileSizeBytes: number;
   maxFileSizeBytes: number;
 }
 
+// One case-insensitive match against all extensions, so the hot per-file check
+// neither slices out nor lowercases the extension. The lookbehind keeps
+// path.extname semantics: a bare ".flac" file name has no extension.
+const MUSIC_FILE_PATTERN = new RegExp(
+  `(?<=[^/])\\.(?:${ Array.from(MUSIC_EXTENSIONS, (ext) => ext.slice(1)).join('|') })$`,
+  'i'
+);
+
 /**
  * Check if a filename has a recognized music extension.
  */
 export function isMusicFile(filename: string): boolean {
-  const ext = path.extname(filename).toLowerCase();
-
-  return MUSIC_EXTENSIONS.includes(ext);
+  return MUSIC_FILE_PATTERN.test(filename);
 }
 
 /**
@@ -57,9 +62,7 @@ export function filterMusicFiles(
     }
 
     if (directory) {
-      const fileDir = path.posix.dirname(f.filename.replace(/\\/g, '/'));
-
-      return fileDir === directory || f.filename.replace(/\\/g, '/').startsWith(directory + '/');
+      return slskdPathDirname(f.filename) === directory || f.filename.replace(/\\/g, '/').startsWith(directory + '/');
     }
 
     return true;
@@ -1,15 +1,29 @@
 import type { SlskdSearchResponse } from '@server/types/slskd-client';
 
+import { LRUCache } from 'lru-cache';
+
 import logger from '@server/config/logger';
 import { cachedSearchResultsSchema } from '@server/types/downloads';
 
+// Validated results per task, keyed by the exact JSON they were parsed from.
+// Viewing, selecting and re-scoring a pending selection re-read the same cached
+// column, so an unchanged payload skips JSON.parse and the schema walk entirely.
+const parsedResults = new LRUCache<string, { json: string; responses: SlskdSearchResponse[] }>({ max: 50 });
+
 /**
  * Parse and validate cached search results JSON.
+ * Callers must treat the returned array as read-only; it may be shared.
  */
 export function parseCachedSearchResults(
   json: string,
   taskId: string
 ): SlskdSearchResponse[] | null {
+  const cached = parsedResults.get(taskId);
+
+  if (cached && cached.json === json) {
+    return cached.responses;
+  }
+
   try {
     const parsed = JSON.parse(json);
     const parseResult = cachedSearchResultsSchema.safeParse(parsed);
@@ -20,7 +34,11 @@ export function parseCachedSearchResults(
       return null;
     }
 
-    return parseResult.data as SlskdSearchResponse[];
+    const responses = parseResult.data as SlskdSearchResponse[];
+
+    parsedResults.set(taskId, { json, responses });
+
+    return responses;
   } catch {
     logger.error(`Failed to parse search results for task ${ taskId }`);
 
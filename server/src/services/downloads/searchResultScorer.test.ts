@@ -0,0 +1,182 @@
+import type { SlskdSearchResponse } from '@server/types/slskd-client';
+import type { QualityPreferences } from '@server/types/slskd';
+
+import { describe, it, expect } from 'vitest';
+
+import { calculateAverageQualityScore } from '@server/utils/audioQuality';
+import { QUALITY_SCORES } from '@server/constants/slskd';
+import {
+  computeMaxScore,
+  resolveScoringParams,
+  scoreCounts,
+  scoreSearchResponses,
+} from './searchResultScorer';
+
+const MB = 1024 * 1024;
+const constraints = { minFileSizeBytes: 1 * MB, maxFileSizeBytes: 500 * MB };
+const unknownQuality = QUALITY_SCORES.unknown;
+
+function params(expectedTrackCount?: number, completenessConfig?: Parameters<typeof resolveScoringParams>[0]['completenessConfig']) {
+  const maxScore = computeMaxScore(undefined, completenessConfig, !!expectedTrackCount);
+
+  return resolveScoringParams({ constraints, expectedTrackCount, completenessConfig }, maxScore);
+}
+
+function response(username: string, filenames: string[], options: Partial<SlskdSearchResponse> = {}): SlskdSearchResponse {
+  return {
+    username,
+    files:             filenames.map((filename) => ({ filename: `${ username }/Album/${ filename }`, size: 10 * MB })),
+    hasFreeUploadSlot: true,
+    uploadSpeed:       200000,
+    ...options,
+  };
+}
+
+function tracks(count: number, ext = 'flac'): string[] {
+  return Array.from({ length: count }, (_, i) => `${ String(i + 1).padStart(2, '0') }.${ ext }`);
+}
+
+describe('scoreCounts', () => {
+  const cases: {
+    name:      string;
+    args:      [number, number, boolean];
+    expected?: number;
+    config?:   Parameters<typeof params>[1];
+    breakdown: { hasSlot: number; fileCountScore: number; uploadSpeedBonus: number; completenessScore: number };
+  }[] = [
+    {
+      name: 'no slot, no speed, unknown track count', args: [10, 0, false], breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 0, completenessScore: 0
+      }
+    },
+    {
+      name: 'free slot', args: [10, 0, true], breakdown: {
+        hasSlot: 100, fileCountScore: 100, uploadSpeedBonus: 0, completenessScore: 0
+      }
+    },
+    {
+      name: 'upload speed bonus', args: [10, 50000, false], breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 5, completenessScore: 0
+      }
+    },
+    {
+      name: 'upload speed bonus is capped', args: [10, 5000000, false], breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 100, completenessScore: 0
+      }
+    },
+    {
+      name: 'file count score is capped without an expected count', args: [30, 0, false], breakdown: {
+        hasSlot: 0, fileCountScore: 200, uploadSpeedBonus: 0, completenessScore: 0
+      }
+    },
+    {
+      name: 'exact track count', args: [10, 0, false], expected: 10, breakdown: {
+        hasSlot: 0, fileCountScore: 200, uploadSpeedBonus: 0, completenessScore: 500
+      }
+    },
+    {
+      name: 'excess tracks decay both scores', args: [15, 0, false], expected: 10, breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 0, completenessScore: 250
+      }
+    },
+    {
+      name: 'excess tracks without the excess penalty', args: [15, 0, false], expected: 10, config: { penalize_excess: false }, breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 0, completenessScore: 500
+      }
+    },
+    {
+      name: 'partial album at the minimum completeness ratio', args: [5, 0, false], expected: 10, breakdown: {
+        hasSlot: 0, fileCountScore: 100, uploadSpeedBonus: 0, completenessScore: 250
+      }
+    },
+    {
+      name: 'partial album below the minimum completeness ratio', args: [4, 0, false], expected: 10, breakdown: {
+        hasSlot: 0, fileCountScore: 80, uploadSpeedBonus: 0, completenessScore: 0
+      }
+    },
+    {
+      name: 'completeness scoring disabled', args: [10, 0, false], expected: 10, config: { enabled: false }, breakdown: {
+        hasSlot: 0, fileCountScore: 200, uploadSpeedBonus: 0, completenessScore: 0
+      }
+    },
+  ];
+
+  for (const {
+    name, args, expected, config, breakdown
+  } of cases) {
+    it(name, () => {
+      const [musicFileCount, uploadSpeed, hasFreeUploadSlot] = args;
+      const result = scoreCounts(musicFileCount, unknownQuality, uploadSpeed, hasFreeUploadSlot, params(expected, config));
+      const total = breakdown.hasSlot + unknownQuality + breakdown.fileCountScore + breakdown.uploadSpeedBonus + breakdown.completenessScore;
+
+      expect(result.scoreBreakdown).toEqual({ ...breakdown, qualityScore: unknownQuality });
+      expect(result.score).toBe(total);
+    });
+  }
+
+  it('reports the completeness ratio only when the track count is known', () => {
+    expect(scoreCounts(15, unknownQuality, 0, false, params(10)).completenessRatio).toBe(1.5);
+    expect(scoreCounts(15, unknownQuality, 0, false, params()).completenessRatio).toBeUndefined();
+  });
+
+  it('reports a zero percentage when there is no maximum score', () => {
+    expect(scoreCounts(10, unknownQuality, 0, false, { ...params(), maxScore: 0 }).scorePercent).toBe(0);
+  });
+});
+
+describe('scoreSearchResponses', () => {
+  it('scores and orders responses by the combined score', () => {
+    const scored = scoreSearchResponses([
+      response('partial', tracks(6)),
+      response('complete', tracks(10)),
+      response('busy', tracks(10), { hasFreeUploadSlot: false }),
+    ], [], { constraints, expectedTrackCount: 10 });
+
+    expect(scored.map((result) => result.response.username)).toEqual(['complete', 'busy', 'partial']);
+
+    // 100 slot + 100 quality + 200 file count + 20 speed + 500 completeness, out of 1000
+    expect(scored[0].score).toBe(920);
+    expect(scored[0].scorePercent).toBe(92);
+    expect(scored[0].musicFileCount).toBe(10);
+    expect(scored[0].totalSize).toBe(100 * MB);
+    expect(scored[0].completenessRatio).toBe(1);
+    expect(scored[1].score).toBe(820);
+  });
+
+  it('counts only music files and drops responses without any', () => {
+    const scored = scoreSearchResponses([
+      response('mixed', [...tracks(3), 'cover.jpg', 'rip.log']),
+      response('art', ['cover.jpg', 'back.png']),
+    ], [], { constraints });
+
+    expect(scored).toHaveLength(1);
+    expect(scored[0].musicFileCount).toBe(3);
+  });
+
+  it('uses the average quality score so FLAC beats MP3 when lossless is preferred', () => {
+    const qualityPreferences: QualityPreferences = {
+      enabled:          true,
+      preferredFormats: ['flac', 'mp3'],
+      minBitrate:       256,
+      preferLossless:   true,
+      rejectLowQuality: false,
+      rejectLossless:   false,
+    };
+    const flac = response('flac', tracks(10));
+    const mp3 = response('mp3', tracks(12, 'mp3'));
+    const scored = scoreSearchResponses([mp3, flac], [], { constraints, qualityPreferences });
+
+    expect(scored[0].response.username).toBe('flac');
+    expect(scored[0].scoreBreakdown.qualityScore).toBe(calculateAverageQualityScore(flac.files, qualityPreferences));
+  });
+
+  it('skips listed users and incomplete responses when completeness is required', () => {
+    const scored = scoreSearchResponses([
+      response('skipped', tracks(10)),
+      response('short', tracks(8)),
+      response('kept', tracks(10)),
+    ], ['skipped'], { constraints, expectedTrackCount: 10, completenessConfig: { require_complete: true } });
+
+    expect(scored.map((result) => result.response.username)).toEqual(['kept']);
+  });
+});
@@ -3,8 +3,6 @@ import type { SlskdSearchResponse, SlskdFile } from '@server/types/slskd-client'
 import type { QualityPreferences } from '@server/types/slskd';
 import type { FileSizeConstraints } from '@server/services/downloads/musicFileFilter';
 
-import path from 'path';
-
 import {
   extractQualityInfo,
   getDominantQualityInfo,
@@ -12,6 +10,7 @@ import {
   shouldRejectFile,
 } from '@server/utils/audioQuality';
 import { filterMusicFiles } from '@server/services/downloads/musicFileFilter';
+import { slskdPathDirname } from '@server/utils/slskdPaths';
 import { QUALITY_SCORES } from '@server/constants/slskd';
 
 export interface ScorerConfig {
@@ -66,92 +65,105 @@ export function computeMaxScore(
  * Group files by directory path.
  */
 export function groupFilesByDirectory(files: SlskdFile[]): DirectoryGroup[] {
-  const directoryMap = new Map<string, SlskdFile[]>();
+  const directoryMap = new Map<string, { files: SlskdFile[]; totalSize: number }>();
 
   for (const file of files) {
-    const dirPath = path.posix.dirname(file.filename.replace(/\\/g, '/'));
-    const existing = directoryMap.get(dirPath) || [];
+    const dirPath = slskdPathDirname(file.filename);
+    let group = directoryMap.get(dirPath);
+
+    if (!group) {
+      group = { files: [], totalSize: 0 };
+      directoryMap.set(dirPath, group);
+    }
 
-    existing.push(file);
-    directoryMap.set(dirPath, existing);
+    group.files.push(file);
+    group.totalSize += file.size || 0;
   }
 
-  return Array.from(directoryMap.entries()).map(([dirPath, dirFiles]) => ({
+  return Array.from(directoryMap, ([dirPath, group]) => ({
     path:        dirPath,
-    files:       dirFiles,
-    totalSize:   dirFiles.reduce((sum, f) => sum + (f.size || 0), 0),
-    qualityInfo: getDominantQualityInfo(dirFiles),
+    files:       group.files,
+    totalSize:   group.totalSize,
+    qualityInfo: getDominantQualityInfo(group.files),
   }));
 }
 
 /**
- * Score a single search response. Returns null if no valid music files.
+ * Scoring settings with every config default applied, resolved once per
+ * scoreSearchResponses call instead of once per response.
  */
-function scoreResponse(
-  response: SlskdSearchResponse,
-  config: ScorerConfig,
-  maxScore: number
-): ScoredSearchResponse | null {
-  const {
-    constraints, qualityPreferences, expectedTrackCount, completenessConfig
-  } = config;
-
-  let musicFiles = filterMusicFiles(response.files, constraints);
+export interface ScoringParams {
+  expectedTrackCount:   number; // 0 when unknown
+  fileCountCap:         number;
+  decayRate:            number;
+  completenessEnabled:  boolean;
+  completenessWeight:   number;
+  minCompletenessRatio: number;
+  penalizeExcess:       boolean;
+  maxScore:             number;
+}
 
-  if (qualityPreferences?.enabled && qualityPreferences.rejectLowQuality) {
-    musicFiles = musicFiles.filter(f => {
-      const qualityInfo = extractQualityInfo(f);
+export function resolveScoringParams(config: ScorerConfig, maxScore: number): ScoringParams {
+  const { expectedTrackCount, completenessConfig } = config;
 
-      return !shouldRejectFile(qualityInfo, qualityPreferences);
-    });
-  }
-
-  if (musicFiles.length === 0) {
-    return null;
-  }
+  return {
+    expectedTrackCount:   expectedTrackCount && expectedTrackCount > 0 ? expectedTrackCount : 0,
+    fileCountCap:         completenessConfig?.file_count_cap ?? 200,
+    decayRate:            completenessConfig?.excess_decay_rate ?? 2.0,
+    completenessEnabled:  completenessConfig?.enabled !== false,
+    completenessWeight:   completenessConfig?.completeness_weight ?? 500,
+    minCompletenessRatio: completenessConfig?.min_completeness_ratio ?? 0.5,
+    penalizeExcess:       completenessConfig?.penalize_excess !== false,
+    maxScore,
+  };
+}
 
-  const qualityScore = qualityPreferences?.enabled? calculateAverageQualityScore(musicFiles, qualityPreferences): QUALITY_SCORES.unknown;
+/**
+ * Scoring kernel: pure arithmetic over a response's counts, with no config
+ * lookups or file access, so every response runs the same numeric path.
+ * Exported so the arithmetic can be tested without building file lists.
+ */
+export function scoreCounts(
+  musicFileCount: number,
+  qualityScore: number,
+  uploadSpeed: number,
+  hasFreeUploadSlot: boolean,
+  params: ScoringParams
+): Pick<ScoredSearchResponse, 'score' | 'scorePercent' | 'scoreBreakdown' | 'completenessRatio'> {
+  const {
+    expectedTrackCount, fileCountCap, decayRate, completenessEnabled, completenessWeight, minCompletenessRatio, penalizeExcess, maxScore
+  } = params;
 
-  const hasSlot = response.hasFreeUploadSlot ? 100 : 0;
-  const fileCountCap = completenessConfig?.file_count_cap ?? 200;
+  const hasSlot = hasFreeUploadSlot ? 100 : 0;
+  const excessRatio = expectedTrackCount > 0 ? (musicFileCount - expectedTrackCount) / expectedTrackCount : 0;
   let fileCountScore: number;
 
-  if (expectedTrackCount && expectedTrackCount > 0) {
-    if (musicFiles.length <= expectedTrackCount) {
-      fileCountScore = fileCountCap * (musicFiles.length / expectedTrackCount);
+  if (expectedTrackCount > 0) {
+    if (musicFileCount <= expectedTrackCount) {
+      fileCountScore = fileCountCap * (musicFileCount / expectedTrackCount);
     } else {
-      const excessRatio = (musicFiles.length - expectedTrackCount) / expectedTrackCount;
-      const decayRate = completenessConfig?.excess_decay_rate ?? 2.0;
-
       fileCountScore = fileCountCap / (1 + decayRate * excessRatio);
     }
   } else {
-    fileCountScore = Math.min(musicFiles.length * 10, fileCountCap);
+    fileCountScore = Math.min(musicFileCount * 10, fileCountCap);
   }
 
-  const uploadSpeedBonus = Math.min(response.uploadSpeed || 0, 1000000) / 10000;
+  const uploadSpeedBonus = Math.min(uploadSpeed, 1000000) / 10000;
 
   let completenessScore = 0;
   let completenessRatio: number | undefined;
 
-  if (expectedTrackCount && expectedTrackCount > 0 && completenessConfig?.enabled !== false) {
-    completenessRatio = musicFiles.length / expectedTrackCount;
-    const weight = completenessConfig?.completeness_weight ?? 500;
-    const minRatio = completenessConfig?.min_completeness_ratio ?? 0.5;
+  if (expectedTrackCount > 0 && completenessEnabled) {
+    completenessRatio = musicFileCount / expectedTrackCount;
 
     if (completenessRatio >= 1.0) {
-      const penalizeExcess = completenessConfig?.penalize_excess !== false;
-
       if (penalizeExcess && completenessRatio > 1.0) {
-        const excessRatio = (musicFiles.length - expectedTrackCount) / expectedTrackCount;
-        const decayRate = completenessConfig?.excess_decay_rate ?? 2.0;
-
-        completenessScore = weight / (1 + decayRate * excessRatio);
+        completenessScore = completenessWeight / (1 + decayRate * excessRatio);
       } else {
-        completenessScore = weight;
+        completenessScore = completenessWeight;
       }
-    } else if (completenessRatio >= minRatio) {
-      completenessScore = weight * completenessRatio;
+    } else if (completenessRatio >= minCompletenessRatio) {
+      completenessScore = completenessWeight * completenessRatio;
     }
   }
 
@@ -159,12 +171,49 @@ function scoreResponse(
   const scorePercent = maxScore > 0 ? Math.round((score / maxScore) * 100) : 0;
 
   return {
-    response,
     score,
     scorePercent,
     scoreBreakdown: {
       hasSlot, qualityScore, fileCountScore, uploadSpeedBonus, completenessScore
     },
+    completenessRatio,
+  };
+}
+
+/**
+ * Score a single search response. Returns null if no valid music files.
+ */
+function scoreResponse(
+  response: SlskdSearchResponse,
+  config: ScorerConfig,
+  params: ScoringParams
+): ScoredSearchResponse | null {
+  const { constraints, qualityPreferences, expectedTrackCount } = config;
+
+  let musicFiles = filterMusicFiles(response.files, constraints);
+
+  if (qualityPreferences?.enabled && qualityPreferences.rejectLowQuality) {
+    musicFiles = musicFiles.filter(f => {
+      const qualityInfo = extractQualityInfo(f);
+
+      return !shouldRejectFile(qualityInfo, qualityPreferences);
+    });
+  }
+
+  if (musicFiles.length === 0) {
+    return null;
+  }
+
+  const qualityScore = qualityPreferences?.enabled? calculateAverageQualityScore(musicFiles, qualityPreferences): QUALITY_SCORES.unknown;
+  const {
+    score, scorePercent, scoreBreakdown, completenessRatio
+  } = scoreCounts(musicFiles.length, qualityScore, response.uploadSpeed || 0, !!response.hasFreeUploadSlot, params);
+
+  return {
+    response,
+    score,
+    scorePercent,
+    scoreBreakdown,
     musicFileCount: musicFiles.length,
     totalSize:      musicFiles.reduce((sum, f) => sum + (f.size || 0), 0),
     qualityInfo:    getDominantQualityInfo(musicFiles),
@@ -186,8 +235,10 @@ export function scoreSearchResponses(
   const hasExpectedTrackCount = !!(expectedTrackCount && expectedTrackCount > 0);
   const maxScore = computeMaxScore(qualityPreferences, completenessConfig, hasExpectedTrackCount);
 
-  const filteredUsers = responses.filter(response => !skippedUsernames.includes(response.username));
-  const responseScores = filteredUsers.map(response => scoreResponse(response, config, maxScore));
+  const skipped = new Set(skippedUsernames);
+  const filteredUsers = responses.filter(response => !skipped.has(response.username));
+  const params = resolveScoringParams(config, maxScore);
+  const responseScores = filteredUsers.map(response => scoreResponse(response, config, params));
   const filteredScores = responseScores.filter((scored): scored is ScoredSearchResponse => {
     if (!scored) {
       return false;
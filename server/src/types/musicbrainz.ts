@@ -28,6 +28,22 @@ export interface AlbumInfo {
   year?:         number;
 }
 
+/**
+ * Compact projection of a MusicBrainz recording: just what track mode
+ * (RecordingInfo) and album mode (AlbumInfo) need, with the preferred
+ * release already picked
+ */
+export interface RecordingSummary {
+  mbid:     string;
+  artist:   string;
+  title:    string;
+  release?: {
+    releaseGroupMbid?: string;
+    title?:            string;
+    year?:             number;
+  };
+}
+
 /**
  * MusicBrainz release group (raw API shape)
  */
@@ -35,7 +35,8 @@ export interface SlskdSearchResult {
  * Search state from slskd
  */
 export interface SlskdSearchState {
-  state: 'InProgress' | 'Completed' | 'Cancelled';
+  state:          'InProgress' | 'Completed' | 'Cancelled';
+  responseCount?: number; // Responses received so far, when the endpoint reports it
 }
 
 /**
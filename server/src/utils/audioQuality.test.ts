@@ -174,6 +174,13 @@ describe('audioQuality utilities', () => {
         tier:       'unknown',
       });
     });
+
+    it('reuses the extracted info for the same file object', () => {
+      const file: SlskdFile = { filename: 'track.flac', bitRate: 1411 };
+
+      expect(extractQualityInfo(file)).toBe(extractQualityInfo(file));
+      expect(extractQualityInfo({ ...file })).not.toBe(extractQualityInfo(file));
+    });
   });
 
   describe('calculateQualityScore', () => {
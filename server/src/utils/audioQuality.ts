@@ -47,7 +47,7 @@ export function detectFormat(filename: string): AudioFormat {
 export function isLosslessFormat(format: AudioFormat): boolean {
   const ext = `.${ format }`;
 
-  return LOSSLESS_FORMATS.includes(ext);
+  return LOSSLESS_FORMATS.has(ext);
 }
 
 /**
@@ -85,23 +85,38 @@ export function determineQualityTier(
   return 'low';
 }
 
+// Search response files are read-only once fetched, and the same file is inspected
+// several times while scoring (rejection, average score, dominant quality per
+// response and per directory), so derive its quality info once per object
+const qualityInfoCache = new WeakMap<SlskdFile, QualityInfo>();
+
 /**
- * Extract quality information from a slskd file
+ * Extract quality information from a slskd file.
+ * The result is cached per file object and must not be mutated.
  */
 export function extractQualityInfo(file: SlskdFile): QualityInfo {
+  const cached = qualityInfoCache.get(file);
+
+  if (cached) {
+    return cached;
+  }
+
   const format = detectFormat(file.filename);
   const bitRate = file.bitRate ?? null;
   const bitDepth = file.bitDepth ?? null;
   const sampleRate = file.sampleRate ?? null;
   const tier = determineQualityTier(format, bitRate, bitDepth);
-
-  return {
+  const info: QualityInfo = {
     format,
     bitRate,
     bitDepth,
     sampleRate,
     tier,
   };
+
+  qualityInfoCache.set(file, info);
+
+  return info;
 }
 
 /**
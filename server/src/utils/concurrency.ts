@@ -0,0 +1,26 @@
+/**
+ * Map over items with at most `limit` calls in flight at once.
+ * Results keep the order of the input.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  async function worker(): Promise<void> {
+    while (next < items.length) {
+      const index = next++;
+
+      results[index] = await fn(items[index], index);
+    }
+  }
+
+  const workerCount = Math.min(Math.max(limit, 1), items.length);
+
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+
+  return results;
+}
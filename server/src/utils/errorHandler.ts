@@ -15,6 +15,16 @@ export class DatabaseBusyError extends Error {
   }
 }
 
+/**
+ * Thrown by a job when it stops early because it was cancelled.
+ */
+export class JobCancelledError extends Error {
+  constructor(message = 'Job cancelled') {
+    super(message);
+    this.name = 'JobCancelledError';
+  }
+}
+
 /**
  * Check if an error is a SQLite busy/locked error.
  *
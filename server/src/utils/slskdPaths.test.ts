@@ -0,0 +1,48 @@
+import path from 'path';
+
+import { describe, it, expect } from 'vitest';
+
+import { slskdPathDirname } from './slskdPaths';
+
+describe('slskdPathDirname', () => {
+  it('returns the directory of slskd filenames with either separator', () => {
+    expect(slskdPathDirname('@@user\\Music\\Artist\\Album\\01 - Track.flac')).toBe('@@user/Music/Artist/Album');
+    expect(slskdPathDirname('Music/Artist/Album/01 - Track.flac')).toBe('Music/Artist/Album');
+    expect(slskdPathDirname('Music\\Artist/Album\\01.mp3')).toBe('Music/Artist/Album');
+  });
+
+  it('handles names without a directory and names at the root', () => {
+    expect(slskdPathDirname('track.flac')).toBe('.');
+    expect(slskdPathDirname('')).toBe('.');
+    expect(slskdPathDirname('/track.flac')).toBe('/');
+    expect(slskdPathDirname('\\track.flac')).toBe('/');
+    expect(slskdPathDirname('/')).toBe('/');
+  });
+
+  it('ignores trailing separators', () => {
+    expect(slskdPathDirname('Music/Artist/Album/')).toBe('Music/Artist');
+    expect(slskdPathDirname('Music\\Artist\\Album\\\\')).toBe('Music/Artist');
+    expect(slskdPathDirname('Album/')).toBe('.');
+  });
+
+  it('matches path.posix.dirname on the normalized filename', () => {
+    const filenames = [
+      'a/b/c.flac',
+      'a\\b\\c.flac',
+      'a//b',
+      'a/b/',
+      'a\\b\\\\',
+      '/a/b',
+      '\\a',
+      '//server/share/file.flac',
+      '\\\\server\\share\\file.flac',
+      'a',
+      '/',
+      '',
+    ];
+
+    for (const filename of filenames) {
+      expect(slskdPathDirname(filename)).toBe(path.posix.dirname(filename.replace(/\\/g, '/')));
+    }
+  });
+});
@@ -14,6 +14,38 @@ export function normalizeBasePath(value: string): string {
   return value.replace(/\\/g, '/').replace(/\/+$/, '');
 }
 
+function isSlskdPathSeparator(code: number): boolean {
+  return code === 47 || code === 92; // '/' or '\\'
+}
+
+// Same result as path.posix.dirname on the '/'-normalized filename (trailing
+// separators are ignored), without rewriting the whole string first: only the
+// directory prefix is normalized. The one difference is a name directly under
+// a leading '//', which gives '/' rather than '//'.
+export function slskdPathDirname(filename: string): string {
+  let end = filename.length - 1;
+
+  while (end > 0 && isSlskdPathSeparator(filename.charCodeAt(end))) {
+    end--;
+  }
+
+  let index = end;
+
+  while (index >= 0 && !isSlskdPathSeparator(filename.charCodeAt(index))) {
+    index--;
+  }
+
+  if (index < 0) {
+    return '.';
+  }
+
+  if (index === 0) {
+    return '/';
+  }
+
+  return filename.slice(0, index).replace(/\\/g, '/');
+}
+
 export function toSafeRelativePath(value: string | null | undefined): string | null {
   const normalized = normalizeSlskdPath(value);
 